@@ -0,0 +1,7 @@
+"""
+Omega Core – Benchmarks
+
+Throughput measurements for kernel hot paths.
+Not part of the canonical kernel; run as modules, e.g.
+python -m omega_core.benchmarks.transitions
+"""
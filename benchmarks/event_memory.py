@@ -0,0 +1,46 @@
+"""
+Memory per governance event: InMemoryEventStore vs ColumnarEventStore.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.event_store import ColumnarEventStore, InMemoryEventStore
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.tests.lifecycle import LIFECYCLE
+
+from .transitions import _specs
+
+
+def _measure(store_factory, sessions: int) -> float:
+    # One archive-style store holding every session's events; the state
+    # machines are dropped, so only the store's footprint remains.
+    clock = DeterministicClock("bench_memory")
+    gc.collect()
+    tracemalloc.start()
+    store = store_factory()
+    for session in range(sessions):
+        sm = GovernanceStateMachine(clock)
+        sm.transition_many(_specs(session))
+        store.extend(sm.events)
+        del sm
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(store) == sessions * len(LIFECYCLE)
+    return used / len(store)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5000)
+    args = parser.parse_args()
+
+    for name, factory in [("list", InMemoryEventStore), ("columnar", ColumnarEventStore)]:
+        print(f"{name:>8}: {_measure(factory, args.sessions):8.0f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Replay throughput: events/sec re-derived by ReplayEngine.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.replay import replay_events
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.tests.lifecycle import LIFECYCLE
+
+from .transitions import _specs
+
+
+def _write_sessions(directory: str, sessions: int) -> list:
+    clock = DeterministicClock("bench_replay")
+    paths = []
+    for session in range(sessions):
+        sm = GovernanceStateMachine(clock)
+        sm.transition_many(_specs(session))
+        path = os.path.join(directory, f"session_{session:06d}.jsonl")
+        with open(path, "w") as f:
+            for event in sm.events:
+                f.write(json.dumps(event.to_dict()) + "\n")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_sessions(directory, args.sessions)
+
+        start = time.perf_counter()
+        replayed = sum(replay_events(path).event_count for path in paths)
+        elapsed = time.perf_counter() - start
+
+    assert replayed == args.sessions * len(LIFECYCLE)
+    print(f"replay: {replayed / elapsed:12.0f} events/s ({replayed} events, {elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Single-call transition() versus batched transition_many() throughput.
+"""
+
+import argparse
+import time
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.tests.lifecycle import LIFECYCLE, lifecycle_specs
+
+
+def _specs(session: int):
+    return lifecycle_specs(actor="bench", payload={"session": session})
+
+
+def bench_single(sessions: int) -> float:
+    clock = DeterministicClock("bench_single")
+    batches = [_specs(s) for s in range(sessions)]
+    start = time.perf_counter()
+    for specs in batches:
+        sm = GovernanceStateMachine(clock)
+        for spec in specs:
+            sm.transition(
+                event_type=spec.event_type,
+                tick=spec.tick,
+                payload=spec.payload,
+                actor=spec.actor,
+                target_state=spec.target_state,
+            )
+    return time.perf_counter() - start
+
+
+def bench_batched(sessions: int) -> float:
+    clock = DeterministicClock("bench_batched")
+    batches = [_specs(s) for s in range(sessions)]
+    start = time.perf_counter()
+    for specs in batches:
+        GovernanceStateMachine(clock).transition_many(specs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5000)
+    args = parser.parse_args()
+
+    events = args.sessions * len(LIFECYCLE)
+    for name, bench in (("transition", bench_single), ("transition_many", bench_batched)):
+        elapsed = bench(args.sessions)
+        print(f"{name:>16}: {events / elapsed:12.0f} events/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
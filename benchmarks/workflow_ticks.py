@@ -0,0 +1,45 @@
+"""
+Per-tick cost of WorkflowEngine.advance as open workflows grow.
+"""
+
+import argparse
+import time
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.workflows.engine import WorkflowEngine
+from omega_core.workflows.fleet_accountability import create_fleet_accountability_workflow
+
+from .transitions import _specs
+
+
+def _time_per_tick(workflows: int, ticks: int) -> float:
+    sm = GovernanceStateMachine(DeterministicClock("bench_workflows"))
+    sm.transition_many(_specs(0)[:3])
+    engine = WorkflowEngine(sm)
+    for i in range(workflows):
+        # Deadlines past the measured window, so advance only moves the wheel.
+        engine.open(
+            create_fleet_accountability_workflow(
+                tick=0, event_hash=sm.last_event_hash, ack_deadline_ticks=ticks + 1 + i,
+            ),
+            workflow_id=f"wf_{i}",
+        )
+    start = time.perf_counter()
+    for tick in range(1, ticks + 1):
+        engine.advance(tick)
+    return (time.perf_counter() - start) / ticks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=20000)
+    args = parser.parse_args()
+
+    for workflows in (10, 1000, 10000):
+        micros = _time_per_tick(workflows, args.ticks) * 1e6
+        print(f"{workflows:>6} open workflows: {micros:6.2f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,325 @@
 """
 Deterministic canonicalization for hashing.
 Unknown types fail closed.
+
+Canonical forms are dispatched by concrete type. Each type is resolved once
+(following the precedence below) and cached; dataclasses get a precompiled
+field-order layout instead of dataclasses.asdict() deep copies.
+
+Precedence: float, dict, list/tuple, set, Enum, dataclass, to_dict(),
+bytes, datetime, None/str/int/bool.
 """
 
 import dataclasses
+import json
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .constants import CANON_FLOAT_DIGITS
 
 
+# type -> canonical form producer (used by canonicalize_for_hash)
+_CANONICALIZERS: Dict[type, Callable[[Any], Any]] = {}
+
+# type -> streaming writer (used by CanonicalEncoder)
+_ENCODERS: Dict[type, Callable[["CanonicalEncoder", Any], None]] = {}
+
+# dataclass type -> (sorted field names, precompiled key fragments)
+_FIELD_LAYOUTS: Dict[type, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
 def canonicalize_for_hash(obj: Any) -> Any:
-    if isinstance(obj, float):
-        return round(obj, CANON_FLOAT_DIGITS)
+    canonicalizer = _CANONICALIZERS.get(type(obj))
+    if canonicalizer is None:
+        canonicalizer = _resolve(type(obj))[0]
+    return canonicalizer(obj)
 
-    if isinstance(obj, dict):
-        return {k: canonicalize_for_hash(v) for k in sorted(obj.keys())}
 
-    if isinstance(obj, (list, tuple)):
-        return [canonicalize_for_hash(v) for v in obj]
+# ---- registration API ----
 
-    if isinstance(obj, set):
-        return sorted(canonicalize_for_hash(v) for v in obj)
+def register_canonical_fields(cls: type) -> type:
+    """
+    Register a dataclass with a precompiled field-order canonical form.
+    Usable as a class decorator.
+    """
+    if not (dataclasses.is_dataclass(cls) and isinstance(cls, type)):
+        raise TypeError(f"{cls!r} is not a dataclass type")
 
-    if isinstance(obj, Enum):
-        return obj.value
+    names = tuple(sorted(f.name for f in dataclasses.fields(cls)))
+    fragments = tuple(
+        ("{" if i == 0 else ",") + encode_basestring_ascii(name) + ":"
+        for i, name in enumerate(names)
+    )
+    _FIELD_LAYOUTS[cls] = (names, fragments)
+    _CANONICALIZERS[cls] = _canonicalize_fields
+    _ENCODERS[cls] = _encode_fields
+    return cls
 
-    if dataclasses.is_dataclass(obj):
-        return canonicalize_for_hash(dataclasses.asdict(obj))
 
+def register_canonicalizer(cls: type, to_canonical: Callable[[Any], Any]) -> type:
+    """
+    Register an explicit conversion for cls. to_canonical(obj) must return
+    a value that is itself canonicalizable (typically a dict).
+    """
+    _CANONICALIZERS[cls] = lambda obj: canonicalize_for_hash(to_canonical(obj))
+    _ENCODERS[cls] = lambda enc, obj: enc._encode(to_canonical(obj))
+    return cls
+
+
+def _resolve(tp: type) -> Tuple[Callable, Callable]:
+    canonicalizer: Optional[Callable] = None
+    encoder: Optional[Callable] = None
+
+    if issubclass(tp, float):
+        canonicalizer, encoder = _canonicalize_float, _encode_float
+    elif issubclass(tp, dict):
+        canonicalizer, encoder = _canonicalize_dict, _encode_dict
+    elif issubclass(tp, (list, tuple)):
+        canonicalizer, encoder = _canonicalize_sequence, _encode_sequence
+    elif issubclass(tp, set):
+        canonicalizer, encoder = _canonicalize_set, _encode_set
+    elif issubclass(tp, Enum):
+        canonicalizer, encoder = _canonicalize_enum, _encode_enum
+    elif dataclasses.is_dataclass(tp):
+        register_canonical_fields(tp)
+        return _CANONICALIZERS[tp], _ENCODERS[tp]
+    elif hasattr(tp, "to_dict"):
+        canonicalizer, encoder = _canonicalize_to_dict, _encode_to_dict
+    elif issubclass(tp, bytes):
+        canonicalizer, encoder = _canonicalize_bytes, _encode_bytes
+    elif issubclass(tp, datetime):
+        canonicalizer, encoder = _canonicalize_datetime, _encode_datetime
+    elif tp is type(None) or issubclass(tp, (str, int)):
+        canonicalizer, encoder = _canonicalize_scalar, _encode_scalar
+
+    if canonicalizer is None:
+        # Not cached: instances may still carry their own to_dict().
+        return _canonicalize_unknown, _encode_unknown
+
+    _CANONICALIZERS[tp] = canonicalizer
+    _ENCODERS[tp] = encoder
+    return canonicalizer, encoder
+
+
+def _unknown_type_error(obj: Any) -> TypeError:
+    return TypeError(
+        f"Cannot canonicalize type {type(obj)} — explicit to_dict() required"
+    )
+
+
+# ---- canonical form producers ----
+
+def _canonicalize_float(obj: float) -> float:
+    return round(obj, CANON_FLOAT_DIGITS)
+
+
+def _canonicalize_dict(obj: dict) -> dict:
+    return {k: canonicalize_for_hash(obj[k]) for k in sorted(obj.keys())}
+
+
+def _canonicalize_sequence(obj: Any) -> list:
+    return [canonicalize_for_hash(v) for v in obj]
+
+
+def _canonicalize_set(obj: set) -> list:
+    return sorted(canonicalize_for_hash(v) for v in obj)
+
+
+def _canonicalize_enum(obj: Enum) -> Any:
+    return obj.value
+
+
+def _canonicalize_fields(obj: Any) -> dict:
+    names = _FIELD_LAYOUTS[type(obj)][0]
+    return {name: canonicalize_for_hash(getattr(obj, name)) for name in names}
+
+
+def _canonicalize_to_dict(obj: Any) -> Any:
+    return canonicalize_for_hash(obj.to_dict())
+
+
+def _canonicalize_bytes(obj: bytes) -> str:
+    return obj.hex()
+
+
+def _canonicalize_datetime(obj: datetime) -> str:
+    return obj.isoformat()
+
+
+def _canonicalize_scalar(obj: Any) -> Any:
+    return obj
+
+
+def _canonicalize_unknown(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj):
+        raise TypeError("asdict() should be called on dataclass instances")
     if hasattr(obj, "to_dict"):
         return canonicalize_for_hash(obj.to_dict())
+    raise _unknown_type_error(obj)
 
-    if isinstance(obj, bytes):
-        return obj.hex()
 
-    if isinstance(obj, datetime):
-        return obj.isoformat()
+# ---- single-pass canonical encoder ----
 
-    if obj is None or isinstance(obj, (str, int, bool)):
-        return obj
+# Number of buffered fragments before the encoder flushes to its sink.
+_FLUSH_PARTS = 4096
 
+
+def _plain_json(obj: Any) -> str:
+    # Values canonicalize_for_hash passes through untouched (Enum values,
+    # sorted sets) are serialized exactly as json.dumps would.
+    return json.dumps(
+        obj,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    )
+
+
+def _float_repr(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_repr(key: Any) -> str:
+    # Mirrors json's coercion of non-string dict keys.
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, float):
+        return '"' + _float_repr(key) + '"'
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
     raise TypeError(
-        f"Cannot canonicalize type {type(obj)} — explicit to_dict() required"
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
     )
+
+
+class CanonicalEncoder:
+    """
+    Single-pass canonical encoder.
+
+    Walks an object once and streams canonical JSON into a sink exposing
+    update(bytes) (e.g. hashlib.sha256()). No intermediate canonical tree
+    and no full JSON string is built.
+
+    Output is byte-identical to:
+        json.dumps(canonicalize_for_hash(obj), sort_keys=True,
+                   separators=(",", ":"), ensure_ascii=True)
+    """
+
+    def __init__(self, sink: Any, flush_parts: int = _FLUSH_PARTS):
+        self._sink = sink
+        self._parts: list[str] = []
+        self._flush_parts = flush_parts
+
+    def encode(self, obj: Any) -> None:
+        self._encode(obj)
+        self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self._sink.update("".join(self._parts).encode("ascii"))
+            self._parts.clear()
+
+    def _write(self, fragment: str) -> None:
+        self._parts.append(fragment)
+        if len(self._parts) >= self._flush_parts:
+            self.flush()
+
+    def _encode(self, obj: Any) -> None:
+        encoder = _ENCODERS.get(type(obj))
+        if encoder is None:
+            encoder = _resolve(type(obj))[1]
+        encoder(self, obj)
+
+
+def _encode_float(enc: CanonicalEncoder, obj: float) -> None:
+    enc._write(_float_repr(round(obj, CANON_FLOAT_DIGITS)))
+
+
+def _encode_dict(enc: CanonicalEncoder, obj: dict) -> None:
+    write = enc._write
+    sep = "{"
+    for k in sorted(obj.keys()):
+        write(sep + _key_repr(k) + ":")
+        enc._encode(obj[k])
+        sep = ","
+    write("{}" if sep == "{" else "}")
+
+
+def _encode_sequence(enc: CanonicalEncoder, obj: Any) -> None:
+    write = enc._write
+    sep = "["
+    for v in obj:
+        write(sep)
+        enc._encode(v)
+        sep = ","
+    write("[]" if sep == "[" else "]")
+
+
+def _encode_set(enc: CanonicalEncoder, obj: set) -> None:
+    enc._write(_plain_json(_canonicalize_set(obj)))
+
+
+def _encode_enum(enc: CanonicalEncoder, obj: Enum) -> None:
+    value = obj.value
+    enc._write(
+        encode_basestring_ascii(value)
+        if isinstance(value, str)
+        else _plain_json(value)
+    )
+
+
+def _encode_fields(enc: CanonicalEncoder, obj: Any) -> None:
+    names, fragments = _FIELD_LAYOUTS[type(obj)]
+    write = enc._write
+    for name, fragment in zip(names, fragments):
+        write(fragment)
+        enc._encode(getattr(obj, name))
+    write("}" if names else "{}")
+
+
+def _encode_to_dict(enc: CanonicalEncoder, obj: Any) -> None:
+    enc._encode(obj.to_dict())
+
+
+def _encode_bytes(enc: CanonicalEncoder, obj: bytes) -> None:
+    enc._write('"' + obj.hex() + '"')
+
+
+def _encode_datetime(enc: CanonicalEncoder, obj: datetime) -> None:
+    enc._write(encode_basestring_ascii(obj.isoformat()))
+
+
+def _encode_scalar(enc: CanonicalEncoder, obj: Any) -> None:
+    if obj is None:
+        enc._write("null")
+    elif obj is True:
+        enc._write("true")
+    elif obj is False:
+        enc._write("false")
+    elif isinstance(obj, str):
+        enc._write(encode_basestring_ascii(obj))
+    else:
+        enc._write(int.__repr__(obj))
+
+
+def _encode_unknown(enc: CanonicalEncoder, obj: Any) -> None:
+    if dataclasses.is_dataclass(obj):
+        raise TypeError("asdict() should be called on dataclass instances")
+    if hasattr(obj, "to_dict"):
+        enc._encode(obj.to_dict())
+        return
+    raise _unknown_type_error(obj)
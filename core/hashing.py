@@ -2,30 +2,52 @@
 Deterministic hashing with domain separation.
 """
 
-import json
 import hashlib
-from typing import Any, Optional
+import json
+from typing import Any, List, Optional
 
-from .canonical import canonicalize_for_hash
+from .canonical import CanonicalEncoder
 
 
-def deterministic_json_bytes(obj: Any) -> bytes:
-    canonical = canonicalize_for_hash(obj)
-    return json.dumps(
-        canonical,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=True,
-    ).encode("utf-8")
+class _ByteSink:
+    def __init__(self):
+        self.chunks: List[bytes] = []
 
+    def update(self, data: bytes) -> None:
+        self.chunks.append(data)
 
-def deterministic_hash(obj: Any, domain_separator: Optional[str] = None) -> str:
+
+def _domain_wrap(obj: Any, domain_separator: Optional[str]) -> Any:
     if domain_separator:
-        obj = {
+        return {
             "__type__": domain_separator,
             "__data__": obj,
         }
+    return obj
+
+
+def deterministic_json_bytes(obj: Any) -> bytes:
+    sink = _ByteSink()
+    CanonicalEncoder(sink).encode(obj)
+    return b"".join(sink.chunks)
+
+
+def deterministic_hash(obj: Any, domain_separator: Optional[str] = None) -> str:
+    sha = hashlib.sha256()
+    CanonicalEncoder(sha).encode(_domain_wrap(obj, domain_separator))
+    return sha.hexdigest()
+
 
-    return hashlib.sha256(
-        deterministic_json_bytes(obj)
-    ).hexdigest()
+def hash_canonical_bytes(raw: bytes, domain_separator: Optional[str] = None) -> str:
+    """
+    deterministic_hash for an object given as its canonical JSON bytes
+    (deterministic_json_bytes), without decoding it.
+    """
+    sha = hashlib.sha256()
+    if not domain_separator:
+        sha.update(raw)
+        return sha.hexdigest()
+    sha.update(b'{"__data__":')
+    sha.update(raw)
+    sha.update(b',"__type__":' + json.dumps(domain_separator).encode("ascii") + b"}")
+    return sha.hexdigest()
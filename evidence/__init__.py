@@ -8,4 +8,7 @@ canonical artifacts live in a capsule under deterministic refs.
 from .enums import *
 from .models import *
 from .verifier import *
+from .capsule_store import *
+from .record_stream import *
+from .verification_cache import *
 from .negative_authority import *
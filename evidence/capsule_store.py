@@ -0,0 +1,305 @@
+"""
+On-disk capsule stores with lazy, memory-mapped artifact access.
+
+Artifacts are stored as canonical JSON bytes (deterministic_json_bytes),
+each addressed by the SHA-256 of those bytes. Stores are read-only
+Mappings: a lookup maps and decodes only the requested artifact, so
+ProofVerifier touches nothing it does not verify.
+
+Two layouts:
+- PackedCapsuleStore: one file, artifacts back to back plus an offset index
+- DirectoryCapsuleStore: content-addressed objects/<digest> files plus refs.json
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from omega_core.core.canonical import CanonicalEncoder
+from omega_core.core.exceptions import EvidenceVerificationError
+from omega_core.core.hashing import deterministic_hash, hash_canonical_bytes
+
+
+PACKED_MAGIC = b"OMEGACAP1\n"
+PACKED_TRAILER_MAGIC = b"OMEGAEND"
+_TRAILER = struct.Struct("<QQ8s")
+
+REFS_FILE = "refs.json"
+OBJECTS_DIR = "objects"
+
+
+class _HashingWriter:
+    """CanonicalEncoder sink that writes and hashes in one pass."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha = hashlib.sha256()
+        self.length = 0
+
+    def update(self, data: bytes) -> None:
+        self.f.write(data)
+        self.sha.update(data)
+        self.length += len(data)
+
+
+class CapsuleStore(Mapping, ABC):
+    """
+    Read-only capsule: ref -> decoded artifact, decoded on access.
+    raw(ref) exposes the canonical bytes without decoding.
+    """
+
+    @abstractmethod
+    def raw(self, ref: str) -> memoryview:
+        """Canonical bytes of the artifact at ref."""
+
+    @abstractmethod
+    def artifact_digest(self, ref: str) -> str:
+        """Digest recorded at write time; not re-derived, so never trust it."""
+
+    def artifact_identity(self, ref: str) -> Optional[Hashable]:
+        """
+        Cheap identity of the bytes raw(ref) returns, for cache keys; None
+        if the store has none. See file_identity.
+        """
+        return None
+
+    def __getitem__(self, ref: str) -> Any:
+        return json.loads(self.raw(ref).tobytes())
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "CapsuleStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+FileIdentity = Tuple[int, int, int, int, int]
+
+
+def file_identity(path_or_fd: Any) -> FileIdentity:
+    """
+    (device, inode, size, mtime_ns, ctime_ns) of a file. Any write or
+    replacement changes it, so it keys cached results for the file's
+    bytes without reading them. Like any stat-based check it trusts the
+    file system's timestamps.
+    """
+    st = os.fstat(path_or_fd) if isinstance(path_or_fd, int) else os.stat(path_or_fd)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _map_file(path: str) -> Tuple[mmap.mmap, FileIdentity]:
+    # Identity is taken before mapping, so it never describes newer
+    # bytes than the map holds.
+    with open(path, "rb") as f:
+        identity = file_identity(f.fileno())
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), identity
+
+
+def hash_capsule_artifact(
+    capsule: Mapping[str, Any],
+    evidence_ref: str,
+    domain_separator: str,
+) -> str:
+    """
+    Default artifact hasher: hashes a CapsuleStore's canonical bytes
+    directly, or encodes a plain capsule's artifact.
+    """
+    raw = getattr(capsule, "raw", None)
+    if raw is None:
+        return deterministic_hash(capsule[evidence_ref], domain_separator)
+    return hash_canonical_bytes(raw(evidence_ref), domain_separator)
+
+
+def capsule_artifact_identity(
+    capsule: Mapping[str, Any],
+    evidence_ref: str,
+) -> Optional[Hashable]:
+    """
+    Cheap identity of an artifact's bytes for verification cache keys:
+    a store's artifact_identity, or a file-backed artifact's (e.g.
+    RecordLog). Never a recorded digest. None for in-memory artifacts,
+    which are mutable and would cost a full encode to key; those are
+    always re-hashed.
+    """
+    artifact_identity = getattr(capsule, "artifact_identity", None)
+    if artifact_identity is None:
+        artifact_identity = getattr(capsule[evidence_ref], "artifact_identity", None)
+        if artifact_identity is None:
+            return None
+        return artifact_identity()
+    return artifact_identity(evidence_ref)
+
+
+# ---- packed single-file layout ----
+
+def write_packed_capsule(path: str, capsule: Mapping) -> None:
+    """
+    Layout: magic | artifact bytes ... | index JSON | trailer
+    index: {ref: [offset, length, sha256]}; trailer: index offset,
+    index length, end magic.
+    """
+    index: Dict[str, Tuple[int, int, str]] = {}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PACKED_MAGIC)
+        for ref in sorted(capsule.keys()):
+            offset = f.tell()
+            writer = _HashingWriter(f)
+            CanonicalEncoder(writer).encode(capsule[ref])
+            index[ref] = (offset, writer.length, writer.sha.hexdigest())
+
+        index_offset = f.tell()
+        index_bytes = json.dumps(index, sort_keys=True).encode("ascii")
+        f.write(index_bytes)
+        f.write(_TRAILER.pack(index_offset, len(index_bytes), PACKED_TRAILER_MAGIC))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class PackedCapsuleStore(CapsuleStore):
+    """Capsule backed by a single packed file, memory-mapped read-only."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.getsize(path) < len(PACKED_MAGIC) + _TRAILER.size:
+            raise EvidenceVerificationError(f"Truncated packed capsule: {path}")
+        self._map, self._identity = _map_file(path)
+        try:
+            self._index = self._read_index()
+        except Exception:
+            self._map.close()
+            raise
+
+    def _read_index(self) -> Dict[str, Tuple[int, int, str]]:
+        path = self.path
+        if self._map[:len(PACKED_MAGIC)] != PACKED_MAGIC:
+            raise EvidenceVerificationError(f"Not a packed capsule: {path}")
+        index_offset, index_length, end_magic = _TRAILER.unpack(
+            self._map[-_TRAILER.size:]
+        )
+        if end_magic != PACKED_TRAILER_MAGIC:
+            raise EvidenceVerificationError(f"Truncated packed capsule: {path}")
+        index_end = len(self._map) - _TRAILER.size
+        if index_offset < len(PACKED_MAGIC) or index_offset + index_length != index_end:
+            raise EvidenceVerificationError(f"Corrupt packed capsule index: {path}")
+
+        try:
+            entries = json.loads(self._map[index_offset:index_end])
+            index = {
+                ref: (int(offset), int(length), str(digest))
+                for ref, (offset, length, digest) in entries.items()
+            }
+        except (ValueError, TypeError, AttributeError) as e:
+            raise EvidenceVerificationError(
+                f"Corrupt packed capsule index: {path}: {e}"
+            ) from e
+        for offset, length, _ in index.values():
+            if offset < len(PACKED_MAGIC) or length < 0 or offset + length > index_offset:
+                raise EvidenceVerificationError(f"Corrupt packed capsule index: {path}")
+        return index
+
+    def raw(self, ref: str) -> memoryview:
+        offset, length, _ = self._index[ref]
+        return memoryview(self._map)[offset:offset + length]
+
+    def artifact_digest(self, ref: str) -> str:
+        return self._index[ref][2]
+
+    def artifact_identity(self, ref: str) -> Hashable:
+        offset, length, _ = self._index[ref]
+        return (self._identity, offset, length)
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        try:
+            self._map.close()
+        except BufferError:
+            # A caller still holds a raw() view; the map closes with it.
+            pass
+
+
+# ---- content-addressed directory layout ----
+
+def write_capsule_directory(directory: str, capsule: Mapping) -> None:
+    """
+    objects/<sha256> holds each distinct artifact once;
+    refs.json maps ref -> sha256.
+    """
+    objects = os.path.join(directory, OBJECTS_DIR)
+    os.makedirs(objects, exist_ok=True)
+
+    refs: Dict[str, str] = {}
+    for ref in sorted(capsule.keys()):
+        tmp_path = os.path.join(objects, ".incoming")
+        with open(tmp_path, "wb") as f:
+            writer = _HashingWriter(f)
+            CanonicalEncoder(writer).encode(capsule[ref])
+        digest = writer.sha.hexdigest()
+        os.replace(tmp_path, os.path.join(objects, digest))
+        refs[ref] = digest
+
+    refs_path = os.path.join(directory, REFS_FILE)
+    with open(refs_path + ".tmp", "w") as f:
+        json.dump(refs, f, sort_keys=True)
+    os.replace(refs_path + ".tmp", refs_path)
+
+
+class DirectoryCapsuleStore(CapsuleStore):
+    """Capsule backed by a content-addressed directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, REFS_FILE)) as f:
+            self._refs: Dict[str, str] = json.load(f)
+        self._maps: Dict[str, Tuple[mmap.mmap, FileIdentity]] = {}
+
+    def _mapped(self, ref: str) -> Tuple[mmap.mmap, FileIdentity]:
+        digest = self._refs[ref]
+        mapped = self._maps.get(digest)
+        if mapped is None:
+            mapped = _map_file(os.path.join(self.directory, OBJECTS_DIR, digest))
+            self._maps[digest] = mapped
+        return mapped
+
+    def raw(self, ref: str) -> memoryview:
+        return memoryview(self._mapped(ref)[0])
+
+    def artifact_digest(self, ref: str) -> str:
+        return self._refs[ref]
+
+    def artifact_identity(self, ref: str) -> Hashable:
+        return self._mapped(ref)[1]
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._refs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._refs)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def close(self) -> None:
+        for mapped, _ in self._maps.values():
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps.clear()
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
 
+from omega_core.core.canonical import register_canonical_fields
 
 from .enums import EvidenceKind, EvidenceScope
 
 
+@register_canonical_fields
 @dataclass(frozen=True)
 class VerifiableEvidence:
     """
@@ -40,6 +42,7 @@ class VerifiableEvidence:
         )
 
 
+@register_canonical_fields
 @dataclass(frozen=True)
 class NegativeAuthorityProof:
     tick: int
@@ -54,6 +57,7 @@ class NegativeAuthorityProof:
         }
 
 
+@register_canonical_fields
 @dataclass
 class VerificationResult:
     valid: bool
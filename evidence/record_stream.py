@@ -0,0 +1,191 @@
+"""
+Chunked canonical record logs and a constant-memory streaming hasher.
+
+A record artifact is a dict of header fields plus one list of records
+(e.g. {"vehicle": ..., "records": [...]}). StreamingRecordHasher feeds
+records one at a time and yields exactly
+
+    deterministic_hash({**header, records_key: records}, domain_separator)
+
+so LOG / MANIFEST evidence keeps its existing hash and domain separator.
+
+On disk (RecordLog) the artifact is JSON lines: a canonical header line
+{"header": {...}, "records_key": ..., "version": 1}, then one canonical
+record per line. Verification hashes the record lines as bytes, after
+checking that each is exactly one record in canonical form.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from omega_core.core.canonical import CanonicalEncoder
+from omega_core.core.exceptions import EvidenceVerificationError
+from omega_core.core.hashing import deterministic_json_bytes
+
+from .capsule_store import FileIdentity, file_identity, hash_capsule_artifact
+
+
+RECORD_LOG_VERSION = 1
+RECORDS_KEY = "records"
+
+
+class StreamingRecordHasher:
+    """
+    Incremental deterministic_hash of a record artifact.
+    Header keys must be strings and must not include records_key.
+    domain_separator=None hashes the bare canonical bytes.
+    """
+
+    def __init__(
+        self,
+        domain_separator: Optional[str],
+        *,
+        header: Optional[Mapping[str, Any]] = None,
+        records_key: str = RECORDS_KEY,
+    ):
+        header = dict(header or {})
+        if records_key in header:
+            raise ValueError(f"header must not contain {records_key!r}")
+        if not all(isinstance(k, str) for k in header):
+            raise TypeError("header keys must be strings")
+
+        self._sha = hashlib.sha256()
+        self._encoder = CanonicalEncoder(self._sha)
+        self._separator = b"["
+        self._count = 0
+
+        # Keys sort around records_key exactly as the whole-object encoding would.
+        before = {k: v for k, v in header.items() if k < records_key}
+        after = {k: v for k, v in header.items() if k > records_key}
+        key = json.dumps(records_key).encode("ascii")
+
+        if domain_separator:
+            self._sha.update(b'{"__data__":')
+        if before:
+            self._sha.update(deterministic_json_bytes(before)[:-1] + b",")
+        else:
+            self._sha.update(b"{")
+        self._sha.update(key + b":")
+
+        self._suffix = b""
+        if after:
+            self._suffix = b"," + deterministic_json_bytes(after)[1:-1]
+        self._suffix += b"}"
+        if domain_separator:
+            self._suffix += b',"__type__":' + json.dumps(domain_separator).encode("ascii") + b"}"
+
+    @property
+    def record_count(self) -> int:
+        return self._count
+
+    def update(self, record: Any) -> None:
+        self._sha.update(self._separator)
+        self._encoder.encode(record)
+        self._separator = b","
+        self._count += 1
+
+    def update_canonical(self, record_bytes: bytes) -> None:
+        """Feed a record already in canonical JSON form (deterministic_json_bytes)."""
+        self._sha.update(self._separator)
+        self._sha.update(record_bytes)
+        self._separator = b","
+        self._count += 1
+
+    def hexdigest(self) -> str:
+        sha = self._sha.copy()
+        sha.update(b"[]" if self._count == 0 else b"]")
+        sha.update(self._suffix)
+        return sha.hexdigest()
+
+
+def write_record_log(
+    path: str,
+    records: Iterable[Any],
+    *,
+    domain_separator: str,
+    header: Optional[Mapping[str, Any]] = None,
+    records_key: str = RECORDS_KEY,
+) -> str:
+    """
+    Write a RecordLog file in one pass; returns its evidence hash under
+    domain_separator.
+    """
+    hasher = StreamingRecordHasher(domain_separator, header=header, records_key=records_key)
+    with open(path, "wb") as f:
+        f.write(deterministic_json_bytes({
+            "header": dict(header or {}),
+            "records_key": records_key,
+            "version": RECORD_LOG_VERSION,
+        }) + b"\n")
+        for record in records:
+            line = deterministic_json_bytes(record)
+            hasher.update_canonical(line)
+            f.write(line + b"\n")
+    return hasher.hexdigest()
+
+
+class RecordLog:
+    """
+    Capsule value standing for a record artifact stored as a RecordLog
+    file. to_dict() materializes it; hashing streams it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+        if meta.get("version") != RECORD_LOG_VERSION:
+            raise ValueError(f"Unsupported record log version in {path}")
+        self.header: Dict[str, Any] = meta["header"]
+        self.records_key: str = meta["records_key"]
+
+    def _lines(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            f.readline()
+            for line in f:
+                yield line.rstrip(b"\n")
+
+    def records(self) -> Iterator[Any]:
+        for line in self._lines():
+            yield json.loads(line)
+
+    def hash(self, domain_separator: Optional[str]) -> str:
+        hasher = StreamingRecordHasher(
+            domain_separator,
+            header=self.header,
+            records_key=self.records_key,
+        )
+        for number, line in enumerate(self._lines(), start=2):
+            # Hashing raw bytes is only sound if the bytes are what
+            # to_dict() would encode: one canonical value per line.
+            try:
+                canonical = deterministic_json_bytes(json.loads(line)) == line
+            except ValueError:
+                canonical = False
+            if not canonical:
+                raise EvidenceVerificationError(
+                    f"Non-canonical record at {self.path}:{number}"
+                )
+            hasher.update_canonical(line)
+        return hasher.hexdigest()
+
+    def artifact_identity(self) -> FileIdentity:
+        """Identity of the backing file for verification cache keys."""
+        return file_identity(self.path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.header, self.records_key: list(self.records())}
+
+
+def hash_record_artifact(
+    capsule: Mapping[str, Any],
+    evidence_ref: str,
+    domain_separator: str,
+) -> str:
+    """Verification hasher streaming RecordLog artifacts; others use the default."""
+    if getattr(capsule, "raw", None) is None:
+        artifact = capsule[evidence_ref]
+        if isinstance(artifact, RecordLog):
+            return artifact.hash(domain_separator)
+    return hash_capsule_artifact(capsule, evidence_ref, domain_separator)
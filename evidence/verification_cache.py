@@ -0,0 +1,107 @@
+"""
+Bounded LRU cache of recomputed evidence hashes.
+
+Keys are (evidence_ref, domain_separator, identity), where identity
+names the exact file bytes being verified (capsule_artifact_identity:
+device, inode, size and timestamps, plus the offset within a packed
+capsule). Building a key never reads the artifact, and a store's recorded
+digest never contributes. Inline evidence_data never contributes to a
+key, so a cached hash always belongs to the canonical artifact being
+verified.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+
+CacheKey = Tuple[str, str, Hashable]
+
+# Rough per-entry overhead: two hex digests plus container bookkeeping.
+_ENTRY_OVERHEAD = 256
+
+
+class VerificationCache:
+    """
+    Thread-safe LRU of recomputed hashes, bounded by entry count and by
+    approximate memory size in bytes.
+    """
+
+    def __init__(self, *, max_entries: int = 65536, max_bytes: int = 64 * 1024 * 1024):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("cache bounds must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._by_ref: Dict[str, Set[CacheKey]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _cost(key: CacheKey) -> int:
+        return len(key[0]) + len(key[1]) + _ENTRY_OVERHEAD
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: CacheKey, recomputed_hash: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._entries[key] = recomputed_hash
+                return
+            self._entries[key] = recomputed_hash
+            self._by_ref.setdefault(key[0], set()).add(key)
+            self._size += self._cost(key)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        self._size -= self._cost(key)
+        keys = self._by_ref[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._by_ref[key[0]]
+
+    def invalidate(self, evidence_ref: str) -> int:
+        """Drop every entry for evidence_ref (e.g. after the capsule entry is replaced)."""
+        with self._lock:
+            keys = list(self._by_ref.get(evidence_ref, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_ref.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1,43 +1,180 @@
-from typing import Dict, Any
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+)
 
-from omega_core.core.hashing import deterministic_hash
 from omega_core.core.exceptions import EvidenceVerificationError
 
+from .capsule_store import capsule_artifact_identity, hash_capsule_artifact
 from .enums import EvidenceKind
 from .models import VerifiableEvidence, VerificationResult
+from .record_stream import hash_record_artifact
+from .verification_cache import VerificationCache
+
+
+@dataclass(frozen=True)
+class EvidenceVerificationSpec:
+    """
+    How one evidence kind is verified.
+
+    generation_methods: accepted methods, None accepts any.
+    hasher(capsule, evidence_ref, domain_separator) recomputes the hash;
+    kinds with large artifacts can plug in a streaming one.
+    """
+    domain_separator: str
+    generation_methods: Optional[FrozenSet[str]] = None
+    hasher: Callable[[Mapping[str, Any], str, str], str] = hash_capsule_artifact
+
+
+_VERIFICATION_SPECS: Dict[EvidenceKind, EvidenceVerificationSpec] = {}
+
+
+def register_evidence_verification(
+    kind: EvidenceKind,
+    spec: EvidenceVerificationSpec,
+) -> None:
+    _VERIFICATION_SPECS[kind] = spec
+
+
+def evidence_verification_spec(kind: EvidenceKind) -> Optional[EvidenceVerificationSpec]:
+    return _VERIFICATION_SPECS.get(kind)
+
+
+register_evidence_verification(
+    EvidenceKind.SCAN,
+    EvidenceVerificationSpec(
+        domain_separator="MLScanEvidence",
+        generation_methods=frozenset({"ml_authority_scan"}),
+    ),
+)
+register_evidence_verification(
+    EvidenceKind.MANIFEST,
+    EvidenceVerificationSpec(
+        domain_separator="ManifestEvidence",
+        hasher=hash_record_artifact,
+    ),
+)
+register_evidence_verification(
+    EvidenceKind.LOG,
+    EvidenceVerificationSpec(
+        domain_separator="LogEvidence",
+        hasher=hash_record_artifact,
+    ),
+)
+register_evidence_verification(
+    EvidenceKind.STATIC_PROOF,
+    EvidenceVerificationSpec(domain_separator="StaticProofEvidence"),
+)
 
 
 class ProofVerifier:
     """
     TRUST BOUNDARY: verification loads canonical evidence from capsule only.
     evidence_data is ignored for verification.
+
+    capsule may be a plain dict or a CapsuleStore; with a store, only the
+    requested artifact is mapped and it is hashed from its canonical bytes.
+    Evidence kinds are dispatched through register_evidence_verification.
+
+    An optional VerificationCache, shared across verifiers, reuses hashes
+    of file-backed artifacts, keyed by the backing file's identity (see
+    capsule_artifact_identity). In-memory artifacts are always re-hashed.
     """
 
-    def __init__(self, capsule: Dict[str, Any]):
+    def __init__(
+        self,
+        capsule: Mapping[str, Any],
+        cache: Optional[VerificationCache] = None,
+    ):
         self.capsule = capsule
+        self.cache = cache
+        # Set only on the per-batch copy made by verify_many.
+        self._hash_memo: Optional[Dict[Tuple[str, str], Future]] = None
+        self._hash_memo_lock = threading.Lock()
 
-    def _load_canonical(self, evidence: VerifiableEvidence) -> Dict[str, Any]:
+    def _check_ref(self, evidence: VerifiableEvidence) -> None:
         if evidence.evidence_ref not in self.capsule:
             raise EvidenceVerificationError(
                 f"Evidence ref not found in capsule: {evidence.evidence_ref}"
             )
+
+    def _load_canonical(self, evidence: VerifiableEvidence) -> Dict[str, Any]:
+        self._check_ref(evidence)
         return self.capsule[evidence.evidence_ref]
 
+    def _recompute_hash(
+        self,
+        evidence: VerifiableEvidence,
+        spec: EvidenceVerificationSpec,
+    ) -> str:
+        if self._hash_memo is None:
+            return self._hash_artifact(evidence, spec)
+
+        # Within a batch each (ref, domain) is hashed once; concurrent
+        # requesters wait on the first one's future.
+        key = (evidence.evidence_ref, spec.domain_separator)
+        with self._hash_memo_lock:
+            future = self._hash_memo.get(key)
+            owner = future is None
+            if owner:
+                future = self._hash_memo[key] = Future()
+        if owner:
+            try:
+                future.set_result(self._hash_artifact(evidence, spec))
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    def _hash_artifact(
+        self,
+        evidence: VerifiableEvidence,
+        spec: EvidenceVerificationSpec,
+    ) -> str:
+        self._check_ref(evidence)
+        ref = evidence.evidence_ref
+        # Identity is taken before hashing, so a concurrent rewrite can only
+        # file its hash under the stale identity, which never recurs.
+        identity = None if self.cache is None else capsule_artifact_identity(self.capsule, ref)
+        if identity is None:
+            return spec.hasher(self.capsule, ref, spec.domain_separator)
+
+        key = (ref, spec.domain_separator, identity)
+        recomputed = self.cache.get(key)
+        if recomputed is None:
+            recomputed = spec.hasher(self.capsule, ref, spec.domain_separator)
+            self.cache.put(key, recomputed)
+        return recomputed
+
     def verify_evidence(self, evidence: VerifiableEvidence) -> VerificationResult:
         try:
-            if evidence.evidence_kind == EvidenceKind.SCAN:
-                return self._verify_scan(evidence)
-            if evidence.evidence_kind == EvidenceKind.MANIFEST:
-                return self._verify_manifest(evidence)
-            if evidence.evidence_kind == EvidenceKind.LOG:
-                return self._verify_log(evidence)
-            if evidence.evidence_kind == EvidenceKind.STATIC_PROOF:
-                return self._verify_static_proof(evidence)
-
+            spec = evidence_verification_spec(evidence.evidence_kind)
+            if spec is None:
+                return VerificationResult(
+                    valid=False,
+                    failure_reason="Unknown evidence kind",
+                    recomputed_hash=None,
+                    expected_hash=evidence.evidence_hash,
+                )
+
+            if (
+                spec.generation_methods is not None
+                and evidence.generation_method not in spec.generation_methods
+            ):
+                return VerificationResult(
+                    valid=False,
+                    failure_reason=f"Unknown {evidence.evidence_kind.value.lower()} method",
+                    recomputed_hash=None,
+                    expected_hash=evidence.evidence_hash,
+                )
+
+            recomputed = self._recompute_hash(evidence, spec)
             return VerificationResult(
-                valid=False,
-                failure_reason="Unknown evidence kind",
-                recomputed_hash=None,
+                valid=recomputed == evidence.evidence_hash,
+                failure_reason=None if recomputed == evidence.evidence_hash else "Hash mismatch",
+                recomputed_hash=recomputed,
                 expected_hash=evidence.evidence_hash,
             )
 
@@ -56,54 +193,26 @@ class ProofVerifier:
                 expected_hash=evidence.evidence_hash,
             )
 
-    def _verify_scan(self, evidence: VerifiableEvidence) -> VerificationResult:
-        if evidence.generation_method != "ml_authority_scan":
-            return VerificationResult(
-                valid=False,
-                failure_reason="Unknown scan method",
-                recomputed_hash=None,
-                expected_hash=evidence.evidence_hash,
-            )
-
-        canonical = self._load_canonical(evidence)
-        recomputed = deterministic_hash(canonical, "MLScanEvidence")
-
-        return VerificationResult(
-            valid=recomputed == evidence.evidence_hash,
-            failure_reason=None if recomputed == evidence.evidence_hash else "Hash mismatch",
-            recomputed_hash=recomputed,
-            expected_hash=evidence.evidence_hash,
-        )
-
-    def _verify_manifest(self, evidence: VerifiableEvidence) -> VerificationResult:
-        canonical = self._load_canonical(evidence)
-        recomputed = deterministic_hash(canonical, "ManifestEvidence")
-
-        return VerificationResult(
-            valid=recomputed == evidence.evidence_hash,
-            failure_reason=None if recomputed == evidence.evidence_hash else "Hash mismatch",
-            recomputed_hash=recomputed,
-            expected_hash=evidence.evidence_hash,
-        )
-
-    def _verify_log(self, evidence: VerifiableEvidence) -> VerificationResult:
-        canonical = self._load_canonical(evidence)
-        recomputed = deterministic_hash(canonical, "LogEvidence")
-
-        return VerificationResult(
-            valid=recomputed == evidence.evidence_hash,
-            failure_reason=None if recomputed == evidence.evidence_hash else "Hash mismatch",
-            recomputed_hash=recomputed,
-            expected_hash=evidence.evidence_hash,
-        )
-
-    def _verify_static_proof(self, evidence: VerifiableEvidence) -> VerificationResult:
-        canonical = self._load_canonical(evidence)
-        recomputed = deterministic_hash(canonical, "StaticProofEvidence")
-
-        return VerificationResult(
-            valid=recomputed == evidence.evidence_hash,
-            failure_reason=None if recomputed == evidence.evidence_hash else "Hash mismatch",
-            recomputed_hash=recomputed,
-            expected_hash=evidence.evidence_hash,
-        )
+    def verify_many(
+        self,
+        evidences: Iterable[VerifiableEvidence],
+        *,
+        workers: Optional[int] = None,
+    ) -> List[VerificationResult]:
+        """
+        Verify a batch, one result per item in input order. Artifacts shared
+        by several items are hashed once per (evidence_ref, domain).
+
+        Runs on a thread pool (workers threads); workers=1 verifies
+        serially. There is no process mode: capsule stores hold open
+        mmaps and cannot be pickled.
+        """
+        items = list(evidences)
+        batch = copy.copy(self)
+        batch._hash_memo = {}
+        batch._hash_memo_lock = threading.Lock()
+
+        if workers == 1 or len(items) < 2:
+            return [batch.verify_evidence(e) for e in items]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(batch.verify_evidence, items))
@@ -7,5 +7,12 @@ Canonical source of decision truth.
 
 from .enums import *
 from .events import *
+from .event_store import *
 from .state_machine import *
 from .invariants import *
+from .binary import *
+from .event_index import *
+from .replay import *
+from .snapshot import *
+from .session_host import *
+from .async_service import *
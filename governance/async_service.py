@@ -0,0 +1,111 @@
+"""
+Asyncio front-end for a SessionHost.
+
+Each session gets an ordered queue drained by one worker task, so a
+session's transitions run strictly one after another in submission
+order while different sessions proceed in parallel. The transition
+itself (event hashing, store writes) runs in an executor, keeping the
+event loop free.
+
+Backpressure: submitters wait once a session has max_pending_per_session
+queued requests, or the service has max_pending in flight overall.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .events import GovernanceEvent
+from .session_host import SessionHost
+from .state_machine import TransitionSpec
+
+
+class AsyncGovernanceService:
+    """
+    Must be created and used from within a running event loop.
+    Worker tasks exist only while a session has queued work.
+    """
+
+    def __init__(
+        self,
+        host: SessionHost,
+        *,
+        executor: Optional[Executor] = None,
+        max_pending_per_session: int = 256,
+        max_pending: int = 65536,
+    ):
+        if max_pending_per_session <= 0 or max_pending <= 0:
+            raise ValueError("backpressure limits must be positive")
+        self.host = host
+        self.executor = executor
+        self.max_pending_per_session = max_pending_per_session
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    async def transition(self, session_id: str, **kwargs: Any) -> GovernanceEvent:
+        """Queue a transition for session_id and await its committed event."""
+        return await self._submit(
+            session_id, functools.partial(self.host.transition, session_id, **kwargs)
+        )
+
+    async def transition_many(
+        self,
+        session_id: str,
+        specs: Iterable[TransitionSpec],
+    ) -> List[GovernanceEvent]:
+        """Queue an atomic batch for session_id."""
+        return await self._submit(
+            session_id,
+            functools.partial(self.host.transition_many, session_id, list(specs)),
+        )
+
+    async def _submit(self, session_id: str, call: Callable[[], Any]) -> Any:
+        await self._capacity.acquire()
+        try:
+            future = asyncio.get_running_loop().create_future()
+            queue = self._queues.get(session_id)
+            if queue is None:
+                queue = self._queues[session_id] = asyncio.Queue(self.max_pending_per_session)
+            await queue.put((call, future))
+            if session_id not in self._workers:
+                self._workers[session_id] = asyncio.create_task(
+                    self._drain(session_id, queue)
+                )
+            return await future
+        finally:
+            self._capacity.release()
+
+    async def _drain(self, session_id: str, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while not queue.empty():
+                call, future = queue.get_nowait()
+                try:
+                    result = await loop.run_in_executor(self.executor, call)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # No await between the emptiness check and removal, so a new
+            # submission either lands before this point or starts a worker.
+            del self._workers[session_id]
+            if queue.empty():
+                del self._queues[session_id]
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._workers)
+
+    async def drain(self) -> None:
+        """Wait until every queued transition has been processed."""
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        await self.drain()
+        await asyncio.get_running_loop().run_in_executor(self.executor, self.host.close)
@@ -0,0 +1,450 @@
+"""
+Compact binary encoding for governance events and capsule values.
+
+Storage/transfer format only: hashes are still defined over canonical
+JSON, and every value round-trips losslessly to its dict form.
+
+- 64-char lowercase hex digests are stored as 32 raw bytes
+- enum values use fixed code tables (append-only; never renumber)
+- integers are zigzag varints
+- strings are interned per stream: first use inline, later uses by index
+- event_id / timestamp are omitted when they equal the values derived
+  from tick, event type and payload hash
+
+Archives start with ARCHIVE_MAGIC + a format version byte; each event
+record is length-prefixed.
+"""
+
+import mmap
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from omega_core.core.constants import HASH_REFERENCE_LENGTH
+from omega_core.evidence.enums import EvidenceKind, EvidenceScope
+
+from .enums import GovernanceEventType, GovernanceState
+from .events import GovernanceEvent
+
+
+ARCHIVE_MAGIC = b"OMGB"
+FORMAT_VERSION = 1
+
+# Append-only code tables. Codes are positions; never reorder or remove.
+EVENT_TYPE_CODES: Tuple[GovernanceEventType, ...] = (
+    GovernanceEventType.OBSERVATION_RECORDED,
+    GovernanceEventType.ASSESSMENT_COMPLETED,
+    GovernanceEventType.DECISION_MADE,
+    GovernanceEventType.COMMITMENT_RECORDED,
+    GovernanceEventType.ACKNOWLEDGMENT_RECEIVED,
+    GovernanceEventType.CYCLE_CLOSED,
+    GovernanceEventType.THREAT_DETECTED,
+    GovernanceEventType.COMPATIBILITY_NEGOTIATED,
+    GovernanceEventType.WORKFLOW_ACKNOWLEDGED,
+    GovernanceEventType.WORKFLOW_EXPIRED,
+    GovernanceEventType.WORKFLOW_ESCALATED,
+)
+STATE_CODES: Tuple[GovernanceState, ...] = (
+    GovernanceState.OBSERVED,
+    GovernanceState.ASSESSED,
+    GovernanceState.DECIDED,
+    GovernanceState.COMMITTED,
+    GovernanceState.ACKED,
+    GovernanceState.CLOSED,
+)
+EVIDENCE_KIND_CODES: Tuple[EvidenceKind, ...] = (
+    EvidenceKind.SCAN,
+    EvidenceKind.MANIFEST,
+    EvidenceKind.LOG,
+    EvidenceKind.STATIC_PROOF,
+)
+EVIDENCE_SCOPE_CODES: Tuple[EvidenceScope, ...] = (
+    EvidenceScope.TICK,
+    EvidenceScope.SESSION,
+    EvidenceScope.ASSET,
+    EvidenceScope.FLEET,
+)
+
+# Event types known when format version 1 was fixed. Later event types are
+# encoded by code only and never seeded: growing the seed would shift every
+# interned string index in existing archives.
+_SEEDED_EVENT_TYPES = 8
+
+# Strings every stream's intern table starts with: enum values, then
+# frequent keys. Fixed for a format version; changing it requires a new
+# FORMAT_VERSION.
+SEED_STRINGS: Tuple[str, ...] = tuple(
+    member.value
+    for table in (
+        EVENT_TYPE_CODES[:_SEEDED_EVENT_TYPES],
+        STATE_CODES,
+        EVIDENCE_KIND_CODES,
+        EVIDENCE_SCOPE_CODES,
+    )
+    for member in table
+) + (
+    "event_id", "event_type", "tick", "prev_event_hash", "payload_hash",
+    "actor", "timestamp", "state_before", "state_after", "event_hash",
+    "evidence_kind", "evidence_ref", "evidence_hash", "evidence_scope",
+    "generation_method", "evidence_data", "claim", "evidence",
+    "asserted_absences", "proof_hash", "governance", "spec", "spec_hash",
+    "events", "authority_claims", "authority_claim_ids",
+    "negative_authority_proof", "genesis",
+)
+
+# Enum member -> code in EVENT_TYPE_CODES / STATE_CODES.
+EVENT_TYPE_INDEX = {member: i for i, member in enumerate(EVENT_TYPE_CODES)}
+STATE_INDEX = {member: i for i, member in enumerate(STATE_CODES)}
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_DOUBLE = struct.Struct(">d")
+
+# Value tags
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _DIGEST, _LIST, _DICT = range(9)
+
+# Event flags
+_PREV_DIGEST = 0x01
+_PAYLOAD_DIGEST = 0x02
+_EVENT_DIGEST = 0x04
+_ID_DERIVED = 0x08
+_TS_DERIVED = 0x10
+
+
+def is_digest(value: str) -> bool:
+    """True for a lowercase hex sha256 digest."""
+    return len(value) == 64 and _HEX_DIGITS.issuperset(value)
+
+
+def derived_event_id(tick: int, event_type: GovernanceEventType, payload_hash: str) -> str:
+    """event_id that create_governance_event assigns; stored only when different."""
+    return f"gov_{tick}_{event_type.value}_{payload_hash[:HASH_REFERENCE_LENGTH]}"
+
+
+def derived_timestamp(tick: int) -> str:
+    """DeterministicClock.ts(tick=tick, local_seq=0); stored only when different."""
+    return f"OMEGA_T{int(tick):09d}_S{0:06d}"
+
+
+class BinaryWriter:
+    """Append-only encoder with a per-stream string intern table."""
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._strings: Dict[str, int] = {s: i for i, s in enumerate(SEED_STRINGS)}
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buf)
+
+    def take(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+    def varint(self, n: int) -> None:
+        if n < 0:
+            raise ValueError("varint must be non-negative")
+        buf = self._buf
+        while n >= 0x80:
+            buf.append((n & 0x7F) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def zigzag(self, n: int) -> None:
+        self.varint(n * 2 if n >= 0 else -n * 2 - 1)
+
+    def raw(self, data: bytes) -> None:
+        self._buf += data
+
+    def string(self, value: str) -> None:
+        """Interned string: 0 + inline literal on first use, index + 1 afterwards."""
+        index = self._strings.get(value)
+        if index is not None:
+            self.varint(index + 1)
+            return
+        self._strings[value] = len(self._strings)
+        data = value.encode("utf-8")
+        self.varint(0)
+        self.varint(len(data))
+        self._buf += data
+
+    def hash_field(self, value: str) -> bool:
+        """Write a hash as 32 raw bytes if it is a hex digest, else as a string."""
+        if is_digest(value):
+            self._buf += bytes.fromhex(value)
+            return True
+        self.string(value)
+        return False
+
+    def value(self, obj: Any) -> None:
+        buf = self._buf
+        if obj is None:
+            buf.append(_NULL)
+        elif obj is False:
+            buf.append(_FALSE)
+        elif obj is True:
+            buf.append(_TRUE)
+        elif isinstance(obj, int):
+            buf.append(_INT)
+            self.zigzag(obj)
+        elif isinstance(obj, float):
+            buf.append(_FLOAT)
+            buf += _DOUBLE.pack(obj)
+        elif isinstance(obj, str):
+            if is_digest(obj):
+                buf.append(_DIGEST)
+                buf += bytes.fromhex(obj)
+            else:
+                buf.append(_STR)
+                self.string(obj)
+        elif isinstance(obj, (list, tuple)):
+            buf.append(_LIST)
+            self.varint(len(obj))
+            for item in obj:
+                self.value(item)
+        elif isinstance(obj, dict):
+            buf.append(_DICT)
+            self.varint(len(obj))
+            for key, item in obj.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"dict keys must be str, not {type(key).__name__}")
+                self.string(key)
+                self.value(item)
+        else:
+            raise TypeError(f"Cannot binary-encode {type(obj).__name__}")
+
+    def event(self, event: GovernanceEvent) -> None:
+        start = len(self._buf)
+        self._buf += b"\x00\x00\x00"
+        flags = 0
+        self.zigzag(event.tick)
+        if self.hash_field(event.prev_event_hash):
+            flags |= _PREV_DIGEST
+        if self.hash_field(event.payload_hash):
+            flags |= _PAYLOAD_DIGEST
+        if self.hash_field(event.event_hash):
+            flags |= _EVENT_DIGEST
+        self.string(event.actor)
+
+        if event.event_id == derived_event_id(event.tick, event.event_type, event.payload_hash):
+            flags |= _ID_DERIVED
+        else:
+            self.string(event.event_id)
+        if event.timestamp == derived_timestamp(event.tick):
+            flags |= _TS_DERIVED
+        else:
+            self.string(event.timestamp)
+
+        self._buf[start] = EVENT_TYPE_INDEX[event.event_type]
+        self._buf[start + 1] = (
+            STATE_INDEX[event.state_before] << 4 | STATE_INDEX[event.state_after]
+        )
+        self._buf[start + 2] = flags
+
+
+class BinaryReader:
+    """Decoder mirroring BinaryWriter, including its intern table."""
+
+    def __init__(self, data: bytes, offset: int = 0):
+        self._data = memoryview(data)
+        self.offset = offset
+        self._strings: List[str] = list(SEED_STRINGS)
+
+    def release(self) -> None:
+        self._data.release()
+
+    def at_end(self) -> bool:
+        return self.offset >= len(self._data)
+
+    def byte(self) -> int:
+        value = self._data[self.offset]
+        self.offset += 1
+        return value
+
+    def varint(self) -> int:
+        data = self._data
+        result = shift = 0
+        while True:
+            b = data[self.offset]
+            self.offset += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        n = self.varint()
+        return n >> 1 if not n & 1 else -(n >> 1) - 1
+
+    def raw(self, n: int) -> bytes:
+        end = self.offset + n
+        if end > len(self._data):
+            raise ValueError("Truncated binary record")
+        data = self._data[self.offset:end].tobytes()
+        self.offset = end
+        return data
+
+    def string(self) -> str:
+        index = self.varint()
+        if index:
+            return self._strings[index - 1]
+        value = self.raw(self.varint()).decode("utf-8")
+        self._strings.append(value)
+        return value
+
+    def hash_field(self, is_digest: bool) -> str:
+        return self.raw(32).hex() if is_digest else self.string()
+
+    def value(self) -> Any:
+        tag = self.byte()
+        if tag == _NULL:
+            return None
+        if tag == _FALSE:
+            return False
+        if tag == _TRUE:
+            return True
+        if tag == _INT:
+            return self.zigzag()
+        if tag == _FLOAT:
+            return _DOUBLE.unpack(self.raw(8))[0]
+        if tag == _STR:
+            return self.string()
+        if tag == _DIGEST:
+            return self.raw(32).hex()
+        if tag == _LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _DICT:
+            result = {}
+            for _ in range(self.varint()):
+                key = self.string()
+                result[key] = self.value()
+            return result
+        raise ValueError(f"Unknown value tag {tag}")
+
+    def event(self) -> GovernanceEvent:
+        event_type = EVENT_TYPE_CODES[self.byte()]
+        states = self.byte()
+        flags = self.byte()
+        tick = self.zigzag()
+        prev_event_hash = self.hash_field(flags & _PREV_DIGEST)
+        payload_hash = self.hash_field(flags & _PAYLOAD_DIGEST)
+        event_hash = self.hash_field(flags & _EVENT_DIGEST)
+        actor = self.string()
+        event_id = (
+            derived_event_id(tick, event_type, payload_hash)
+            if flags & _ID_DERIVED else self.string()
+        )
+        timestamp = derived_timestamp(tick) if flags & _TS_DERIVED else self.string()
+
+        return GovernanceEvent(
+            event_id=event_id,
+            event_type=event_type,
+            tick=tick,
+            prev_event_hash=prev_event_hash,
+            payload_hash=payload_hash,
+            actor=actor,
+            timestamp=timestamp,
+            state_before=STATE_CODES[states >> 4],
+            state_after=STATE_CODES[states & 0x0F],
+            event_hash=event_hash,
+        )
+
+
+# ---- values (capsules, evidence, any JSON-like data) ----
+
+def encode_value(obj: Any) -> bytes:
+    writer = BinaryWriter()
+    writer.raw(ARCHIVE_MAGIC + bytes((FORMAT_VERSION,)))
+    writer.value(obj)
+    return writer.getvalue()
+
+
+def decode_value(data: bytes) -> Any:
+    reader = _open_reader(data)
+    return reader.value()
+
+
+def _open_reader(data: bytes) -> BinaryReader:
+    if bytes(data[:len(ARCHIVE_MAGIC)]) != ARCHIVE_MAGIC:
+        raise ValueError("Not an Omega binary stream")
+    version = data[len(ARCHIVE_MAGIC)]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format version {version}")
+    return BinaryReader(data, len(ARCHIVE_MAGIC) + 1)
+
+
+# ---- event archives ----
+
+class EventArchiveWriter:
+    """Streams length-prefixed event records to a binary file."""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self._writer = BinaryWriter()
+        self._frame = BinaryWriter()
+        f.write(ARCHIVE_MAGIC + bytes((FORMAT_VERSION,)))
+
+    def write(self, event: GovernanceEvent) -> None:
+        self._writer.event(event)
+        record = self._writer.take()
+        self._frame.varint(len(record))
+        self._f.write(self._frame.take() + record)
+
+    def write_all(self, events: Iterable[GovernanceEvent]) -> None:
+        for event in events:
+            self.write(event)
+
+
+def encode_events(events: Iterable[GovernanceEvent]) -> bytes:
+    writer = BinaryWriter()
+    frame = BinaryWriter()
+    out = bytearray(ARCHIVE_MAGIC + bytes((FORMAT_VERSION,)))
+    for event in events:
+        writer.event(event)
+        record = writer.take()
+        frame.varint(len(record))
+        out += frame.take()
+        out += record
+    return bytes(out)
+
+
+def _iter_records(reader: BinaryReader) -> Iterator[GovernanceEvent]:
+    while not reader.at_end():
+        length = reader.varint()
+        end = reader.offset + length
+        event = reader.event()
+        if reader.offset != end:
+            raise ValueError("Corrupt event record length")
+        yield event
+
+
+def iter_decode_events(data: bytes) -> Iterator[GovernanceEvent]:
+    return _iter_records(_open_reader(data))
+
+
+def decode_events(data: bytes) -> List[GovernanceEvent]:
+    return list(iter_decode_events(data))
+
+
+def write_event_archive(path: str, events: Iterable[GovernanceEvent]) -> None:
+    with open(path, "wb") as f:
+        EventArchiveWriter(f).write_all(events)
+
+
+def read_event_archive(path: str) -> Iterator[GovernanceEvent]:
+    """Decode an archive lazily from a read-only memory map."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    reader = None
+    try:
+        reader = _open_reader(mapped)
+        yield from _iter_records(reader)
+    finally:
+        if reader is not None:
+            reader.release()
+        mapped.close()
+
+
+def is_event_archive(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(ARCHIVE_MAGIC)) == ARCHIVE_MAGIC
+    except OSError:
+        return False
@@ -19,3 +19,6 @@ class GovernanceEventType(Enum):
     CYCLE_CLOSED = "CYCLE_CLOSED"
     THREAT_DETECTED = "THREAT_DETECTED"
     COMPATIBILITY_NEGOTIATED = "COMPATIBILITY_NEGOTIATED"
+    WORKFLOW_ACKNOWLEDGED = "WORKFLOW_ACKNOWLEDGED"
+    WORKFLOW_EXPIRED = "WORKFLOW_EXPIRED"
+    WORKFLOW_ESCALATED = "WORKFLOW_ESCALATED"
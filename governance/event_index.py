@@ -0,0 +1,156 @@
+"""
+Secondary indexes over a governance event log.
+
+EventIndex keeps, per event position: a tick index (sorted, bisected
+for ranges) and posting lists by event_type, actor and state_after, plus
+an event_id map. Attached to a state machine it is maintained on append
+as a listener; queries return lazy iterators in chain order and only
+touch the events they yield.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .enums import GovernanceEventType, GovernanceState
+from .events import GovernanceEvent
+from .event_store import EventStore
+from .state_machine import GovernanceStateMachine
+
+
+def _positions() -> array:
+    return array("q")
+
+
+class EventIndex:
+    """
+    Index over events, an EventStore that only ever grows.
+
+    Build one over an existing store with EventIndex(store), or use
+    EventIndex.attach(sm) to index a state machine's chain and keep it
+    current as events commit.
+    """
+
+    def __init__(self, events: EventStore):
+        self.events = events
+        self._count = 0
+        # (tick, position) pairs kept sorted; ticks are usually appended
+        # in order, so this is an append in the common case.
+        self._ticks: List[int] = []
+        self._tick_positions = _positions()
+        self._ticks_monotonic = True
+        self._by_type: Dict[GovernanceEventType, array] = {}
+        self._by_actor: Dict[str, array] = {}
+        self._by_state: Dict[GovernanceState, array] = {}
+        self._by_id: Dict[str, int] = {}
+        self.catch_up()
+
+    @classmethod
+    def attach(cls, sm: GovernanceStateMachine) -> "EventIndex":
+        """Index sm.events and register as a listener, with no gap between."""
+        with sm.write_lock:
+            index = cls(sm.events)
+            sm.listeners.append(index)
+        return index
+
+    # ---- maintenance ----
+
+    def __call__(self, event: GovernanceEvent, event_count: int) -> None:
+        if event_count - 1 > self._count:
+            self.catch_up(event_count - 1)
+        if event_count - 1 == self._count:
+            self._add(event)
+
+    def catch_up(self, upto: Optional[int] = None) -> int:
+        """Index store events not yet seen (up to position upto); returns how many."""
+        upto = len(self.events) if upto is None else upto
+        start = self._count
+        if upto > start:
+            for event in self.events[start:upto]:
+                self._add(event)
+        return self._count - start
+
+    def _add(self, event: GovernanceEvent) -> None:
+        position = self._count
+        if not self._ticks or event.tick >= self._ticks[-1]:
+            self._ticks.append(event.tick)
+            self._tick_positions.append(position)
+        else:
+            self._ticks_monotonic = False
+            at = bisect_right(self._ticks, event.tick)
+            self._ticks.insert(at, event.tick)
+            self._tick_positions.insert(at, position)
+        self._by_type.setdefault(event.event_type, _positions()).append(position)
+        self._by_actor.setdefault(event.actor, _positions()).append(position)
+        self._by_state.setdefault(event.state_after, _positions()).append(position)
+        self._by_id.setdefault(event.event_id, position)
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ---- queries ----
+
+    def get(self, event_id: str) -> Optional[GovernanceEvent]:
+        position = self._by_id.get(event_id)
+        return None if position is None else self.events[position]
+
+    def position(self, event_id: str) -> Optional[int]:
+        return self._by_id.get(event_id)
+
+    def tick_positions(
+        self,
+        tick_from: Optional[int] = None,
+        tick_to: Optional[int] = None,
+    ) -> Sequence[int]:
+        """Positions of events with tick_from <= tick <= tick_to, in chain order."""
+        lo = 0 if tick_from is None else bisect_left(self._ticks, tick_from)
+        hi = len(self._ticks) if tick_to is None else bisect_right(self._ticks, tick_to)
+        positions = self._tick_positions[lo:hi]
+        return positions if self._ticks_monotonic else sorted(positions)
+
+    def positions(
+        self,
+        *,
+        event_type: Optional[GovernanceEventType] = None,
+        actor: Optional[str] = None,
+        state_after: Optional[GovernanceState] = None,
+        tick_from: Optional[int] = None,
+        tick_to: Optional[int] = None,
+    ) -> Iterator[int]:
+        """Lazily yield positions matching every given filter, in chain order."""
+        candidates: List[Sequence[int]] = []
+        for postings, key in (
+            (self._by_type, event_type),
+            (self._by_actor, actor),
+            (self._by_state, state_after),
+        ):
+            if key is not None:
+                candidates.append(postings.get(key, ()))
+        if tick_from is not None or tick_to is not None:
+            candidates.append(self.tick_positions(tick_from, tick_to))
+        if not candidates:
+            return iter(range(self._count))
+        return _intersect(candidates)
+
+    def query(self, **filters: Any) -> Iterator[GovernanceEvent]:
+        """Lazily yield matching events in chain order; see positions()."""
+        events = self.events
+        return (events[p] for p in self.positions(**filters))
+
+    def count(self, **filters: Any) -> int:
+        return sum(1 for _ in self.positions(**filters))
+
+
+def _intersect(lists: List[Sequence[int]]) -> Iterator[int]:
+    # Walk the shortest posting list and probe the others by bisection.
+    lists = sorted(lists, key=len)
+    driver, others = lists[0], lists[1:]
+    cursors = [0] * len(others)
+    for position in driver:
+        for i, other in enumerate(others):
+            cursors[i] = bisect_left(other, position, cursors[i])
+            if cursors[i] == len(other) or other[cursors[i]] != position:
+                break
+        else:
+            yield position
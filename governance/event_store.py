@@ -0,0 +1,528 @@
+"""
+Append-only event storage for the governance state machine.
+
+InMemoryEventStore is the default (and what tests use).
+ColumnarEventStore keeps very long chains in memory as packed columns.
+SegmentedFileEventStore persists the chain as segmented JSONL on local
+disk with group commit, so long sessions keep bounded memory and survive
+a process crash.
+"""
+
+import bisect
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .binary import (
+    EVENT_TYPE_CODES,
+    EVENT_TYPE_INDEX,
+    STATE_CODES,
+    STATE_INDEX,
+    derived_event_id,
+    derived_timestamp,
+    is_digest,
+)
+from .events import GovernanceEvent
+
+
+class EventStore(Sequence, ABC):
+    """
+    Append-only backend for a governance event chain.
+    Supports len(), iteration, indexing and slicing.
+    """
+
+    @abstractmethod
+    def append(self, event: GovernanceEvent) -> None:
+        """Append one event to the end of the chain."""
+
+    def extend(self, events: Iterable[GovernanceEvent]) -> None:
+        for event in events:
+            self.append(event)
+
+    def last(self) -> Optional[GovernanceEvent]:
+        return self[-1] if len(self) else None
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "EventStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class InMemoryEventStore(list, EventStore):
+    """List-backed store. Default for GovernanceStateMachine."""
+
+
+_DIGEST_FIELDS = ("payload_hash", "event_hash")
+_GENESIS_ONLY = {"prev_event_hash": "genesis"}
+_NO_OVERFLOW: Dict[str, str] = {}
+
+
+class ColumnarEventStore(EventStore):
+    """
+    Memory-compact store: parallel arrays of ticks and enum codes, one
+    contiguous buffer of raw 32-byte digests (payload_hash, event_hash),
+    interned actors. prev_event_hash is not stored when it equals the
+    previous event's event_hash, i.e. everywhere but session starts and
+    breaks. Fields that do not fit the columns (non-digest hashes, a
+    prev_event_hash that is not derivable, custom event_id/timestamp) go
+    to a sparse overflow map.
+
+    Indexing builds a GovernanceEvent on access; nothing per event is
+    kept alive. About 80 bytes per event, under a fifth of a list of
+    GovernanceEvent objects (see benchmarks/event_memory.py).
+    """
+
+    def __init__(self, events: Iterable[GovernanceEvent] = ()):
+        self._ticks = array("q")
+        self._types = array("B")
+        self._states = array("B")
+        self._actors = array("I")
+        self._digests = bytearray()
+        self._actor_table: List[str] = []
+        self._actor_index: Dict[str, int] = {}
+        self._overflow: Dict[int, Dict[str, str]] = {}
+        # 1 where prev_event_hash is "genesis" (a session start).
+        self._genesis = bytearray()
+        self._tail_hash: Optional[str] = None
+        self.extend(events)
+
+    def append(self, event: GovernanceEvent) -> None:
+        overflow: Dict[str, str] = {}
+        prev_event_hash = event.prev_event_hash
+        if prev_event_hash != self._tail_hash or not is_digest(prev_event_hash):
+            overflow["prev_event_hash"] = prev_event_hash
+        digests = bytearray()
+        for field in _DIGEST_FIELDS:
+            value = getattr(event, field)
+            if is_digest(value):
+                digests += bytes.fromhex(value)
+            else:
+                digests += bytes(32)
+                overflow[field] = value
+        if event.event_id != derived_event_id(event.tick, event.event_type, event.payload_hash):
+            overflow["event_id"] = event.event_id
+        if event.timestamp != derived_timestamp(event.tick):
+            overflow["timestamp"] = event.timestamp
+
+        type_code = EVENT_TYPE_INDEX[event.event_type]
+        state_code = STATE_INDEX[event.state_before] << 4 | STATE_INDEX[event.state_after]
+
+        # The tick column is the only append that can fail (int64 range);
+        # it goes first so a failure leaves the columns aligned.
+        self._ticks.append(event.tick)
+        index = len(self._ticks) - 1
+        actor = self._actor_index.get(event.actor)
+        if actor is None:
+            actor = self._actor_index[event.actor] = len(self._actor_table)
+            self._actor_table.append(event.actor)
+
+        self._types.append(type_code)
+        self._states.append(state_code)
+        self._actors.append(actor)
+        self._digests += digests
+        if overflow == _GENESIS_ONLY:
+            self._genesis.append(1)
+        else:
+            self._genesis.append(0)
+            if overflow:
+                self._overflow[index] = overflow
+        self._tail_hash = event.event_hash
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def _event(self, index: int) -> GovernanceEvent:
+        base = index * 64
+        digests = self._digests
+        overflow = (
+            _GENESIS_ONLY if self._genesis[index]
+            else self._overflow.get(index, _NO_OVERFLOW)
+        )
+        tick = self._ticks[index]
+        event_type = EVENT_TYPE_CODES[self._types[index]]
+        states = self._states[index]
+
+        prev_event_hash = overflow.get("prev_event_hash")
+        if prev_event_hash is None:
+            # The previous event's event_hash.
+            prev_event_hash = digests[base - 32:base].hex()
+        payload_hash = overflow.get("payload_hash")
+        if payload_hash is None:
+            payload_hash = digests[base:base + 32].hex()
+        event_hash = overflow.get("event_hash")
+        if event_hash is None:
+            event_hash = digests[base + 32:base + 64].hex()
+        event_id = overflow.get("event_id")
+        if event_id is None:
+            event_id = derived_event_id(tick, event_type, payload_hash)
+        timestamp = overflow.get("timestamp")
+        if timestamp is None:
+            timestamp = derived_timestamp(tick)
+
+        return GovernanceEvent(
+            event_id=event_id,
+            event_type=event_type,
+            tick=tick,
+            prev_event_hash=prev_event_hash,
+            payload_hash=payload_hash,
+            actor=self._actor_table[self._actors[index]],
+            timestamp=timestamp,
+            state_before=STATE_CODES[states >> 4],
+            state_after=STATE_CODES[states & 0x0F],
+            event_hash=event_hash,
+        )
+
+    def __getitem__(self, index):
+        length = len(self._ticks)
+        if isinstance(index, slice):
+            return [self._event(i) for i in range(*index.indices(length))]
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("event index out of range")
+        return self._event(index)
+
+    def __iter__(self) -> Iterator[GovernanceEvent]:
+        for index in range(len(self._ticks)):
+            yield self._event(index)
+
+
+class FsyncPolicy(Enum):
+    ALWAYS = "ALWAYS"    # fsync before every append()/extend() returns
+    BATCH = "BATCH"      # fsync once per group commit
+    NEVER = "NEVER"      # leave durability to the OS
+
+
+SEGMENT_PREFIX = "segment_"
+SEGMENT_SUFFIX = ".jsonl"
+# Sidecar written when a segment is sealed: its line count, size and
+# sparse offsets, so reopening does not rescan sealed segments.
+SEGMENT_INDEX_SUFFIX = ".idx"
+
+# Byte offset of every Nth line is kept per segment for random access.
+_INDEX_STRIDE = 256
+_READ_BLOCK = 1 << 20
+
+
+def _encode_line(event: GovernanceEvent) -> bytes:
+    return (
+        json.dumps(event.to_dict(), sort_keys=True, separators=(",", ":"))
+        + "\n"
+    ).encode("ascii")
+
+
+def _decode_line(line: bytes) -> GovernanceEvent:
+    return GovernanceEvent.from_dict(json.loads(line))
+
+
+class _Segment:
+    __slots__ = ("path", "start", "count", "size", "offsets")
+
+    def __init__(self, path: str, start: int):
+        self.path = path
+        self.start = start
+        self.count = 0
+        self.size = 0
+        self.offsets: List[int] = [0]
+
+    @property
+    def index_path(self) -> str:
+        return self.path[:-len(SEGMENT_SUFFIX)] + SEGMENT_INDEX_SUFFIX
+
+    def load_index(self) -> bool:
+        """Load the sealed-segment sidecar; False if missing or stale."""
+        try:
+            with open(self.index_path, "rb") as f:
+                index = json.load(f)
+            size = os.path.getsize(self.path)
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(index, dict)
+            or index.get("size") != size
+            or not isinstance(index.get("count"), int)
+            or not isinstance(index.get("offsets"), list)
+            or len(index["offsets"]) != index["count"] // _INDEX_STRIDE + 1
+        ):
+            return False
+        self.count = index["count"]
+        self.size = size
+        self.offsets = index["offsets"]
+        return True
+
+    def write_index(self) -> None:
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"count": self.count, "size": self.size, "offsets": self.offsets}, f)
+        os.replace(tmp, self.index_path)
+
+
+class SegmentedFileEventStore(EventStore):
+    """
+    Segmented, append-only JSONL event log.
+
+    - one canonical event dict per line, segments rolled every
+      segment_max_events events
+    - appends are buffered and written in group commits of
+      group_commit_size events (flush() forces a commit)
+    - a torn final line left by a crash is truncated on open
+    - sealed segments get an index sidecar, so opening scans only the
+      tail segment
+    - memory is bounded by the commit buffer plus a sparse offset index
+
+    One writer at a time (GovernanceStateMachine serializes on its
+    write_lock). Readers may run concurrently: a group commit publishes
+    its events to readers in one step under the store lock.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_max_events: int = 100_000,
+        group_commit_size: int = 256,
+        fsync_policy: FsyncPolicy = FsyncPolicy.BATCH,
+    ):
+        if segment_max_events <= 0 or group_commit_size <= 0:
+            raise ValueError("segment_max_events and group_commit_size must be positive")
+
+        self.directory = directory
+        self.segment_max_events = segment_max_events
+        self.group_commit_size = group_commit_size
+        self.fsync_policy = fsync_policy
+
+        self._segments: List[_Segment] = []
+        self._starts: List[int] = []
+        # Only appended to or replaced, so a reader's reference stays valid.
+        self._pending: List[GovernanceEvent] = []
+        self._pending_lines: List[bytes] = []
+        self._last: Optional[GovernanceEvent] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._open_existing()
+
+    # ---- recovery ----
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{number:08d}{SEGMENT_SUFFIX}"
+        )
+
+    def _open_existing(self) -> None:
+        names = sorted(
+            n for n in os.listdir(self.directory)
+            if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)
+        )
+        start = 0
+        for name in names:
+            segment = _Segment(os.path.join(self.directory, name), start)
+            sealed = name != names[-1]
+            if not (sealed and segment.load_index()):
+                self._scan_segment(segment, truncate_torn=not sealed)
+                if sealed:
+                    self._seal(segment)
+            self._segments.append(segment)
+            self._starts.append(start)
+            start += segment.count
+
+        # A roll can leave the tail segment empty (or holding only a torn
+        # line); the last event then lives in an earlier segment.
+        for segment in reversed(self._segments):
+            if segment.count:
+                self._last = self._read_range(
+                    segment, segment.count - 1, segment.count
+                )[0]
+                break
+
+    def _scan_segment(self, segment: _Segment, *, truncate_torn: bool) -> None:
+        count = 0
+        last_newline_end = 0
+        offsets = [0]
+        position = 0
+        with open(segment.path, "rb") as f:
+            while True:
+                block = f.read(_READ_BLOCK)
+                if not block:
+                    break
+                idx = block.find(b"\n")
+                while idx != -1:
+                    count += 1
+                    last_newline_end = position + idx + 1
+                    if count % _INDEX_STRIDE == 0:
+                        offsets.append(last_newline_end)
+                    idx = block.find(b"\n", idx + 1)
+                position += len(block)
+
+        if position != last_newline_end:
+            if not truncate_torn:
+                raise ValueError(f"Torn record inside sealed segment {segment.path}")
+            with open(segment.path, "r+b") as f:
+                f.truncate(last_newline_end)
+
+        segment.count = count
+        segment.size = last_newline_end
+        segment.offsets = offsets
+
+    def _seal(self, segment: _Segment) -> None:
+        try:
+            segment.write_index()
+        except OSError:
+            # The index is an optimization; without it the segment is
+            # rescanned on the next open.
+            pass
+
+    # ---- writes ----
+
+    def append(self, event: GovernanceEvent) -> None:
+        self.extend((event,))
+
+    def extend(self, events: Iterable[GovernanceEvent]) -> None:
+        for event in events:
+            self._pending.append(event)
+            self._pending_lines.append(_encode_line(event))
+            self._last = event
+        if (
+            self.fsync_policy == FsyncPolicy.ALWAYS
+            or len(self._pending) >= self.group_commit_size
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        lines = self._pending_lines
+        i = 0
+        while i < len(lines):
+            segment = self._writable_segment()
+            room = self.segment_max_events - segment.count
+            batch = lines[i:i + room]
+            self._file.write(b"".join(batch))
+            self._file.flush()
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                os.fsync(self._file.fileno())
+            offsets = []
+            size = segment.size
+            for n, line in enumerate(batch, start=segment.count + 1):
+                size += len(line)
+                if n % _INDEX_STRIDE == 0:
+                    offsets.append(size)
+            # Move the batch from pending to durable in one step for readers.
+            with self._lock:
+                segment.offsets.extend(offsets)
+                segment.count += len(batch)
+                segment.size = size
+                self._pending = self._pending[len(batch):]
+            i += len(batch)
+
+        self._pending_lines = []
+
+    def _writable_segment(self) -> _Segment:
+        if self._segments and self._segments[-1].count < self.segment_max_events:
+            segment = self._segments[-1]
+            if self._file is None:
+                self._file = open(segment.path, "ab")
+            return segment
+
+        if self._file is not None:
+            self._file.close()
+        if self._segments:
+            self._seal(self._segments[-1])
+        start = self._durable_count()
+        segment = _Segment(self._segment_path(len(self._segments)), start)
+        self._file = open(segment.path, "ab")
+        with self._lock:
+            self._segments.append(segment)
+            self._starts.append(start)
+        return segment
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ---- reads ----
+
+    def _durable_count(self) -> int:
+        if not self._segments:
+            return 0
+        tail = self._segments[-1]
+        return tail.start + tail.count
+
+    def _snapshot(self) -> Tuple[int, List[GovernanceEvent]]:
+        # (durable count, pending events) as of one commit.
+        with self._lock:
+            return self._durable_count(), self._pending
+
+    def __len__(self) -> int:
+        durable, pending = self._snapshot()
+        return durable + len(pending)
+
+    def last(self) -> Optional[GovernanceEvent]:
+        return self._last
+
+    def __iter__(self) -> Iterator[GovernanceEvent]:
+        with self._lock:
+            segments = [(s.path, s.count) for s in self._segments]
+            pending = list(self._pending)
+        for path, count in segments:
+            with open(path, "rb") as f:
+                for n, line in enumerate(f):
+                    if n >= count:
+                        break
+                    yield _decode_line(line)
+        yield from pending
+
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            lo, hi, step = index.indices(length)
+            if step != 1:
+                return self._range(0, length)[index]
+            return self._range(lo, hi)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("event index out of range")
+        return self._range(index, index + 1)[0]
+
+    def _range(self, lo: int, hi: int) -> List[GovernanceEvent]:
+        events: List[GovernanceEvent] = []
+        durable, pending = self._snapshot()
+        position = lo
+        while position < min(hi, durable):
+            segment = self._segments[bisect.bisect_right(self._starts, position) - 1]
+            local_hi = min(hi, durable, segment.start + segment.count) - segment.start
+            events.extend(
+                self._read_range(segment, position - segment.start, local_hi)
+            )
+            position = segment.start + local_hi
+        if hi > durable:
+            events.extend(pending[max(lo, durable) - durable:hi - durable])
+        return events
+
+    def _read_range(self, segment: _Segment, lo: int, hi: int) -> List[GovernanceEvent]:
+        anchor = lo // _INDEX_STRIDE
+        events: List[GovernanceEvent] = []
+        with open(segment.path, "rb") as f:
+            f.seek(segment.offsets[anchor])
+            n = anchor * _INDEX_STRIDE
+            for line in f:
+                if n >= hi:
+                    break
+                if n >= lo:
+                    events.append(_decode_line(line))
+                n += 1
+        return events
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from typing import Dict, Any
 
+from omega_core.core.canonical import register_canonical_fields
 from omega_core.core.hashing import deterministic_hash
 from omega_core.core.constants import HASH_REFERENCE_LENGTH
 from .enums import GovernanceEventType, GovernanceState
 
 
+@register_canonical_fields
 @dataclass(frozen=True)
 class GovernanceEvent:
     event_id: str
@@ -33,6 +35,41 @@ class GovernanceEvent:
             "event_hash": self.event_hash,
         }
 
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "GovernanceEvent":
+        return GovernanceEvent(
+            event_id=d["event_id"],
+            event_type=GovernanceEventType(d["event_type"]),
+            tick=d["tick"],
+            prev_event_hash=d["prev_event_hash"],
+            payload_hash=d["payload_hash"],
+            actor=d["actor"],
+            timestamp=d["timestamp"],
+            state_before=GovernanceState(d["state_before"]),
+            state_after=GovernanceState(d["state_after"]),
+            event_hash=d["event_hash"],
+        )
+
+
+def governance_event_body(event: GovernanceEvent) -> Dict[str, Any]:
+    """Hashed body of an event: every field except event_hash."""
+    return {
+        "event_id": event.event_id,
+        "event_type": event.event_type.value,
+        "tick": event.tick,
+        "prev_event_hash": event.prev_event_hash,
+        "payload_hash": event.payload_hash,
+        "actor": event.actor,
+        "timestamp": event.timestamp,
+        "state_before": event.state_before.value,
+        "state_after": event.state_after.value,
+    }
+
+
+def recompute_event_hash(event: GovernanceEvent) -> str:
+    """Re-derive event_hash from the event body."""
+    return deterministic_hash(governance_event_body(event), "GovernanceEvent")
+
 
 def create_governance_event(
     *,
@@ -45,7 +82,30 @@ def create_governance_event(
     state_after: GovernanceState,
     clock,
 ) -> GovernanceEvent:
-    payload_hash = deterministic_hash(payload, "EventPayload")
+    return build_governance_event(
+        event_type=event_type,
+        tick=tick,
+        prev_event_hash=prev_event_hash,
+        payload_hash=deterministic_hash(payload, "EventPayload"),
+        actor=actor,
+        state_before=state_before,
+        state_after=state_after,
+        clock=clock,
+    )
+
+
+def build_governance_event(
+    *,
+    event_type: GovernanceEventType,
+    tick: int,
+    prev_event_hash: str,
+    payload_hash: str,
+    actor: str,
+    state_before: GovernanceState,
+    state_after: GovernanceState,
+    clock,
+) -> GovernanceEvent:
+    """create_governance_event for an already computed payload hash."""
     payload_id = payload_hash[:HASH_REFERENCE_LENGTH]
 
     event_id = f"gov_{tick}_{event_type.value}_{payload_id}"
@@ -1,31 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
 from omega_core.core.exceptions import GovernanceInvariantViolation
-from omega_core.core.hashing import deterministic_hash
 
-from .events import GovernanceEvent
+from .enums import GovernanceState
+from .events import GovernanceEvent, recompute_event_hash
 
 
-def assert_governance_invariants(events: list[GovernanceEvent]) -> None:
-    prev_hash = "genesis"
+PARALLEL_CHUNK_SIZE = 4096
+
 
+def _recompute_chunk(events: List[GovernanceEvent]) -> List[Optional[str]]:
+    # Failures are left to the serial sweep so it raises exactly what the
+    # serial path would, in the same order.
+    hashes: List[Optional[str]] = []
     for event in events:
+        try:
+            hashes.append(recompute_event_hash(event))
+        except Exception:
+            hashes.append(None)
+    return hashes
+
+
+def recompute_event_hashes(
+    events: Sequence[GovernanceEvent],
+    workers: int,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> List[Optional[str]]:
+    """
+    Re-derive every event_hash across a process pool, in chunks of
+    chunk_size. None marks an event whose body could not be hashed;
+    callers re-derive it serially to report the error.
+    """
+    chunks = (
+        list(events[i:i + chunk_size])
+        for i in range(0, len(events), chunk_size)
+    )
+    recomputed: List[Optional[str]] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for hashes in pool.map(_recompute_chunk, chunks):
+            recomputed.extend(hashes)
+    return recomputed
+
+
+def assert_governance_invariants(
+    events: list[GovernanceEvent],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> None:
+    """
+    Full-chain invariant check.
+
+    With workers > 1, event hashes are recomputed across a process pool in
+    chunks of chunk_size; linkage and state continuity are then checked in
+    one serial sweep that reports the same first violation as the serial
+    path.
+    """
+    recomputed_hashes: Optional[List[Optional[str]]] = None
+    if workers is not None and workers > 1 and len(events) > chunk_size:
+        recomputed_hashes = recompute_event_hashes(events, workers, chunk_size)
+
+    prev_hash = "genesis"
+
+    for i, event in enumerate(events):
         if event.prev_event_hash != prev_hash:
             raise GovernanceInvariantViolation(
                 f"Event chain broken at {event.event_id}"
             )
 
-        body = {
-            "event_id": event.event_id,
-            "event_type": event.event_type.value,
-            "tick": event.tick,
-            "prev_event_hash": event.prev_event_hash,
-            "payload_hash": event.payload_hash,
-            "actor": event.actor,
-            "timestamp": event.timestamp,
-            "state_before": event.state_before.value,
-            "state_after": event.state_after.value,
-        }
-
-        recomputed = deterministic_hash(body, "GovernanceEvent")
+        recomputed = (
+            recomputed_hashes[i] if recomputed_hashes is not None else None
+        ) or recompute_event_hash(event)
         if recomputed != event.event_hash:
             raise GovernanceInvariantViolation(
                 f"Event hash mismatch at {event.event_id}"
@@ -38,3 +85,84 @@ def assert_governance_invariants(events: list[GovernanceEvent]) -> None:
             raise GovernanceInvariantViolation(
                 "State continuity violated"
             )
+
+
+@dataclass(frozen=True)
+class InvariantCheckpoint:
+    """Verified prefix of an append-only event chain."""
+    verified_count: int = 0
+    last_event_hash: str = "genesis"
+    last_state_after: Optional[GovernanceState] = None
+
+
+class IncrementalInvariantVerifier:
+    """
+    Governance invariant checking against a verified-prefix checkpoint.
+
+    verify(events) validates only events appended since the last call;
+    observe(event) validates one next event at constant cost.
+    The verified prefix is trusted. Full audits should still call
+    assert_governance_invariants.
+    """
+
+    def __init__(self, checkpoint: Optional[InvariantCheckpoint] = None):
+        checkpoint = checkpoint or InvariantCheckpoint()
+        self.verified_count = checkpoint.verified_count
+        self.last_event_hash = checkpoint.last_event_hash
+        self.last_state_after = checkpoint.last_state_after
+
+    def checkpoint(self) -> InvariantCheckpoint:
+        return InvariantCheckpoint(
+            verified_count=self.verified_count,
+            last_event_hash=self.last_event_hash,
+            last_state_after=self.last_state_after,
+        )
+
+    def check(self, event: GovernanceEvent) -> None:
+        """Validate event as the next link without advancing."""
+        if event.prev_event_hash != self.last_event_hash:
+            raise GovernanceInvariantViolation(
+                f"Event chain broken at {event.event_id}"
+            )
+
+        if recompute_event_hash(event) != event.event_hash:
+            raise GovernanceInvariantViolation(
+                f"Event hash mismatch at {event.event_id}"
+            )
+
+        if (
+            self.last_state_after is not None
+            and event.state_before != self.last_state_after
+        ):
+            raise GovernanceInvariantViolation(
+                "State continuity violated"
+            )
+
+    def advance(self, event: GovernanceEvent) -> None:
+        """Move the checkpoint past an event that already passed check()."""
+        self.verified_count += 1
+        self.last_event_hash = event.event_hash
+        self.last_state_after = event.state_after
+
+    def observe(self, event: GovernanceEvent) -> None:
+        """Validate event as the next link and advance the checkpoint."""
+        self.check(event)
+        self.advance(event)
+
+    def verify(self, events: Sequence[GovernanceEvent]) -> None:
+        """Validate events[verified_count:] against the checkpoint."""
+        if len(events) < self.verified_count:
+            raise GovernanceInvariantViolation(
+                "Event chain shorter than verified prefix"
+            )
+
+        if (
+            self.verified_count
+            and events[self.verified_count - 1].event_hash != self.last_event_hash
+        ):
+            raise GovernanceInvariantViolation(
+                "Verified prefix altered"
+            )
+
+        for event in events[self.verified_count:]:
+            self.observe(event)
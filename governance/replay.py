@@ -0,0 +1,173 @@
+"""
+Deterministic replay of serialized governance event streams.
+
+Every event is decoded, its event_hash re-derived from the body, its
+prev_event_hash linked to the previous event and its state change checked
+against the transition table. Streams are consumed lazily, so replay works
+on logs larger than memory.
+
+Replay cannot re-check rules that depend on data outside the chain
+(refusal payloads, blocked workflows); those are enforced at transition
+time only.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from omega_core.core.exceptions import GovernanceInvariantViolation
+
+from .binary import is_event_archive, read_event_archive
+from .enums import GovernanceState
+from .events import GovernanceEvent, recompute_event_hash
+from .event_store import EventStore, SEGMENT_PREFIX, SEGMENT_SUFFIX
+from .state_machine import GovernanceStateMachine
+
+
+@dataclass(frozen=True)
+class ReplayState:
+    """Resumable replay position."""
+    current_state: GovernanceState = GovernanceState.OBSERVED
+    last_event_hash: str = "genesis"
+    event_count: int = 0
+
+
+EventSource = Union[str, os.PathLike, Iterable[Union[Dict[str, Any], GovernanceEvent]]]
+
+
+def _iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_event_records(source: EventSource) -> Iterator[GovernanceEvent]:
+    """
+    Decode an event source lazily.
+
+    source may be a JSONL file, a binary event archive, a
+    SegmentedFileEventStore directory, or any iterable of event dicts /
+    GovernanceEvent objects.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if os.path.isdir(path):
+            names = sorted(
+                n for n in os.listdir(path)
+                if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)
+            )
+            records: Iterable[Any] = (
+                record
+                for name in names
+                for record in _iter_jsonl(os.path.join(path, name))
+            )
+        elif is_event_archive(path):
+            records = read_event_archive(path)
+        else:
+            records = _iter_jsonl(path)
+    else:
+        records = source
+
+    for record in records:
+        if isinstance(record, GovernanceEvent):
+            yield record
+        else:
+            yield GovernanceEvent.from_dict(record)
+
+
+class ReplayEngine:
+    """
+    Rebuilds governance state by re-applying an event stream.
+
+    start resumes from a previously reached ReplayState (e.g. a snapshot);
+    the stream must then contain only the events after it. If sink is
+    given, every replayed event is appended to it.
+    """
+
+    def __init__(
+        self,
+        *,
+        start: Optional[ReplayState] = None,
+        sink: Optional[EventStore] = None,
+    ):
+        start = start or ReplayState()
+        self.current_state = start.current_state
+        self.last_event_hash = start.last_event_hash
+        self.event_count = start.event_count
+        self.sink = sink
+
+    @property
+    def state(self) -> ReplayState:
+        return ReplayState(
+            current_state=self.current_state,
+            last_event_hash=self.last_event_hash,
+            event_count=self.event_count,
+        )
+
+    def apply(
+        self,
+        event: GovernanceEvent,
+        recomputed_hash: Optional[str] = None,
+    ) -> None:
+        """
+        recomputed_hash is event's hash as re-derived by the caller (e.g.
+        recompute_event_hashes); never pass the recorded event_hash.
+        """
+        if event.prev_event_hash != self.last_event_hash:
+            raise GovernanceInvariantViolation(
+                f"Event chain broken at {event.event_id}"
+            )
+
+        recomputed = recomputed_hash or recompute_event_hash(event)
+        if recomputed != event.event_hash:
+            raise GovernanceInvariantViolation(
+                f"Event hash mismatch at {event.event_id}"
+            )
+
+        if event.state_before != self.current_state:
+            raise GovernanceInvariantViolation(
+                "State continuity violated"
+            )
+
+        if not GovernanceStateMachine._valid_event(
+            event.event_type, event.state_before, event.state_after
+        ):
+            raise GovernanceInvariantViolation(
+                f"Invalid transition {event.state_before} → {event.state_after} "
+                f"at {event.event_id}"
+            )
+
+        if self.sink is not None:
+            self.sink.append(event)
+
+        self.current_state = event.state_after
+        self.last_event_hash = event.event_hash
+        self.event_count += 1
+
+    def replay(self, source: EventSource) -> ReplayState:
+        for event in iter_event_records(source):
+            self.apply(event)
+        if self.sink is not None:
+            self.sink.flush()
+        return self.state
+
+    def to_state_machine(self, clock) -> GovernanceStateMachine:
+        """
+        State machine positioned at the replayed state.
+        Its events are the sink's contents (empty without a sink).
+        """
+        sm = GovernanceStateMachine(clock, event_store=self.sink)
+        sm.current_state = self.current_state
+        sm.last_event_hash = self.last_event_hash
+        return sm
+
+
+def replay_events(
+    source: EventSource,
+    *,
+    start: Optional[ReplayState] = None,
+) -> ReplayState:
+    """Replay source and return the reached state."""
+    return ReplayEngine(start=start).replay(source)
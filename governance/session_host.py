@@ -0,0 +1,186 @@
+"""
+Multi-session host: many governance state machines in one process.
+
+Sessions are routed by session id to one of `shards` shards, each with
+its own lock and LRU of resident state machines. A session's events live
+in its own SegmentedFileEventStore under directory/<session_id>/; when a
+shard exceeds its share of max_resident, the least recently used session
+is flushed, snapshotted and dropped, and reloaded from its snapshot on
+next use.
+
+Each resident session keeps its segment file open, so max_resident also
+bounds open file handles.
+"""
+
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from omega_core.core.clock import DeterministicClock
+
+from .event_store import FsyncPolicy, SegmentedFileEventStore
+from .events import GovernanceEvent
+from .snapshot import restore_state_machine, take_snapshot, write_snapshot
+from .state_machine import GovernanceStateMachine, TransitionSpec
+
+
+EVENTS_DIR = "events"
+SNAPSHOTS_DIR = "snapshots"
+
+# One plain path component: no separators and not "." or "..".
+_SESSION_ID = re.compile(r"(?!\.+\Z)[A-Za-z0-9_.-]{1,128}")
+
+
+class _Shard:
+    __slots__ = ("lock", "sessions", "loads", "evictions", "transitions")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions: "OrderedDict[str, GovernanceStateMachine]" = OrderedDict()
+        self.loads = 0
+        self.evictions = 0
+        self.transitions = 0
+
+
+class SessionHost:
+    """
+    Hosts governance sessions keyed by session id.
+
+    configure(sm) is called on every (re)load, e.g. to attach listeners.
+    State machines returned by session() are only valid until evicted;
+    route work through transition()/transition_many() instead of
+    holding on to them.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        shards: int = 16,
+        max_resident: int = 1024,
+        fsync_policy: FsyncPolicy = FsyncPolicy.BATCH,
+        group_commit_size: int = 64,
+        configure: Optional[Callable[[GovernanceStateMachine], None]] = None,
+    ):
+        if shards <= 0 or max_resident < shards:
+            raise ValueError("need shards > 0 and max_resident >= shards")
+        self.directory = directory
+        self.fsync_policy = fsync_policy
+        self.group_commit_size = group_commit_size
+        self.configure = configure
+        self._per_shard = max_resident // shards
+        self._shards = [_Shard() for _ in range(shards)]
+        os.makedirs(directory, exist_ok=True)
+
+    # ---- routing ----
+
+    def _shard(self, session_id: str) -> _Shard:
+        if not _SESSION_ID.fullmatch(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        return self._shards[zlib.crc32(session_id.encode("ascii")) % len(self._shards)]
+
+    def _session_dir(self, session_id: str) -> str:
+        return os.path.join(self.directory, session_id)
+
+    def _resident(self, shard: _Shard, session_id: str) -> GovernanceStateMachine:
+        # Caller holds shard.lock.
+        sm = shard.sessions.get(session_id)
+        if sm is not None:
+            shard.sessions.move_to_end(session_id)
+            return sm
+
+        session_dir = self._session_dir(session_id)
+        store = SegmentedFileEventStore(
+            os.path.join(session_dir, EVENTS_DIR),
+            group_commit_size=self.group_commit_size,
+            fsync_policy=self.fsync_policy,
+        )
+        sm = restore_state_machine(
+            DeterministicClock(session_id),
+            event_store=store,
+            snapshot_dir=os.path.join(session_dir, SNAPSHOTS_DIR),
+        )
+        if self.configure is not None:
+            self.configure(sm)
+        shard.sessions[session_id] = sm
+        shard.loads += 1
+
+        while len(shard.sessions) > self._per_shard:
+            evicted_id, evicted = shard.sessions.popitem(last=False)
+            self._persist(evicted_id, evicted)
+            shard.evictions += 1
+        return sm
+
+    def _persist(self, session_id: str, sm: GovernanceStateMachine) -> None:
+        sm.events.close()
+        if len(sm.events):
+            write_snapshot(
+                os.path.join(self._session_dir(session_id), SNAPSHOTS_DIR),
+                take_snapshot(sm),
+            )
+
+    # ---- API ----
+
+    def session(self, session_id: str) -> GovernanceStateMachine:
+        shard = self._shard(session_id)
+        with shard.lock:
+            return self._resident(shard, session_id)
+
+    def transition(self, session_id: str, **kwargs: Any) -> GovernanceEvent:
+        """GovernanceStateMachine.transition on the given session."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            event = self._resident(shard, session_id).transition(**kwargs)
+            shard.transitions += 1
+            return event
+
+    def transition_many(
+        self,
+        session_id: str,
+        specs: Iterable[TransitionSpec],
+    ) -> List[GovernanceEvent]:
+        shard = self._shard(session_id)
+        with shard.lock:
+            events = self._resident(shard, session_id).transition_many(specs)
+            shard.transitions += len(events)
+            return events
+
+    def evict(self, session_id: str) -> bool:
+        """Persist and drop a resident session; False if it was not resident."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            sm = shard.sessions.pop(session_id, None)
+            if sm is None:
+                return False
+            self._persist(session_id, sm)
+            shard.evictions += 1
+            return True
+
+    def close(self) -> None:
+        """Persist every resident session."""
+        for shard in self._shards:
+            with shard.lock:
+                while shard.sessions:
+                    self._persist(*shard.sessions.popitem(last=False))
+
+    def __enter__(self) -> "SessionHost":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        per_shard = []
+        for shard in self._shards:
+            with shard.lock:
+                per_shard.append(len(shard.sessions))
+        return {
+            "resident_sessions": sum(per_shard),
+            "resident_per_shard": per_shard,
+            "loads": sum(s.loads for s in self._shards),
+            "evictions": sum(s.evictions for s in self._shards),
+            "transitions": sum(s.transitions for s in self._shards),
+        }
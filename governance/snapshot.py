@@ -0,0 +1,248 @@
+"""
+Deterministic, hashed state-machine snapshots.
+
+A snapshot captures the governance state at a given event: state, last
+event hash, blocked workflows and event count. Its hash covers all of
+them, and last_event_hash chains it to the event it was taken at.
+Restoring loads the latest snapshot that verifies against the event
+store and replays only the tail.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from omega_core.core.canonical import register_canonical_fields
+from omega_core.core.hashing import deterministic_hash
+
+from .enums import GovernanceState
+from .events import GovernanceEvent
+from .event_store import EventStore
+from .replay import ReplayEngine, ReplayState
+from .state_machine import GovernanceStateMachine
+
+
+SNAPSHOT_PREFIX = "snapshot_"
+SNAPSHOT_SUFFIX = ".json"
+
+
+@register_canonical_fields
+@dataclass(frozen=True)
+class GovernanceSnapshot:
+    session_id: str
+    state: GovernanceState
+    last_event_hash: str
+    blocked_workflows: Tuple[str, ...]
+    event_count: int
+    snapshot_hash: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "state": self.state.value,
+            "last_event_hash": self.last_event_hash,
+            "blocked_workflows": list(self.blocked_workflows),
+            "event_count": self.event_count,
+            "snapshot_hash": self.snapshot_hash,
+        }
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "GovernanceSnapshot":
+        return GovernanceSnapshot(
+            session_id=d["session_id"],
+            state=GovernanceState(d["state"]),
+            last_event_hash=d["last_event_hash"],
+            blocked_workflows=tuple(d["blocked_workflows"]),
+            event_count=d["event_count"],
+            snapshot_hash=d["snapshot_hash"],
+        )
+
+    def replay_state(self) -> ReplayState:
+        return ReplayState(
+            current_state=self.state,
+            last_event_hash=self.last_event_hash,
+            event_count=self.event_count,
+        )
+
+
+def _snapshot_body(
+    *,
+    session_id: str,
+    state: GovernanceState,
+    last_event_hash: str,
+    blocked_workflows: Tuple[str, ...],
+    event_count: int,
+) -> Dict[str, Any]:
+    return {
+        "session_id": session_id,
+        "state": state.value,
+        "last_event_hash": last_event_hash,
+        "blocked_workflows": list(blocked_workflows),
+        "event_count": event_count,
+    }
+
+
+def create_snapshot(
+    *,
+    session_id: str,
+    state: GovernanceState,
+    last_event_hash: str,
+    blocked_workflows: List[str],
+    event_count: int,
+) -> GovernanceSnapshot:
+    blocked = tuple(blocked_workflows)
+    body = _snapshot_body(
+        session_id=session_id,
+        state=state,
+        last_event_hash=last_event_hash,
+        blocked_workflows=blocked,
+        event_count=event_count,
+    )
+    return GovernanceSnapshot(
+        session_id=session_id,
+        state=state,
+        last_event_hash=last_event_hash,
+        blocked_workflows=blocked,
+        event_count=event_count,
+        snapshot_hash=deterministic_hash(body, "GovernanceSnapshot"),
+    )
+
+
+def take_snapshot(sm: GovernanceStateMachine) -> GovernanceSnapshot:
+    view = sm.view()
+    return create_snapshot(
+        session_id=sm.clock.session_id,
+        state=view.state,
+        last_event_hash=view.last_event_hash,
+        blocked_workflows=view.blocked_workflows,
+        event_count=view.event_count,
+    )
+
+
+def verify_snapshot(
+    snapshot: GovernanceSnapshot,
+    events: Optional[EventStore] = None,
+) -> bool:
+    """
+    Re-derive snapshot_hash; with events, also require the snapshot to be
+    chained to the event at position event_count - 1.
+    """
+    body = _snapshot_body(
+        session_id=snapshot.session_id,
+        state=snapshot.state,
+        last_event_hash=snapshot.last_event_hash,
+        blocked_workflows=snapshot.blocked_workflows,
+        event_count=snapshot.event_count,
+    )
+    if deterministic_hash(body, "GovernanceSnapshot") != snapshot.snapshot_hash:
+        return False
+
+    if events is None:
+        return True
+    if snapshot.event_count == 0:
+        return snapshot.last_event_hash == "genesis"
+    if snapshot.event_count > len(events):
+        return False
+    anchor = events[snapshot.event_count - 1]
+    return (
+        anchor.event_hash == snapshot.last_event_hash
+        and anchor.state_after == snapshot.state
+    )
+
+
+def write_snapshot(directory: str, snapshot: GovernanceSnapshot) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(
+        directory,
+        f"{SNAPSHOT_PREFIX}{snapshot.event_count:012d}{SNAPSHOT_SUFFIX}",
+    )
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot.to_dict(), f, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_latest_snapshot(
+    directory: str,
+    events: Optional[EventStore] = None,
+    session_id: Optional[str] = None,
+) -> Optional[GovernanceSnapshot]:
+    """Newest snapshot in directory that verifies (against events if given)."""
+    if not os.path.isdir(directory):
+        return None
+
+    names = sorted(
+        (
+            n for n in os.listdir(directory)
+            if n.startswith(SNAPSHOT_PREFIX) and n.endswith(SNAPSHOT_SUFFIX)
+        ),
+        reverse=True,
+    )
+    for name in names:
+        try:
+            with open(os.path.join(directory, name)) as f:
+                snapshot = GovernanceSnapshot.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        if session_id is not None and snapshot.session_id != session_id:
+            continue
+        if verify_snapshot(snapshot, events):
+            return snapshot
+    return None
+
+
+class SnapshotPolicy:
+    """
+    State machine listener writing a snapshot every `every` events.
+    """
+
+    def __init__(self, sm: GovernanceStateMachine, directory: str, *, every: int):
+        if every <= 0:
+            raise ValueError("every must be positive")
+        self.sm = sm
+        self.directory = directory
+        self.every = every
+        sm.listeners.append(self)
+
+    def __call__(self, event: GovernanceEvent, event_count: int) -> None:
+        if event_count % self.every:
+            return
+        self.sm.events.flush()
+        write_snapshot(
+            self.directory,
+            create_snapshot(
+                session_id=self.sm.clock.session_id,
+                state=event.state_after,
+                last_event_hash=event.event_hash,
+                blocked_workflows=self.sm.view().blocked_workflows,
+                event_count=event_count,
+            ),
+        )
+
+
+def restore_state_machine(
+    clock,
+    *,
+    event_store: EventStore,
+    snapshot_dir: str,
+) -> GovernanceStateMachine:
+    """
+    Rehydrate from the latest verified snapshot plus a replay of the tail.
+    Falls back to a full replay when no snapshot verifies.
+    """
+    snapshot = load_latest_snapshot(snapshot_dir, event_store, clock.session_id)
+    start = snapshot.replay_state() if snapshot is not None else ReplayState()
+
+    engine = ReplayEngine(start=start)
+    engine.replay(event_store[start.event_count:])
+
+    sm = GovernanceStateMachine(clock, event_store=event_store)
+    sm.current_state = engine.current_state
+    sm.last_event_hash = engine.last_event_hash
+    if snapshot is not None:
+        sm.blocked_workflows = list(snapshot.blocked_workflows)
+    return sm
@@ -1,22 +1,264 @@
-from typing import List, Dict, Any
+import threading
+from collections.abc import MutableSequence
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 
 from omega_core.core.exceptions import GovernanceInvariantViolation
+from omega_core.core.hashing import deterministic_hash
 from .enums import GovernanceState, GovernanceEventType
-from .events import GovernanceEvent, create_governance_event
+from .events import (
+    GovernanceEvent,
+    build_governance_event,
+    create_governance_event,
+)
+from .event_store import EventStore, InMemoryEventStore
+from .invariants import IncrementalInvariantVerifier
+
+
+# Event types recorded without a state change (state_after == state_before).
+# Allowed in any non-terminal state.
+STATE_PRESERVING_EVENT_TYPES = frozenset({
+    GovernanceEventType.THREAT_DETECTED,
+    GovernanceEventType.WORKFLOW_ACKNOWLEDGED,
+    GovernanceEventType.WORKFLOW_EXPIRED,
+    GovernanceEventType.WORKFLOW_ESCALATED,
+})
+
+
+@dataclass(frozen=True)
+class TransitionSpec:
+    """One transition request for GovernanceStateMachine.transition_many."""
+    event_type: GovernanceEventType
+    tick: int
+    payload: Dict[str, Any]
+    actor: str
+    target_state: GovernanceState
+
+
+@dataclass(frozen=True)
+class GovernanceStateView:
+    """
+    Immutable read snapshot of a state machine, consistent as of one commit.
+    The first event_count events of sm.events are the chain it describes.
+    """
+    state: GovernanceState
+    last_event_hash: str
+    event_count: int
+    blocked_workflows: Tuple[str, ...]
+
+    def is_blocked(self, workflow_id: str) -> bool:
+        return workflow_id in self.blocked_workflows
+
+
+class BlockedWorkflows(MutableSequence):
+    """
+    List-like, live handle on a state machine's blocked workflows.
+
+    Reads come from the current view; every mutation takes the writer
+    lock and publishes a new view, so list-style callers
+    (sm.blocked_workflows.append(...)) stay atomic with transitions.
+    Compares equal to a list with the same items.
+    """
+
+    __slots__ = ("_sm",)
+
+    def __init__(self, sm: "GovernanceStateMachine"):
+        self._sm = sm
+
+    def _items(self) -> Tuple[str, ...]:
+        return self._sm.view().blocked_workflows
+
+    def _mutate(self, change: Callable[[List[str]], Any]) -> Any:
+        sm = self._sm
+        with sm.write_lock:
+            blocked = list(sm._view.blocked_workflows)
+            result = change(blocked)
+            sm._view = replace(sm._view, blocked_workflows=tuple(blocked))
+            return result
+
+    # ---- reads ----
+
+    def __len__(self) -> int:
+        return len(self._items())
+
+    def __getitem__(self, index):
+        items = self._items()
+        return list(items[index]) if isinstance(index, slice) else items[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items())
+
+    def __contains__(self, workflow_id: object) -> bool:
+        return workflow_id in self._items()
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._items())
+
+    def index(self, workflow_id: str, *args: int) -> int:
+        return self._items().index(workflow_id, *args)
+
+    def count(self, workflow_id: str) -> int:
+        return self._items().count(workflow_id)
+
+    def copy(self) -> List[str]:
+        return list(self._items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BlockedWorkflows):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self._items()) == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self._items()))
+
+    # ---- writes ----
+
+    def __setitem__(self, index, value) -> None:
+        def change(blocked: List[str]) -> None:
+            blocked[index] = value
+        self._mutate(change)
+
+    def __delitem__(self, index) -> None:
+        def change(blocked: List[str]) -> None:
+            del blocked[index]
+        self._mutate(change)
+
+    def insert(self, index: int, workflow_id: str) -> None:
+        self._mutate(lambda blocked: blocked.insert(index, workflow_id))
+
+    def append(self, workflow_id: str) -> None:
+        self._mutate(lambda blocked: blocked.append(workflow_id))
+
+    def extend(self, workflow_ids: Iterable[str]) -> None:
+        workflow_ids = list(workflow_ids)
+        self._mutate(lambda blocked: blocked.extend(workflow_ids))
+
+    def remove(self, workflow_id: str) -> None:
+        self._mutate(lambda blocked: blocked.remove(workflow_id))
+
+    def pop(self, index: int = -1) -> str:
+        return self._mutate(lambda blocked: blocked.pop(index))
+
+    def clear(self) -> None:
+        self._mutate(lambda blocked: blocked.clear())
+
+    def reverse(self) -> None:
+        self._mutate(lambda blocked: blocked.reverse())
+
+    def sort(self, **kwargs: Any) -> None:
+        self._mutate(lambda blocked: blocked.sort(**kwargs))
 
 
 class GovernanceStateMachine:
     """
     Canonical governance state machine.
     All truth derives from events.
+
+    A non-empty event_store rehydrates current_state and last_event_hash
+    from its tail. blocked_workflows is not part of the event chain and
+    starts empty; it is a list-like BlockedWorkflows whose mutations, like
+    block_workflow/unblock_workflow, go through write_lock.
+
+    Writers (transitions, blocking) serialize on write_lock, which callers
+    may also hold to make several writes atomic. Each commit publishes a
+    new GovernanceStateView; readers call view() and never take the lock,
+    so they see either the previous or the next state in full, never a mix.
+
+    An optional IncrementalInvariantVerifier checks each event before it is
+    appended; a rejected event is never committed.
+
+    listeners are called as listener(event, event_count) after each event
+    is committed.
     """
 
-    def __init__(self, clock):
+    def __init__(
+        self,
+        clock,
+        event_store: Optional[EventStore] = None,
+        verifier: Optional[IncrementalInvariantVerifier] = None,
+    ):
         self.clock = clock
-        self.current_state = GovernanceState.OBSERVED
-        self.events: List[GovernanceEvent] = []
-        self.last_event_hash = "genesis"
-        self.blocked_workflows: List[str] = []
+        self.events: EventStore = (
+            event_store if event_store is not None else InMemoryEventStore()
+        )
+        self.verifier = verifier
+        self.listeners: List[Callable[[GovernanceEvent, int], None]] = []
+        # Reentrant so listeners and compound writers can nest writes.
+        self.write_lock = threading.RLock()
+        self._blocked = BlockedWorkflows(self)
+
+        last = self.events.last()
+        self._view = GovernanceStateView(
+            state=last.state_after if last is not None else GovernanceState.OBSERVED,
+            last_event_hash=last.event_hash if last is not None else "genesis",
+            event_count=len(self.events),
+            blocked_workflows=(),
+        )
+
+        if self.verifier is not None:
+            self.verifier.verify(self.events)
+
+    # ---- reads ----
+
+    def view(self) -> GovernanceStateView:
+        """Current read snapshot; never blocks."""
+        return self._view
+
+    @property
+    def current_state(self) -> GovernanceState:
+        return self._view.state
+
+    @current_state.setter
+    def current_state(self, state: GovernanceState) -> None:
+        with self.write_lock:
+            self._view = replace(self._view, state=state)
+
+    @property
+    def last_event_hash(self) -> str:
+        return self._view.last_event_hash
+
+    @last_event_hash.setter
+    def last_event_hash(self, event_hash: str) -> None:
+        with self.write_lock:
+            self._view = replace(self._view, last_event_hash=event_hash)
+
+    @property
+    def blocked_workflows(self) -> BlockedWorkflows:
+        return self._blocked
+
+    @blocked_workflows.setter
+    def blocked_workflows(self, workflow_ids: Iterable[str]) -> None:
+        with self.write_lock:
+            self._view = replace(
+                self._view, blocked_workflows=tuple(dict.fromkeys(workflow_ids))
+            )
+
+    # ---- writes ----
+
+    def block_workflow(self, workflow_id: str) -> bool:
+        """Block closure on workflow_id; False if it was already blocking."""
+        with self.write_lock:
+            blocked = self._view.blocked_workflows
+            if workflow_id in blocked:
+                return False
+            self._view = replace(self._view, blocked_workflows=blocked + (workflow_id,))
+            return True
+
+    def unblock_workflow(self, workflow_id: str) -> bool:
+        """Lift the closure block for workflow_id; False if it was not blocking."""
+        with self.write_lock:
+            blocked = self._view.blocked_workflows
+            if workflow_id not in blocked:
+                return False
+            self._view = replace(
+                self._view,
+                blocked_workflows=tuple(w for w in blocked if w != workflow_id),
+            )
+            return True
 
     def transition(
         self,
@@ -28,42 +270,184 @@ class GovernanceStateMachine:
         target_state: GovernanceState,
     ) -> GovernanceEvent:
 
-        if target_state == GovernanceState.CLOSED and self.blocked_workflows:
-            raise GovernanceInvariantViolation(
-                f"CLOSED blocked by workflows: {self.blocked_workflows}"
+        with self.write_lock:
+            return self._transition_locked(
+                event_type=event_type,
+                tick=tick,
+                payload=payload,
+                actor=actor,
+                target_state=target_state,
             )
 
-        if (
-            event_type == GovernanceEventType.DECISION_MADE
-            and payload.get("decision") == "refuse"
-            and self.current_state != GovernanceState.ASSESSED
-        ):
-            raise GovernanceInvariantViolation(
-                "Refusal requires ASSESSED state"
-            )
-
-        if not self._valid_transition(self.current_state, target_state):
-            raise GovernanceInvariantViolation(
-                f"Invalid transition {self.current_state} → {target_state}"
-            )
+    def _transition_locked(
+        self,
+        *,
+        event_type: GovernanceEventType,
+        tick: int,
+        payload: Dict[str, Any],
+        actor: str,
+        target_state: GovernanceState,
+    ) -> GovernanceEvent:
+        view = self._view
+        self._check_transition(
+            view,
+            event_type=event_type,
+            payload=payload,
+            target_state=target_state,
+        )
 
         event = create_governance_event(
             event_type=event_type,
             tick=tick,
-            prev_event_hash=self.last_event_hash,
+            prev_event_hash=view.last_event_hash,
             payload=payload,
             actor=actor,
-            state_before=self.current_state,
+            state_before=view.state,
             state_after=target_state,
             clock=self.clock,
         )
 
+        if self.verifier is not None:
+            self.verifier.check(event)
+
         self.events.append(event)
-        self.last_event_hash = event.event_hash
-        self.current_state = target_state
+        if self.verifier is not None:
+            self.verifier.advance(event)
+        self._publish(event.event_hash, target_state, 1)
+
+        self._notify([event])
 
         return event
 
+    def transition_many(
+        self,
+        specs: Iterable[TransitionSpec],
+    ) -> List[GovernanceEvent]:
+        """
+        Apply a batch of transitions atomically.
+
+        The whole batch is validated against the transition rules and the
+        closure block before any event is built; payload hashes are computed
+        once per distinct payload object; events are committed together.
+        On any violation nothing is appended and state is unchanged.
+        """
+        specs = list(specs)
+        with self.write_lock:
+            return self._transition_many_locked(specs)
+
+    def _transition_many_locked(self, specs: List[TransitionSpec]) -> List[GovernanceEvent]:
+        view = self._view
+        state = view.state
+        for spec in specs:
+            self._check_transition(
+                replace(view, state=state),
+                event_type=spec.event_type,
+                payload=spec.payload,
+                target_state=spec.target_state,
+            )
+            state = spec.target_state
+
+        payload_hashes: Dict[int, str] = {}
+        for spec in specs:
+            if id(spec.payload) not in payload_hashes:
+                payload_hashes[id(spec.payload)] = deterministic_hash(
+                    spec.payload, "EventPayload"
+                )
+
+        batch_verifier = (
+            IncrementalInvariantVerifier(self.verifier.checkpoint())
+            if self.verifier is not None
+            else None
+        )
+
+        events: List[GovernanceEvent] = []
+        prev_hash = view.last_event_hash
+        state = view.state
+        for spec in specs:
+            event = build_governance_event(
+                event_type=spec.event_type,
+                tick=spec.tick,
+                prev_event_hash=prev_hash,
+                payload_hash=payload_hashes[id(spec.payload)],
+                actor=spec.actor,
+                state_before=state,
+                state_after=spec.target_state,
+                clock=self.clock,
+            )
+            if batch_verifier is not None:
+                batch_verifier.observe(event)
+            events.append(event)
+            prev_hash = event.event_hash
+            state = spec.target_state
+
+        if not events:
+            return events
+
+        self.events.extend(events)
+        if self.verifier is not None:
+            for event in events:
+                self.verifier.advance(event)
+        self._publish(prev_hash, state, len(events))
+
+        self._notify(events)
+
+        return events
+
+    def _publish(self, last_event_hash: str, state: GovernanceState, added: int) -> None:
+        view = self._view
+        self._view = GovernanceStateView(
+            state=state,
+            last_event_hash=last_event_hash,
+            event_count=view.event_count + added,
+            blocked_workflows=view.blocked_workflows,
+        )
+
+    def _notify(self, committed: List[GovernanceEvent]) -> None:
+        if not self.listeners:
+            return
+        first_count = self._view.event_count - len(committed) + 1
+        for offset, event in enumerate(committed):
+            for listener in self.listeners:
+                listener(event, first_count + offset)
+
+    def _check_transition(
+        self,
+        view: GovernanceStateView,
+        *,
+        event_type: GovernanceEventType,
+        payload: Dict[str, Any],
+        target_state: GovernanceState,
+    ) -> None:
+        current_state = view.state
+        if target_state == GovernanceState.CLOSED and view.blocked_workflows:
+            raise GovernanceInvariantViolation(
+                f"CLOSED blocked by workflows: {list(view.blocked_workflows)}"
+            )
+
+        if (
+            event_type == GovernanceEventType.DECISION_MADE
+            and payload.get("decision") == "refuse"
+            and current_state != GovernanceState.ASSESSED
+        ):
+            raise GovernanceInvariantViolation(
+                "Refusal requires ASSESSED state"
+            )
+
+        if not self._valid_event(event_type, current_state, target_state):
+            raise GovernanceInvariantViolation(
+                f"Invalid transition {current_state} → {target_state}"
+            )
+
+    @staticmethod
+    def _valid_event(
+        event_type: GovernanceEventType,
+        from_state: GovernanceState,
+        to_state: GovernanceState,
+    ) -> bool:
+        if event_type in STATE_PRESERVING_EVENT_TYPES:
+            return from_state == to_state and from_state != GovernanceState.CLOSED
+        return GovernanceStateMachine._valid_transition(from_state, to_state)
+
     @staticmethod
     def _valid_transition(
         from_state: GovernanceState,
@@ -5,3 +5,5 @@ Minimal proof bundle generation for audits and external review.
 """
 
 from .bundle import *
+from .merkle import *
+from .columnar import *
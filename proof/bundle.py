@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from omega_core.core.canonical import register_canonical_fields
 from omega_core.core.hashing import deterministic_hash
 from omega_core.core.constants import HASH_REFERENCE_LENGTH
 from omega_core.governance.events import GovernanceEvent
 from omega_core.evidence.models import NegativeAuthorityProof
 
+from .merkle import MerkleAccumulator
 
+
+@register_canonical_fields
 @dataclass
 class MinimalProofBundle:
     """
@@ -29,8 +33,10 @@ class MinimalProofBundle:
 
     bundle_hash: str
 
+    event_chain_merkle: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        d = {
             "governance_spec": self.governance_spec,
             "governance_spec_hash": self.governance_spec_hash,
             "admissibility_report": self.admissibility_report,
@@ -42,6 +48,83 @@ class MinimalProofBundle:
             "invariant_proof_subset": self.invariant_proof_subset,
             "bundle_hash": self.bundle_hash,
         }
+        # Only bundles exported with a merkle_accumulator carry the key, so
+        # other bundles keep their original serialized shape.
+        if self.event_chain_merkle is not None:
+            d["event_chain_merkle"] = self.event_chain_merkle
+        return d
+
+
+def _claim_body(claim: Any) -> Any:
+    return claim.to_dict() if hasattr(claim, "to_dict") else claim
+
+
+def derive_authority_claim_id(claim: Any) -> str:
+    """
+    Claim ID as recorded in proof bundles: an explicit claim_id, else
+    claim_<hash prefix> over the claim's canonical form.
+    """
+    if hasattr(claim, "claim_id"):
+        return str(claim.claim_id)
+    return content_authority_claim_id(claim)
+
+
+def content_authority_claim_id(claim: Any) -> str:
+    """
+    Claim ID re-derived from the claim's content alone.
+    Explicit claim_ids cannot be re-derived this way.
+    """
+    cid = deterministic_hash(_claim_body(claim), "AuthorityClaim")[:HASH_REFERENCE_LENGTH]
+    return f"claim_{cid}"
+
+
+def _bundle_body(
+    *,
+    governance_spec_hash: str,
+    admissibility_hash: str,
+    authority_claim_ids: List[str],
+    negative_authority_proof_hash: str,
+    event_chain_count: int,
+    event_chain_merkle: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    # Bundle hash ties together the minimal invariant backbone
+    body = {
+        "governance_spec_hash": governance_spec_hash,
+        "admissibility_hash": admissibility_hash,
+        "authority_claim_ids": authority_claim_ids,
+        "negative_authority_proof_hash": negative_authority_proof_hash,
+        "event_chain_count": event_chain_count,
+    }
+    if event_chain_merkle is not None:
+        body["event_chain_root"] = event_chain_merkle["root"]
+        body["event_chain_size"] = event_chain_merkle["tree_size"]
+    return body
+
+
+def recompute_bundle_hash(bundle: Dict[str, Any]) -> str:
+    """
+    Re-derive bundle_hash from a MinimalProofBundle.to_dict(), recomputing
+    the spec, admissibility and negative authority proof hashes from their
+    content rather than trusting the recorded ones.
+    """
+    proof = bundle["negative_authority_proof"]
+    proof_hash = deterministic_hash(
+        {"tick": proof["tick"], "asserted_absences": proof["asserted_absences"]},
+        "NegativeAuthorityProof",
+    )
+    return deterministic_hash(
+        _bundle_body(
+            governance_spec_hash=deterministic_hash(bundle["governance_spec"], "GovernanceSpec"),
+            admissibility_hash=deterministic_hash(
+                bundle["admissibility_report"], "AdmissibilityReport"
+            ),
+            authority_claim_ids=bundle["authority_claim_ids"],
+            negative_authority_proof_hash=proof_hash,
+            event_chain_count=len(bundle["event_chain_slice"]),
+            event_chain_merkle=bundle.get("event_chain_merkle"),
+        ),
+        "MinimalProofBundle",
+    )
 
 
 def export_minimal_proof_bundle(
@@ -52,6 +135,7 @@ def export_minimal_proof_bundle(
     negative_authority_proof: NegativeAuthorityProof,
     invariant_proofs: Optional[List[Dict[str, Any]]] = None,
     event_slice_size: int = 5,
+    merkle_accumulator: Optional[MerkleAccumulator] = None,
 ) -> MinimalProofBundle:
     """
     Export a deterministic minimal proof bundle.
@@ -59,6 +143,8 @@ def export_minimal_proof_bundle(
     Notes:
     - Admissibility report here is a derived view (non-canonical).
     - Events are canonical truth; this bundle is an export artifact.
+    - With a merkle_accumulator over governance_events, the bundle records
+      the chain root and an inclusion proof for every sliced event.
     """
 
     # Governance spec hash (deterministic)
@@ -72,7 +158,27 @@ def export_minimal_proof_bundle(
     admissibility_hash = deterministic_hash(admissibility_report, "AdmissibilityReport")
 
     # Export last N events as slice for minimal audit trail
-    chain_slice = [e.to_dict() for e in governance_events[-event_slice_size:]]
+    sliced_events = governance_events[-event_slice_size:]
+    chain_slice = [e.to_dict() for e in sliced_events]
+
+    event_chain_merkle: Optional[Dict[str, Any]] = None
+    if merkle_accumulator is not None:
+        tree_size = len(governance_events)
+        if merkle_accumulator.size < tree_size:
+            raise ValueError("Merkle accumulator does not cover the event chain")
+        first_index = tree_size - len(sliced_events)
+        proofs = [
+            merkle_accumulator.inclusion_proof(first_index + i, tree_size)
+            for i in range(len(sliced_events))
+        ]
+        for event, proof in zip(sliced_events, proofs):
+            if proof.event_hash != event.event_hash:
+                raise ValueError("Merkle accumulator does not match the event chain")
+        event_chain_merkle = {
+            "tree_size": tree_size,
+            "root": merkle_accumulator.root(tree_size),
+            "slice_inclusion_proofs": [p.to_dict() for p in proofs],
+        }
 
     # Normalize authority claims
     claims_data: List[Dict[str, Any]] = []
@@ -81,22 +187,19 @@ def export_minimal_proof_bundle(
     for claim in authority_claims:
         claim_dict = claim.to_dict() if hasattr(claim, "to_dict") else claim
         claims_data.append(claim_dict)
-
-        if hasattr(claim, "claim_id"):
-            claim_ids.append(str(claim.claim_id))
-        else:
-            cid = deterministic_hash(claim_dict, "AuthorityClaim")[:HASH_REFERENCE_LENGTH]
-            claim_ids.append(f"claim_{cid}")
-
-    # Bundle hash ties together the minimal invariant backbone
-    bundle_body = {
-        "governance_spec_hash": governance_spec_hash,
-        "admissibility_hash": admissibility_hash,
-        "authority_claim_ids": claim_ids,
-        "negative_authority_proof_hash": negative_authority_proof.proof_hash,
-        "event_chain_count": len(chain_slice),
-    }
-    bundle_hash = deterministic_hash(bundle_body, "MinimalProofBundle")
+        claim_ids.append(derive_authority_claim_id(claim))
+
+    bundle_hash = deterministic_hash(
+        _bundle_body(
+            governance_spec_hash=governance_spec_hash,
+            admissibility_hash=admissibility_hash,
+            authority_claim_ids=claim_ids,
+            negative_authority_proof_hash=negative_authority_proof.proof_hash,
+            event_chain_count=len(chain_slice),
+            event_chain_merkle=event_chain_merkle,
+        ),
+        "MinimalProofBundle",
+    )
 
     return MinimalProofBundle(
         governance_spec=governance_spec,
@@ -109,4 +212,5 @@ def export_minimal_proof_bundle(
         event_chain_slice=chain_slice,
         invariant_proof_subset=invariant_proofs,
         bundle_hash=bundle_hash,
+        event_chain_merkle=event_chain_merkle,
     )
@@ -0,0 +1,238 @@
+"""
+Columnar export of governance history for analytics (Parquet / Arrow IPC).
+
+Event chains, evidence manifests and workflow records are streamed in
+batches of batch_size rows, so a chain is never materialized in full.
+Enum-valued columns are dictionary-encoded and sha256 digests are stored
+as fixed_size_binary(32); values that are not digests (e.g. the
+"genesis" prev_event_hash) become null.
+
+pyarrow is optional. Column batching (iter_*_columns) is pure Python and
+always available; the writers raise ImportError without pyarrow.
+Exports are for analysis only: they drop payloads and evidence_data and
+are not verifiable artifacts.
+"""
+
+from enum import Enum
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple,
+)
+
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.governance.replay import EventSource, iter_event_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = pa_ipc = pq = None
+
+
+DEFAULT_BATCH_SIZE = 65536
+
+Columns = Dict[str, List[Any]]
+
+
+class ColumnarFormat(Enum):
+    PARQUET = "parquet"
+    ARROW_IPC = "arrow"
+
+
+def _digest(value: Optional[str]) -> Optional[bytes]:
+    if value is None or len(value) != 64:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+# (column, kind, extractor); kind is one of
+# "string", "enum", "int", "bool", "digest".
+ColumnSpec = Tuple[str, str, Callable[[Any], Any]]
+
+EVENT_COLUMNS: Sequence[ColumnSpec] = (
+    ("event_id", "string", lambda e: e.event_id),
+    ("event_type", "enum", lambda e: e.event_type.value),
+    ("tick", "int", lambda e: e.tick),
+    ("prev_event_hash", "digest", lambda e: _digest(e.prev_event_hash)),
+    ("payload_hash", "digest", lambda e: _digest(e.payload_hash)),
+    ("actor", "enum", lambda e: e.actor),
+    ("timestamp", "string", lambda e: e.timestamp),
+    ("state_before", "enum", lambda e: e.state_before.value),
+    ("state_after", "enum", lambda e: e.state_after.value),
+    ("event_hash", "digest", lambda e: _digest(e.event_hash)),
+)
+
+EVIDENCE_COLUMNS: Sequence[ColumnSpec] = (
+    ("evidence_kind", "enum", lambda v: v.evidence_kind.value),
+    ("evidence_ref", "string", lambda v: v.evidence_ref),
+    ("evidence_hash", "digest", lambda v: _digest(v.evidence_hash)),
+    ("evidence_scope", "enum", lambda v: v.evidence_scope.value),
+    ("generation_method", "enum", lambda v: v.generation_method),
+)
+
+# Workflow records are read through to_dict(), so any workflow type with
+# these fields exports.
+WORKFLOW_COLUMNS: Sequence[ColumnSpec] = (
+    ("tick", "int", lambda w: w["tick"]),
+    ("event_hash", "digest", lambda w: _digest(w["event_hash"])),
+    ("ack_deadline_policy", "enum", lambda w: w["ack_deadline_policy"]),
+    ("ack_deadline_value", "int", lambda w: w["ack_deadline_value"]),
+    ("escalation_rule", "enum", lambda w: w["escalation_rule"]),
+    ("status", "enum", lambda w: _enum_value(w["status"])),
+    ("acknowledger", "string", lambda w: w["acknowledger"]),
+    ("ack_timestamp", "string", lambda w: w["ack_timestamp"]),
+    ("workflow_hash", "digest", lambda w: _digest(w["workflow_hash"])),
+    ("blocks_closure", "bool", lambda w: w["blocks_closure"]),
+)
+
+
+def _iter_columns(
+    rows: Iterable[Any],
+    spec: Sequence[ColumnSpec],
+    batch_size: int,
+) -> Iterator[Columns]:
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    extractors = [(name, extract) for name, _, extract in spec]
+    batch: Columns = {name: [] for name, _ in extractors}
+    size = 0
+    for row in rows:
+        for name, extract in extractors:
+            batch[name].append(extract(row))
+        size += 1
+        if size == batch_size:
+            yield batch
+            batch = {name: [] for name, _ in extractors}
+            size = 0
+    if size:
+        yield batch
+
+
+def iter_event_columns(
+    source: EventSource,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Columns]:
+    """Column batches for any event source accepted by iter_event_records."""
+    return _iter_columns(iter_event_records(source), EVENT_COLUMNS, batch_size)
+
+
+def iter_evidence_columns(
+    evidence: Iterable[VerifiableEvidence],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Columns]:
+    return _iter_columns(evidence, EVIDENCE_COLUMNS, batch_size)
+
+
+def iter_workflow_columns(
+    workflows: Iterable[Any],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Columns]:
+    return _iter_columns((w.to_dict() for w in workflows), WORKFLOW_COLUMNS, batch_size)
+
+
+# ---- pyarrow ----
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("columnar export requires pyarrow (pip install pyarrow)")
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        "string": pa.string(),
+        "enum": pa.dictionary(pa.int32(), pa.string()),
+        "int": pa.int64(),
+        "bool": pa.bool_(),
+        "digest": pa.binary(32),
+    }[kind]
+
+
+def arrow_schema(spec: Sequence[ColumnSpec]) -> Any:
+    """pyarrow schema for EVENT_COLUMNS, EVIDENCE_COLUMNS or WORKFLOW_COLUMNS."""
+    _require_pyarrow()
+    return pa.schema([pa.field(name, _arrow_type(kind)) for name, kind, _ in spec])
+
+
+def _record_batches(batches: Iterable[Columns], schema: Any) -> Iterator[Any]:
+    for columns in batches:
+        yield pa.record_batch(
+            [pa.array(columns[field.name], type=field.type) for field in schema],
+            schema=schema,
+        )
+
+
+def _write(
+    path: str,
+    batches: Iterable[Columns],
+    spec: Sequence[ColumnSpec],
+    fmt: ColumnarFormat,
+) -> int:
+    _require_pyarrow()
+    schema = arrow_schema(spec)
+    rows = 0
+    if fmt == ColumnarFormat.PARQUET:
+        writer = pq.ParquetWriter(path, schema)
+    else:
+        writer = pa_ipc.new_file(path, schema)
+    try:
+        for batch in _record_batches(batches, schema):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+
+def export_events(
+    path: str,
+    source: EventSource,
+    *,
+    fmt: ColumnarFormat = ColumnarFormat.PARQUET,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Stream an event source to path; returns the number of rows written."""
+    return _write(path, iter_event_columns(source, batch_size=batch_size), EVENT_COLUMNS, fmt)
+
+
+def export_evidence(
+    path: str,
+    evidence: Iterable[VerifiableEvidence],
+    *,
+    fmt: ColumnarFormat = ColumnarFormat.PARQUET,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    return _write(
+        path, iter_evidence_columns(evidence, batch_size=batch_size), EVIDENCE_COLUMNS, fmt
+    )
+
+
+def export_workflows(
+    path: str,
+    workflows: Iterable[Any],
+    *,
+    fmt: ColumnarFormat = ColumnarFormat.PARQUET,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    return _write(
+        path, iter_workflow_columns(workflows, batch_size=batch_size), WORKFLOW_COLUMNS, fmt
+    )
+
+
+def event_table(source: EventSource, *, batch_size: int = DEFAULT_BATCH_SIZE) -> Any:
+    """In-memory pyarrow Table of an event source, e.g. for .to_pandas() or duckdb."""
+    _require_pyarrow()
+    schema = arrow_schema(EVENT_COLUMNS)
+    return pa.Table.from_batches(
+        list(_record_batches(iter_event_columns(source, batch_size=batch_size), schema)),
+        schema=schema,
+    )
@@ -0,0 +1,198 @@
+"""
+Merkle accumulator over governance event hashes.
+
+Tree hashing follows RFC 6962 / RFC 9162 (SHA-256, 0x00 leaf prefix,
+0x01 node prefix), so inclusion and consistency proofs are O(log n) and
+can be checked without the chain. Leaves are the raw 32-byte digests of
+GovernanceEvent.event_hash.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from omega_core.core.canonical import register_canonical_fields
+from omega_core.governance.events import GovernanceEvent
+
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def merkle_leaf_hash(event_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(event_hash)).digest()
+
+
+def merkle_node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    # Largest power of two strictly smaller than n (n > 1).
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+@register_canonical_fields
+@dataclass(frozen=True)
+class InclusionProof:
+    leaf_index: int
+    tree_size: int
+    event_hash: str
+    path: List[str]
+    root: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "leaf_index": self.leaf_index,
+            "tree_size": self.tree_size,
+            "event_hash": self.event_hash,
+            "path": list(self.path),
+            "root": self.root,
+        }
+
+
+@register_canonical_fields
+@dataclass(frozen=True)
+class ConsistencyProof:
+    first_size: int
+    second_size: int
+    path: List[str]
+    first_root: str
+    second_root: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "first_size": self.first_size,
+            "second_size": self.second_size,
+            "path": list(self.path),
+            "first_root": self.first_root,
+            "second_root": self.second_root,
+        }
+
+
+class MerkleAccumulator:
+    """
+    Incrementally maintained Merkle tree over event hashes.
+
+    Stores every complete aligned subtree hash, so append is O(log n)
+    and any historical root or proof needs O(log n) hash operations.
+    Can be registered as a GovernanceStateMachine listener.
+    """
+
+    def __init__(self):
+        # levels[h][i]: hash of leaves [i * 2**h, (i + 1) * 2**h)
+        self._levels: List[List[bytes]] = [[]]
+        self._event_hashes: List[str] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._levels[0])
+
+    def append(self, event_hash: str) -> int:
+        """Append a leaf; returns its index."""
+        index = self.size
+        self._event_hashes.append(event_hash)
+        node = merkle_leaf_hash(event_hash)
+        level = 0
+        position = index
+        while True:
+            self._levels[level].append(node)
+            if position % 2 == 0:
+                break
+            node = merkle_node_hash(self._levels[level][position - 1], node)
+            level += 1
+            position //= 2
+            if level == len(self._levels):
+                self._levels.append([])
+        return index
+
+    def extend(self, event_hashes) -> None:
+        for event_hash in event_hashes:
+            self.append(event_hash)
+
+    def __call__(self, event: GovernanceEvent, event_count: int) -> None:
+        self.append(event.event_hash)
+
+    # ---- tree hashes ----
+
+    def _subtree(self, lo: int, hi: int) -> bytes:
+        n = hi - lo
+        if n & (n - 1) == 0 and lo % n == 0:
+            return self._levels[n.bit_length() - 1][lo // n]
+        k = _split(n)
+        return merkle_node_hash(self._subtree(lo, lo + k), self._subtree(lo + k, hi))
+
+    def root(self, tree_size: Optional[int] = None) -> str:
+        tree_size = self.size if tree_size is None else tree_size
+        self._check_size(tree_size)
+        if tree_size == 0:
+            return EMPTY_ROOT
+        return self._subtree(0, tree_size).hex()
+
+    def _check_size(self, tree_size: int) -> None:
+        if not 0 <= tree_size <= self.size:
+            raise ValueError(f"tree_size {tree_size} outside 0..{self.size}")
+
+    # ---- proofs ----
+
+    def inclusion_proof(
+        self,
+        leaf_index: int,
+        tree_size: Optional[int] = None,
+    ) -> InclusionProof:
+        tree_size = self.size if tree_size is None else tree_size
+        self._check_size(tree_size)
+        if not 0 <= leaf_index < tree_size:
+            raise ValueError(f"leaf_index {leaf_index} outside tree of size {tree_size}")
+
+        path: List[bytes] = []
+        lo, hi, m = 0, tree_size, leaf_index
+        while hi - lo > 1:
+            k = _split(hi - lo)
+            if m < k:
+                path.append(self._subtree(lo + k, hi))
+                hi = lo + k
+            else:
+                path.append(self._subtree(lo, lo + k))
+                lo, m = lo + k, m - k
+        path.reverse()
+
+        return InclusionProof(
+            leaf_index=leaf_index,
+            tree_size=tree_size,
+            event_hash=self._event_hashes[leaf_index],
+            path=[p.hex() for p in path],
+            root=self.root(tree_size),
+        )
+
+    def consistency_proof(
+        self,
+        first_size: int,
+        second_size: Optional[int] = None,
+    ) -> ConsistencyProof:
+        second_size = self.size if second_size is None else second_size
+        self._check_size(second_size)
+        if not 0 <= first_size <= second_size:
+            raise ValueError("first_size must be within 0..second_size")
+
+        path: List[bytes] = []
+        if 0 < first_size < second_size:
+            lo, hi, m, complete = 0, second_size, first_size, True
+            while m != hi - lo:
+                k = _split(hi - lo)
+                if m <= k:
+                    path.append(self._subtree(lo + k, hi))
+                    hi = lo + k
+                else:
+                    path.append(self._subtree(lo, lo + k))
+                    lo, m, complete = lo + k, m - k, False
+            if not complete:
+                path.append(self._subtree(lo, hi))
+            path.reverse()
+
+        return ConsistencyProof(
+            first_size=first_size,
+            second_size=second_size,
+            path=[p.hex() for p in path],
+            first_root=self.root(first_size),
+            second_root=self.root(second_size),
+        )
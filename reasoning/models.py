@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple
 
+from omega_core.core.canonical import register_canonical_fields
+
 from .enums import SymbolicRefusalReason
 
 
+@register_canonical_fields
 @dataclass(frozen=True)
 class CausalNode:
     node_id: str
@@ -18,6 +21,7 @@ class CausalNode:
         }
 
 
+@register_canonical_fields
 @dataclass
 class CausalDAG:
     nodes: List[CausalNode]
@@ -0,0 +1,56 @@
+"""
+Shared governance lifecycle for tests and benchmarks.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.state_machine import GovernanceStateMachine, TransitionSpec
+
+
+LIFECYCLE = [
+    (GovernanceEventType.OBSERVATION_RECORDED, GovernanceState.ASSESSED),
+    (GovernanceEventType.ASSESSMENT_COMPLETED, GovernanceState.DECIDED),
+    (GovernanceEventType.DECISION_MADE, GovernanceState.COMMITTED),
+    (GovernanceEventType.CYCLE_CLOSED, GovernanceState.CLOSED),
+]
+
+
+def lifecycle_specs(
+    steps: int = len(LIFECYCLE),
+    *,
+    actor: str,
+    start_tick: int = 1,
+    payload: Optional[Dict[str, Any]] = None,
+) -> List[TransitionSpec]:
+    """
+    The first steps LIFECYCLE transitions at consecutive ticks.
+    payload defaults to {"tick": tick}.
+    """
+    return [
+        TransitionSpec(
+            event_type=event_type,
+            tick=tick,
+            payload={"tick": tick} if payload is None else payload,
+            actor=actor,
+            target_state=target,
+        )
+        for tick, (event_type, target) in enumerate(LIFECYCLE[:steps], start=start_tick)
+    ]
+
+
+def run_lifecycle(
+    sm: GovernanceStateMachine,
+    steps: int = len(LIFECYCLE),
+    **kwargs: Any,
+) -> GovernanceStateMachine:
+    """Drive sm one transition() at a time; kwargs as for lifecycle_specs."""
+    for spec in lifecycle_specs(steps, **kwargs):
+        sm.transition(
+            event_type=spec.event_type,
+            tick=spec.tick,
+            payload=spec.payload,
+            actor=spec.actor,
+            target_state=spec.target_state,
+        )
+    return sm
@@ -0,0 +1,50 @@
+import asyncio
+
+from omega_core.core.exceptions import GovernanceInvariantViolation
+from omega_core.governance.async_service import AsyncGovernanceService
+from omega_core.governance.enums import GovernanceState
+from omega_core.governance.event_store import FsyncPolicy
+from omega_core.governance.invariants import assert_governance_invariants
+from omega_core.governance.session_host import SessionHost
+
+from .lifecycle import LIFECYCLE
+
+
+def test_per_session_order_is_preserved_across_concurrent_submitters(tmp_path):
+    async def run():
+        host = SessionHost(str(tmp_path), shards=4, max_resident=8, fsync_policy=FsyncPolicy.NEVER)
+        service = AsyncGovernanceService(host, max_pending_per_session=2)
+
+        async def submit(session_id, n):
+            event_type, target = LIFECYCLE[n]
+            return await service.transition(
+                session_id,
+                event_type=event_type,
+                tick=n + 1,
+                payload={"n": n},
+                actor="async_test",
+                target_state=target,
+            )
+
+        sessions = [f"s{i}" for i in range(20)]
+        results = await asyncio.gather(*(
+            submit(session_id, n) for n in range(len(LIFECYCLE)) for session_id in sessions
+        ))
+        assert len(results) == 80
+
+        # Ordering violations surface as rejected transitions.
+        try:
+            await submit(sessions[0], 0)
+            assert False, "Out-of-order transition should be rejected"
+        except GovernanceInvariantViolation:
+            assert True
+
+        await service.drain()
+        assert service.active_sessions == 0
+        for session_id in sessions:
+            sm = host.session(session_id)
+            assert sm.current_state == GovernanceState.CLOSED
+            assert_governance_invariants(sm.events)
+        await service.aclose()
+
+    asyncio.run(run())
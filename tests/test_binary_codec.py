@@ -0,0 +1,88 @@
+import json
+import os
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.evidence.enums import EvidenceKind, EvidenceScope
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.governance.binary import (
+    EVENT_TYPE_CODES,
+    EVIDENCE_KIND_CODES,
+    EVIDENCE_SCOPE_CODES,
+    STATE_CODES,
+    decode_events,
+    decode_value,
+    encode_events,
+    encode_value,
+    read_event_archive,
+    write_event_archive,
+)
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.events import GovernanceEvent, recompute_event_hash
+from omega_core.governance.replay import replay_events
+from omega_core.governance.state_machine import GovernanceStateMachine
+
+from .lifecycle import run_lifecycle
+
+
+def _events():
+    sm = GovernanceStateMachine(DeterministicClock("binary_test"))
+    return list(run_lifecycle(sm, actor="binary_test").events)
+
+
+def test_code_tables_cover_every_enum_member():
+    for enum, table in [
+        (GovernanceEventType, EVENT_TYPE_CODES),
+        (GovernanceState, STATE_CODES),
+        (EvidenceKind, EVIDENCE_KIND_CODES),
+        (EvidenceScope, EVIDENCE_SCOPE_CODES),
+    ]:
+        assert set(table) == set(enum) and len(table) == len(set(table))
+
+
+def test_events_round_trip_losslessly_and_compactly():
+    events = _events()
+    # Non-derivable fields take the literal path.
+    odd = GovernanceEvent.from_dict(dict(
+        events[1].to_dict(), event_id="custom", timestamp="t", payload_hash="ABC", tick=-3
+    ))
+    events.append(odd)
+
+    data = encode_events(events)
+    decoded = decode_events(data)
+    assert [e.to_dict() for e in decoded] == [e.to_dict() for e in events]
+    assert [recompute_event_hash(e) for e in decoded[:4]] == [e.event_hash for e in events[:4]]
+
+    json_size = sum(len(json.dumps(e.to_dict())) for e in events)
+    assert len(data) * 3 < json_size
+
+
+def test_capsule_values_round_trip():
+    proof, capsule = generate_verifiable_negative_authority_proof(tick=4, authority_claims=[])
+    value = {
+        "capsule": capsule,
+        "proof": proof.to_dict(),
+        "numbers": [0, -1, 2 ** 70, 0.1, float("inf"), True, None],
+        "text": ["é", "", "A" * 64],
+    }
+    assert decode_value(encode_value(value)) == value
+
+
+def test_replay_reads_binary_archive(tmp_path):
+    events = _events()
+    path = str(tmp_path / "chain.omgb")
+    write_event_archive(path, events)
+    state = replay_events(path)
+    assert state.event_count == 4 and state.last_event_hash == events[-1].event_hash
+
+
+def test_decodes_format_version_1_archive_fixture():
+    # Written before the workflow event types were added; later code-table
+    # growth must not change how it decodes.
+    fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+    with open(os.path.join(fixtures, "events_v1.json")) as f:
+        expected = json.load(f)
+    decoded = [e.to_dict() for e in read_event_archive(os.path.join(fixtures, "events_v1.omgb"))]
+    assert decoded == expected
+    assert [e["actor"] for e in decoded] == ["alice", "alice", "bob", "alice"]
@@ -0,0 +1,183 @@
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from omega_core.core.canonical import canonicalize_for_hash
+from omega_core.core.constants import CANON_FLOAT_DIGITS
+from omega_core.core.hashing import deterministic_hash, deterministic_json_bytes
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.events import create_governance_event
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.reasoning.enums import SymbolicRefusalReason
+from omega_core.reasoning.models import CausalNode
+from omega_core.workflows.fleet_accountability import (
+    create_fleet_accountability_workflow
+)
+
+
+def _legacy_canonicalize(obj):
+    # Reflection-based canonicalization the dispatch table replaced.
+    if isinstance(obj, float):
+        return round(obj, CANON_FLOAT_DIGITS)
+    if isinstance(obj, dict):
+        return {k: _legacy_canonicalize(obj[k]) for k in sorted(obj.keys())}
+    if isinstance(obj, (list, tuple)):
+        return [_legacy_canonicalize(v) for v in obj]
+    if isinstance(obj, set):
+        return sorted(_legacy_canonicalize(v) for v in obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj):
+        return _legacy_canonicalize(dataclasses.asdict(obj))
+    if hasattr(obj, "to_dict"):
+        return _legacy_canonicalize(obj.to_dict())
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if obj is None or isinstance(obj, (str, int, bool)):
+        return obj
+    raise TypeError(f"Cannot canonicalize type {type(obj)}")
+
+
+def _reference_bytes(obj):
+    return json.dumps(
+        _legacy_canonicalize(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    ).encode("utf-8")
+
+
+def _reference_hash(obj, domain_separator=None):
+    if domain_separator:
+        obj = {"__type__": domain_separator, "__data__": obj}
+    return hashlib.sha256(_reference_bytes(obj)).hexdigest()
+
+
+class _Color(Enum):
+    RED = "red"
+    BLUE = 2
+
+
+@dataclass
+class _Inner:
+    values: list
+    color: _Color
+
+
+@dataclass(frozen=True)
+class _Outer:
+    name: str
+    inner: _Inner
+    ratio: float
+    extra: dict
+
+
+class _HasToDict:
+    def to_dict(self):
+        return {"z": 1, "a": [1.23456789, None]}
+
+
+def _corpus():
+    clock = DeterministicClock("encoder_corpus")
+    event = create_governance_event(
+        event_type=GovernanceEventType.OBSERVATION_RECORDED,
+        tick=7,
+        prev_event_hash="genesis",
+        payload={"sensor": "lidar", "range": 12.5},
+        actor="tester",
+        state_before=GovernanceState.OBSERVED,
+        state_after=GovernanceState.ASSESSED,
+        clock=clock,
+    )
+    proof, capsule = generate_verifiable_negative_authority_proof(
+        tick=3, authority_claims=[]
+    )
+
+    return [
+        None, True, False, 0, -17, 2 ** 70, 1.0, 0.1 + 0.2, -3.14159265358979,
+        1e-9, 1e300, float("nan"), float("inf"), float("-inf"),
+        "", "plain", "quote\" back\\slash\n\t", "unicode é ✓ 🚀",
+        b"\x00\xffbytes", datetime(2020, 1, 2, 3, 4, 5),
+        [], (), {}, [1, [2, [3, {"k": (4, 5)}]]],
+        {"b": 1, "a": 2, "c": {"y": 0.333333333, "x": [None]}},
+        {3: "three", 1: "one", 20: "twenty"},
+        {1.5: "x", 0.25: "y"},
+        {True: "t", False: "f"},
+        {"a", "c", "b"}, {3, 1, 2}, {_Color.RED, _Color.RED},
+        _Color.RED, _Color.BLUE, [_Color.RED, {"c": _Color.BLUE}],
+        _Outer(
+            name="outer",
+            inner=_Inner(values=[1, 2.0000001, "x"], color=_Color.RED),
+            ratio=2 / 3,
+            extra={"nested": _Inner(values=[], color=_Color.BLUE)},
+        ),
+        _HasToDict(), [_HasToDict()],
+        event, [event, event.to_dict()],
+        proof, capsule, proof.to_dict(),
+        VerifiableEvidence.from_dict(proof.asserted_absences[0]["evidence"]),
+        CausalNode(
+            node_id="n1",
+            symbolic_reason=SymbolicRefusalReason.INVARIANT_VIOLATED,
+            evidence_refs=["a", "b"],
+        ),
+        create_fleet_accountability_workflow(tick=1, event_hash="ab" * 32),
+    ]
+
+
+def test_dispatch_canonical_form_matches_reflection():
+    for obj in _corpus():
+        assert json.dumps(canonicalize_for_hash(obj), sort_keys=True) == (
+            json.dumps(_legacy_canonicalize(obj), sort_keys=True)
+        )
+
+
+def test_encoder_matches_reference_bytes():
+    for obj in _corpus():
+        assert deterministic_json_bytes(obj) == _reference_bytes(obj), obj
+
+
+def test_streaming_hash_matches_reference_hash():
+    for obj in _corpus():
+        assert deterministic_hash(obj) == _reference_hash(obj)
+        assert (
+            deterministic_hash(obj, "GovernanceEvent")
+            == _reference_hash(obj, "GovernanceEvent")
+        )
+
+
+def test_large_payload_flushes_identically():
+    payload = {f"key_{i:05d}": [i, i / 7, str(i)] for i in range(20000)}
+    assert deterministic_hash(payload, "Bulk") == _reference_hash(payload, "Bulk")
+
+
+def test_unknown_type_fails_closed():
+    for bad in (object(), {"k": object()}, [1, object()], {(1, 2): "tuple_key"}):
+        try:
+            deterministic_hash(bad)
+            assert False, "Unknown type must fail closed"
+        except TypeError:
+            assert True
+
+
+def test_instance_level_to_dict_still_resolves():
+    class _Late:
+        pass
+
+    late = _Late()
+    late.to_dict = lambda: {"late": True}
+    assert deterministic_hash(late) == _reference_hash({"late": True})
+
+    try:
+        deterministic_hash(_Late())
+        assert False, "Unknown type must fail closed"
+    except TypeError:
+        assert True
@@ -0,0 +1,103 @@
+import os
+
+from omega_core.core.exceptions import EvidenceVerificationError
+from omega_core.core.hashing import deterministic_hash, hash_canonical_bytes
+from omega_core.evidence.capsule_store import (
+    DirectoryCapsuleStore,
+    PackedCapsuleStore,
+    write_capsule_directory,
+    write_packed_capsule,
+)
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.evidence.verifier import ProofVerifier
+from omega_core.evidence.verification_cache import VerificationCache
+
+
+def _capsule():
+    proof, capsule = generate_verifiable_negative_authority_proof(
+        tick=1,
+        authority_claims=[],
+    )
+    capsule["ratio"] = {"value": 0.1, "label": "é"}
+    return proof, capsule
+
+
+def _verify_all(proof, store):
+    verifier = ProofVerifier(store)
+    for absence in proof.asserted_absences:
+        result = verifier.verify_evidence(VerifiableEvidence.from_dict(absence["evidence"]))
+        assert result.valid, result.failure_reason
+
+
+def test_packed_store_round_trip_and_verification(tmp_path):
+    proof, capsule = _capsule()
+    path = str(tmp_path / "capsule.pack")
+    write_packed_capsule(path, capsule)
+
+    with PackedCapsuleStore(path) as store:
+        assert set(store) == set(capsule)
+        for ref, artifact in capsule.items():
+            assert store[ref] == artifact
+            assert hash_canonical_bytes(store.raw(ref), "X") == deterministic_hash(artifact, "X")
+        _verify_all(proof, store)
+
+
+def test_directory_store_deduplicates_and_verifies(tmp_path):
+    proof, capsule = _capsule()
+    capsule["ratio_copy"] = dict(capsule["ratio"])
+    directory = str(tmp_path / "capsule")
+    write_capsule_directory(directory, capsule)
+
+    store = DirectoryCapsuleStore(directory)
+    assert store.artifact_digest("ratio") == store.artifact_digest("ratio_copy")
+    assert len(os.listdir(os.path.join(directory, "objects"))) == len(capsule) - 1
+    _verify_all(proof, store)
+    store.close()
+
+
+def test_tampered_packed_artifact_fails(tmp_path):
+    proof, capsule = _capsule()
+    path = str(tmp_path / "capsule.pack")
+    write_packed_capsule(path, capsule)
+
+    cache = VerificationCache()
+    with PackedCapsuleStore(path) as store:
+        evidence = VerifiableEvidence.from_dict(proof.asserted_absences[0]["evidence"])
+        ref = evidence.evidence_ref
+        offset, _, _ = store._index[ref]
+        assert ProofVerifier(store, cache=cache).verify_evidence(evidence).valid
+
+    with open(path, "r+b") as f:
+        f.seek(offset + 1)
+        original = f.read(1)
+        f.seek(offset + 1)
+        f.write(b"Z" if original != b"Z" else b"Y")
+
+    with PackedCapsuleStore(path) as store:
+        result = ProofVerifier(store).verify_evidence(evidence)
+        assert not result.valid
+        # The index still records the old digest; a shared cache must not
+        # turn that into a hit.
+        result = ProofVerifier(store, cache=cache).verify_evidence(evidence)
+        assert not result.valid and cache.hits == 0
+
+
+def test_truncated_packed_capsules_are_rejected(tmp_path):
+    _, capsule = _capsule()
+    path = str(tmp_path / "capsule.pack")
+    write_packed_capsule(path, capsule)
+    with open(path, "rb") as f:
+        data = f.read()
+
+    for size in (0, 5, 20, 33, len(data) - 30, len(data) - 1):
+        truncated = str(tmp_path / f"truncated_{size}.pack")
+        with open(truncated, "wb") as f:
+            f.write(data[:size])
+        try:
+            PackedCapsuleStore(truncated)
+            assert False, f"{size}-byte capsule should be rejected"
+        except EvidenceVerificationError:
+            assert True
@@ -0,0 +1,105 @@
+import json
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.core.hashing import deterministic_hash
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.governance.invariants import recompute_event_hashes
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.proof.bundle import derive_authority_claim_id
+from omega_core.verifier.capsule_verifier import OmegaVerifier
+
+from .lifecycle import run_lifecycle
+
+
+def _capsule():
+    sm = GovernanceStateMachine(DeterministicClock("capsule_test"))
+    run_lifecycle(sm, 2, actor="capsule_test", payload={})
+
+    spec = {"version": 1, "policy": "strict"}
+    claims = [{"actor": "operator", "scope": "route"}, {"actor": "x", "scope": "fleet"}]
+    proof, capsule = generate_verifiable_negative_authority_proof(
+        tick=2, authority_claims=claims
+    )
+    capsule.update({
+        "governance": {"spec": spec, "spec_hash": deterministic_hash(spec, "GovernanceSpec")},
+        "authority_claims": claims,
+        "authority_claim_ids": [derive_authority_claim_id(c) for c in claims],
+        "negative_authority_proof": proof.to_dict(),
+        "events": [e.to_dict() for e in sm.events],
+    })
+    return capsule
+
+
+def test_complete_capsule_verifies_concurrently_and_serially():
+    for workers in (None, 1):
+        verifier = OmegaVerifier(_capsule())
+        assert verifier.verify_capsule(workers=workers) == (True, "VALID")
+        report = verifier.timing_report()
+        assert [r["stage"] for r in report] == list(OmegaVerifier.STAGES)
+        assert all(r["status"] == "passed" for r in report)
+
+
+def test_each_stage_fails_closed():
+    tampers = {
+        "governance_spec": lambda c: c["governance"]["spec"].update(policy="lax"),
+        "authority_claim_ids": lambda c: c["authority_claim_ids"].reverse(),
+        "negative_authority_proof": lambda c: c.update(
+            refusal_decision_ast=dict(c["refusal_decision_ast"], verified=False)
+        ),
+        "event_chain": lambda c: c["events"][1].update(payload_hash="00" * 32),
+    }
+    for stage, tamper in tampers.items():
+        capsule = _capsule()
+        tamper(capsule)
+        assert OmegaVerifier(capsule).verify_capsule()[0] is False
+
+        verifier = OmegaVerifier(capsule)
+        valid, message = verifier.verify_capsule(workers=1)
+        assert not valid and message.startswith("INVALID: verification_incomplete")
+        statuses = {t.stage: t.status for t in verifier.stage_report}
+        assert statuses[stage] == "failed"
+        assert all(
+            status == "cancelled"
+            for name, status in statuses.items()
+            if OmegaVerifier.STAGES.index(name) > OmegaVerifier.STAGES.index(stage)
+        )
+
+
+def test_explicit_claim_ids_fail_closed():
+    capsule = _capsule()
+    capsule["authority_claims"][1]["claim_id"] = "c-7"
+    capsule["authority_claim_ids"][1] = "c-7"
+    valid, message = OmegaVerifier(capsule).verify_capsule(workers=1)
+    assert not valid and "not content-derived" in message
+
+
+def test_event_chain_must_be_stored_in_the_capsule(tmp_path):
+    capsule = _capsule()
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps(e) + "\n" for e in capsule["events"]))
+    for source in (str(path), path, str(tmp_path)):
+        capsule["events"] = source
+        valid, message = OmegaVerifier(capsule).verify_capsule(workers=1)
+        assert not valid and "inline list" in message
+
+
+def test_event_hashes_rederived_in_worker_processes(monkeypatch):
+    from omega_core.verifier import capsule_verifier
+
+    calls = []
+
+    def spy(events, workers):
+        calls.append(workers)
+        return recompute_event_hashes(events, workers)
+
+    monkeypatch.setattr(capsule_verifier, "PARALLEL_CHUNK_SIZE", 1)
+    monkeypatch.setattr(capsule_verifier, "recompute_event_hashes", spy)
+
+    assert OmegaVerifier(_capsule()).verify_capsule(hash_workers=2) == (True, "VALID")
+    capsule = _capsule()
+    capsule["events"][1]["payload_hash"] = "00" * 32
+    valid, message = OmegaVerifier(capsule).verify_capsule(hash_workers=2)
+    assert not valid and "Event hash mismatch" in message
+    assert calls == [2, 2]
@@ -0,0 +1,54 @@
+import pytest
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.binary import write_event_archive
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.proof.columnar import (
+    ColumnarFormat,
+    export_events,
+    export_workflows,
+    iter_event_columns,
+    iter_workflow_columns,
+)
+from omega_core.workflows.fleet_accountability import create_fleet_accountability_workflow
+
+from .lifecycle import run_lifecycle
+
+
+def _chain():
+    sm = GovernanceStateMachine(DeterministicClock("columnar"))
+    return run_lifecycle(sm, 3, actor="columnar_test").events
+
+
+def test_event_columns_stream_in_batches(tmp_path):
+    events = _chain()
+    archive = str(tmp_path / "chain.omgb")
+    write_event_archive(archive, events)
+
+    batches = list(iter_event_columns(archive, batch_size=2))
+    assert [len(b["tick"]) for b in batches] == [2, 1]
+    first = batches[0]
+    assert first["prev_event_hash"][0] is None
+    assert first["prev_event_hash"][1] == bytes.fromhex(events[0].event_hash)
+    assert first["state_after"] == ["ASSESSED", "DECIDED"]
+
+    workflow = create_fleet_accountability_workflow(tick=3, event_hash=events[-1].event_hash)
+    (columns,) = iter_workflow_columns([workflow])
+    assert columns["status"] == ["PENDING"] and columns["ack_timestamp"] == [None]
+
+
+def test_parquet_and_arrow_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa_ipc = pytest.importorskip("pyarrow.ipc")
+    events = _chain()
+
+    path = str(tmp_path / "events.parquet")
+    assert export_events(path, events, batch_size=2) == 3
+    table = pq.read_table(path)
+    assert table.column("event_hash").to_pylist() == [bytes.fromhex(e.event_hash) for e in events]
+    assert table.schema.field("event_type").type.value_type == "string"
+
+    workflow = create_fleet_accountability_workflow(tick=3, event_hash=events[-1].event_hash)
+    arrow_path = str(tmp_path / "workflows.arrow")
+    assert export_workflows(arrow_path, [workflow], fmt=ColumnarFormat.ARROW_IPC) == 1
+    assert pa_ipc.open_file(arrow_path).read_all().column("status").to_pylist() == ["PENDING"]
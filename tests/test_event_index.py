@@ -0,0 +1,65 @@
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.event_index import EventIndex
+from omega_core.governance.event_store import ColumnarEventStore
+from omega_core.governance.state_machine import GovernanceStateMachine, TransitionSpec
+
+from .lifecycle import lifecycle_specs
+
+
+def _events(cycles):
+    events = []
+    for cycle in range(cycles):
+        sm = GovernanceStateMachine(DeterministicClock(f"cycle_{cycle}"))
+        sm.transition_many(lifecycle_specs(
+            actor=f"operator_{cycle % 3}",
+            start_tick=cycle * 10,
+            payload={"cycle": cycle},
+        ))
+        events.extend(sm.events)
+    return events
+
+
+def test_queries_match_linear_scan():
+    events = _events(40)
+    index = EventIndex(ColumnarEventStore(events))
+    assert len(index) == 160
+
+    found = [e.event_hash for e in index.query(
+        event_type=GovernanceEventType.DECISION_MADE, tick_from=55, tick_to=202,
+    )]
+    expected = [
+        e.event_hash for e in events
+        if e.event_type == GovernanceEventType.DECISION_MADE and 55 <= e.tick <= 202
+    ]
+    assert found == expected and len(found) == 15
+
+    by_actor = list(index.positions(actor="operator_1", state_after=GovernanceState.CLOSED))
+    assert by_actor == [
+        i for i, e in enumerate(events)
+        if e.actor == "operator_1" and e.state_after == GovernanceState.CLOSED
+    ]
+    assert index.count(actor="nobody") == 0
+    assert index.count() == 160
+    assert index.get(events[77].event_id).event_hash == events[77].event_hash
+    assert index.get("missing") is None
+
+
+def test_attached_index_follows_commits_and_out_of_order_ticks():
+    sm = GovernanceStateMachine(DeterministicClock("idx"))
+    sm.transition(
+        event_type=GovernanceEventType.OBSERVATION_RECORDED,
+        tick=50,
+        payload={},
+        actor="a",
+        target_state=GovernanceState.ASSESSED,
+    )
+    index = EventIndex.attach(sm)
+    sm.transition_many([
+        TransitionSpec(GovernanceEventType.ASSESSMENT_COMPLETED, 10, {}, "b", GovernanceState.DECIDED),
+        TransitionSpec(GovernanceEventType.DECISION_MADE, 30, {}, "a", GovernanceState.COMMITTED),
+    ])
+
+    assert len(index) == 3
+    assert list(index.tick_positions(20, 60)) == [0, 2]
+    assert [e.tick for e in index.query(actor="a")] == [50, 30]
@@ -0,0 +1,180 @@
+import os
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.event_store import (
+    ColumnarEventStore,
+    FsyncPolicy,
+    SegmentedFileEventStore,
+)
+from omega_core.governance.events import GovernanceEvent
+from omega_core.governance.invariants import assert_governance_invariants
+from omega_core.governance.state_machine import GovernanceStateMachine
+
+from .lifecycle import run_lifecycle
+
+
+def _run_cycle(sm, tick):
+    run_lifecycle(sm, 3, actor="store_test", start_tick=tick)
+    return tick + 3
+
+
+def _open(path):
+    return SegmentedFileEventStore(
+        str(path),
+        segment_max_events=4,
+        group_commit_size=2,
+        fsync_policy=FsyncPolicy.NEVER,
+    )
+
+
+def test_file_store_rehydrates_state_machine(tmp_path):
+    clock = DeterministicClock("store_test")
+    store = _open(tmp_path)
+    sm = GovernanceStateMachine(clock, event_store=store)
+    _run_cycle(sm, 1)
+    expected = [e.to_dict() for e in sm.events]
+    store.close()
+
+    reopened = _open(tmp_path)
+    sm2 = GovernanceStateMachine(clock, event_store=reopened)
+
+    assert [e.to_dict() for e in sm2.events] == expected
+    assert sm2.current_state == GovernanceState.COMMITTED
+    assert sm2.last_event_hash == expected[-1]["event_hash"]
+    assert [e.to_dict() for e in sm2.events[-2:]] == expected[-2:]
+
+    sm2.transition(
+        event_type=GovernanceEventType.CYCLE_CLOSED,
+        tick=10,
+        payload={},
+        actor="store_test",
+        target_state=GovernanceState.CLOSED,
+    )
+    assert len(sm2.events) == 4
+    assert_governance_invariants(list(sm2.events))
+    reopened.close()
+
+
+def test_torn_tail_is_truncated_on_open(tmp_path):
+    store = _open(tmp_path)
+    sm = GovernanceStateMachine(DeterministicClock("store_test"), event_store=store)
+    _run_cycle(sm, 1)
+    store.close()
+
+    last_segment = sorted(os.listdir(tmp_path))[-1]
+    with open(tmp_path / last_segment, "ab") as f:
+        f.write(b'{"event_id": "half-writ')
+
+    reopened = _open(tmp_path)
+    assert len(reopened) == 3
+    assert reopened.last().event_hash == sm.last_event_hash
+    reopened.close()
+
+
+def test_columnar_store_round_trips_events():
+    store = ColumnarEventStore()
+    sm = GovernanceStateMachine(DeterministicClock("columnar_test"), event_store=store)
+    _run_cycle(sm, 1)
+    assert_governance_invariants(sm.events)
+
+    reference = GovernanceStateMachine(DeterministicClock("columnar_test"))
+    _run_cycle(reference, 1)
+    assert [e.to_dict() for e in store] == [e.to_dict() for e in reference.events]
+    assert [e.to_dict() for e in store[-2:]] == [e.to_dict() for e in reference.events[-2:]]
+    assert store.last() == reference.events[-1]
+
+    odd = GovernanceEvent.from_dict(dict(
+        reference.events[1].to_dict(), event_id="", timestamp="custom", event_hash="X"
+    ))
+    store.append(odd)
+    assert store[-1] == odd
+    assert store[0].prev_event_hash == "genesis"
+
+    # A chain that does not start at genesis keeps its first prev hash.
+    tail = ColumnarEventStore(reference.events[1:])
+    assert [e.to_dict() for e in tail] == [e.to_dict() for e in reference.events[1:]]
+
+
+def test_empty_rolled_tail_segment_keeps_last_event(tmp_path):
+    store = SegmentedFileEventStore(
+        str(tmp_path), segment_max_events=2, fsync_policy=FsyncPolicy.NEVER
+    )
+    sm = GovernanceStateMachine(DeterministicClock("store_test"), event_store=store)
+    _run_cycle(sm, 1)
+    store.close()
+
+    # Roll to a fresh segment that holds only a torn line.
+    with open(tmp_path / "segment_00000002.jsonl", "wb") as f:
+        f.write(b'{"event_id": "half-writ')
+
+    reopened = SegmentedFileEventStore(
+        str(tmp_path), segment_max_events=2, fsync_policy=FsyncPolicy.NEVER
+    )
+    assert len(reopened) == 3
+    assert reopened.last().event_hash == sm.last_event_hash
+    sm2 = GovernanceStateMachine(DeterministicClock("store_test"), event_store=reopened)
+    assert sm2.current_state == GovernanceState.COMMITTED
+    assert sm2.last_event_hash == sm.last_event_hash
+    reopened.close()
+
+
+def test_reopen_scans_only_the_tail_segment(tmp_path, monkeypatch):
+    store = _open(tmp_path)
+    sm = GovernanceStateMachine(DeterministicClock("store_test"), event_store=store)
+    tick = 1
+    for _ in range(4):
+        tick = _run_cycle(sm, tick)
+        sm.current_state = GovernanceState.OBSERVED
+    expected = [e.to_dict() for e in sm.events]
+    store.close()
+    assert len([n for n in os.listdir(tmp_path) if n.endswith(".idx")]) == 2
+
+    scanned = []
+    original = SegmentedFileEventStore._scan_segment
+
+    def spy(self, segment, **kwargs):
+        scanned.append(os.path.basename(segment.path))
+        return original(self, segment, **kwargs)
+
+    monkeypatch.setattr(SegmentedFileEventStore, "_scan_segment", spy)
+    reopened = _open(tmp_path)
+    assert scanned == ["segment_00000002.jsonl"]
+    assert [e.to_dict() for e in reopened] == expected
+    assert [e.to_dict() for e in reopened[3:9]] == expected[3:9]
+    reopened.close()
+
+
+def test_readers_see_a_consistent_prefix_during_group_commits(tmp_path):
+    import threading
+
+    store = SegmentedFileEventStore(
+        str(tmp_path), segment_max_events=5, group_commit_size=3,
+        fsync_policy=FsyncPolicy.NEVER,
+    )
+    sm = GovernanceStateMachine(DeterministicClock("store_test"), event_store=store)
+    done = threading.Event()
+    failures = []
+
+    def reader():
+        while not done.is_set():
+            view = sm.view()
+            events = sm.events[:view.event_count]
+            if len(events) != view.event_count or (
+                events and events[-1].event_hash != view.last_event_hash
+            ):
+                failures.append(view.event_count)
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    tick = 1
+    for _ in range(30):
+        tick = _run_cycle(sm, tick)
+        sm.current_state = GovernanceState.OBSERVED
+    done.set()
+    for t in threads:
+        t.join()
+    store.close()
+
+    assert failures == []
@@ -1,8 +1,18 @@
+import dataclasses
+
 from omega_core.core.clock import DeterministicClock
 from omega_core.core.exceptions import GovernanceInvariantViolation
 from omega_core.governance.enums import GovernanceEventType, GovernanceState
-from omega_core.governance.state_machine import GovernanceStateMachine
-from omega_core.governance.invariants import assert_governance_invariants
+from omega_core.governance.events import create_governance_event
+from omega_core.governance.state_machine import (
+    GovernanceStateMachine,
+    TransitionSpec,
+)
+from omega_core.governance.invariants import (
+    IncrementalInvariantVerifier,
+    InvariantCheckpoint,
+    assert_governance_invariants,
+)
 
 
 def test_event_chain_integrity():
@@ -67,3 +77,241 @@ def test_closure_blocked_by_workflow():
         assert False, "Closure should have been blocked"
     except GovernanceInvariantViolation:
         assert True
+
+
+def test_incremental_verifier_checks_only_new_events():
+    clock = DeterministicClock("test_session")
+    verifier = IncrementalInvariantVerifier()
+    sm = GovernanceStateMachine(clock, verifier=verifier)
+
+    sm.transition(
+        event_type=GovernanceEventType.OBSERVATION_RECORDED,
+        tick=1,
+        payload={},
+        actor="test",
+        target_state=GovernanceState.ASSESSED,
+    )
+    assert verifier.verified_count == 1
+    assert verifier.last_event_hash == sm.last_event_hash
+
+    audit = IncrementalInvariantVerifier()
+    audit.verify(sm.events)
+
+    sm.transition(
+        event_type=GovernanceEventType.ASSESSMENT_COMPLETED,
+        tick=2,
+        payload={},
+        actor="test",
+        target_state=GovernanceState.DECIDED,
+    )
+    audit.verify(sm.events)
+    assert audit.checkpoint() == verifier.checkpoint()
+
+    forged = dataclasses.replace(sm.events[-1], actor="forger")
+    try:
+        IncrementalInvariantVerifier(
+            InvariantCheckpoint(
+                verified_count=1,
+                last_event_hash=sm.events[0].event_hash,
+                last_state_after=sm.events[0].state_after,
+            )
+        ).verify([sm.events[0], forged])
+        assert False, "Forged event should be rejected"
+    except GovernanceInvariantViolation:
+        assert True
+
+
+def _long_chain(length):
+    clock = DeterministicClock("parallel_audit")
+    prev_hash = "genesis"
+    events = []
+    for tick in range(length):
+        event = create_governance_event(
+            event_type=GovernanceEventType.OBSERVATION_RECORDED,
+            tick=tick,
+            prev_event_hash=prev_hash,
+            payload={"tick": tick},
+            actor="auditor",
+            state_before=GovernanceState.ASSESSED,
+            state_after=GovernanceState.ASSESSED,
+            clock=clock,
+        )
+        events.append(event)
+        prev_hash = event.event_hash
+    return events
+
+
+def _violation(events, **kwargs):
+    try:
+        assert_governance_invariants(events, **kwargs)
+    except GovernanceInvariantViolation as e:
+        return str(e)
+    return None
+
+
+def test_parallel_verification_matches_serial():
+    events = _long_chain(40)
+    assert _violation(events, workers=2, chunk_size=8) is None
+
+    tampered = list(events)
+    tampered[17] = dataclasses.replace(events[17], actor="forger")
+    tampered[30] = dataclasses.replace(events[30], prev_event_hash="bogus")
+
+    serial = _violation(tampered)
+    assert serial is not None
+    assert _violation(tampered, workers=2, chunk_size=8) == serial
+
+
+def _lifecycle_specs():
+    return [
+        TransitionSpec(
+            event_type=GovernanceEventType.OBSERVATION_RECORDED,
+            tick=1,
+            payload={"obs": 1},
+            actor="test",
+            target_state=GovernanceState.ASSESSED,
+        ),
+        TransitionSpec(
+            event_type=GovernanceEventType.ASSESSMENT_COMPLETED,
+            tick=2,
+            payload={},
+            actor="test",
+            target_state=GovernanceState.DECIDED,
+        ),
+        TransitionSpec(
+            event_type=GovernanceEventType.DECISION_MADE,
+            tick=3,
+            payload={"decision": "proceed"},
+            actor="test",
+            target_state=GovernanceState.COMMITTED,
+        ),
+    ]
+
+
+def test_transition_many_matches_single_transitions():
+    clock = DeterministicClock("test_session")
+    single = GovernanceStateMachine(clock)
+    for spec in _lifecycle_specs():
+        single.transition(
+            event_type=spec.event_type,
+            tick=spec.tick,
+            payload=spec.payload,
+            actor=spec.actor,
+            target_state=spec.target_state,
+        )
+
+    batched = GovernanceStateMachine(clock, verifier=IncrementalInvariantVerifier())
+    batched.transition_many(_lifecycle_specs())
+
+    assert [e.to_dict() for e in batched.events] == [e.to_dict() for e in single.events]
+    assert batched.last_event_hash == single.last_event_hash
+    assert batched.verifier.verified_count == 3
+
+
+def test_transition_many_is_all_or_nothing():
+    clock = DeterministicClock("test_session")
+    sm = GovernanceStateMachine(clock)
+    sm.blocked_workflows.append("blocking_workflow")
+
+    specs = _lifecycle_specs() + [
+        TransitionSpec(
+            event_type=GovernanceEventType.CYCLE_CLOSED,
+            tick=4,
+            payload={},
+            actor="test",
+            target_state=GovernanceState.CLOSED,
+        )
+    ]
+
+    try:
+        sm.transition_many(specs)
+        assert False, "Closure should have been blocked"
+    except GovernanceInvariantViolation:
+        assert True
+
+    assert len(sm.events) == 0
+    assert sm.current_state == GovernanceState.OBSERVED
+    assert sm.last_event_hash == "genesis"
+
+
+def test_concurrent_writers_serialize_and_views_stay_consistent():
+    import threading
+
+    clock = DeterministicClock("test_session")
+    sm = GovernanceStateMachine(clock)
+    sm.block_workflow("threat_1")
+    assert sm.block_workflow("threat_1") is False
+
+    barrier = threading.Barrier(8)
+    outcomes = []
+
+    def writer():
+        barrier.wait()
+        try:
+            sm.transition(
+                event_type=GovernanceEventType.OBSERVATION_RECORDED,
+                tick=1,
+                payload={},
+                actor="test",
+                target_state=GovernanceState.ASSESSED,
+            )
+            outcomes.append(True)
+        except GovernanceInvariantViolation:
+            outcomes.append(False)
+
+    threads = [threading.Thread(target=writer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Exactly one writer wins the check-and-commit.
+    assert outcomes.count(True) == 1
+
+    sm.transition_many(_lifecycle_specs()[1:])
+    view = sm.view()
+    assert view.event_count == len(sm.events) == 3
+    assert view.last_event_hash == sm.events[view.event_count - 1].event_hash
+    assert view.is_blocked("threat_1")
+
+    try:
+        sm.transition(
+            event_type=GovernanceEventType.CYCLE_CLOSED,
+            tick=4,
+            payload={},
+            actor="test",
+            target_state=GovernanceState.CLOSED,
+        )
+        assert False, "Closure should have been blocked"
+    except GovernanceInvariantViolation:
+        assert True
+
+    assert sm.unblock_workflow("threat_1")
+    sm.transition(
+        event_type=GovernanceEventType.CYCLE_CLOSED,
+        tick=4,
+        payload={},
+        actor="test",
+        target_state=GovernanceState.CLOSED,
+    )
+    # Earlier views are immutable.
+    assert view.state == GovernanceState.COMMITTED
+    assert sm.view().state == GovernanceState.CLOSED
+
+
+def test_blocked_workflows_list_api_publishes_views():
+    clock = DeterministicClock("test_session")
+    sm = GovernanceStateMachine(clock)
+    before = sm.view()
+
+    sm.blocked_workflows.append("wf_a")
+    sm.blocked_workflows.extend(["wf_b", "wf_c"])
+    sm.blocked_workflows.remove("wf_b")
+    assert sm.blocked_workflows == ["wf_a", "wf_c"]
+    assert "wf_c" in sm.blocked_workflows and len(sm.blocked_workflows) == 2
+    assert sm.view().blocked_workflows == ("wf_a", "wf_c")
+    assert before.blocked_workflows == ()
+
+    assert sm.blocked_workflows.pop() == "wf_c"
+    del sm.blocked_workflows[0]
+    assert sm.blocked_workflows == [] and not sm.view().blocked_workflows
@@ -0,0 +1,114 @@
+import copy
+import hashlib
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.proof.bundle import export_minimal_proof_bundle
+from omega_core.proof.merkle import (
+    MerkleAccumulator,
+    merkle_leaf_hash,
+    merkle_node_hash,
+)
+from omega_core.verifier.merkle_verifier import (
+    verify_bundle_event_slice,
+    verify_consistency_proof,
+    verify_inclusion_proof,
+)
+
+from .lifecycle import run_lifecycle
+
+
+def _hashes(n):
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+def _reference_root(event_hashes):
+    # RFC 6962 MTH, computed recursively from the leaves.
+    if len(event_hashes) == 1:
+        return merkle_leaf_hash(event_hashes[0])
+    k = 1 << ((len(event_hashes) - 1).bit_length() - 1)
+    return merkle_node_hash(
+        _reference_root(event_hashes[:k]), _reference_root(event_hashes[k:])
+    )
+
+
+def test_roots_and_proofs_for_all_small_trees():
+    hashes = _hashes(20)
+    acc = MerkleAccumulator()
+    acc.extend(hashes)
+
+    for size in range(1, 21):
+        assert acc.root(size) == _reference_root(hashes[:size]).hex()
+        for index in range(size):
+            assert verify_inclusion_proof(acc.inclusion_proof(index, size).to_dict())
+        for first in range(0, size + 1):
+            assert verify_consistency_proof(acc.consistency_proof(first, size).to_dict())
+
+
+def test_tampered_proofs_fail():
+    acc = MerkleAccumulator()
+    acc.extend(_hashes(13))
+
+    inclusion = acc.inclusion_proof(6).to_dict()
+    inclusion["event_hash"] = _hashes(14)[13]
+    assert not verify_inclusion_proof(inclusion)
+
+    consistency = acc.consistency_proof(5).to_dict()
+    consistency["path"] = list(reversed(consistency["path"]))
+    assert not verify_consistency_proof(consistency)
+
+
+def test_bundle_records_root_and_slice_inclusion():
+    sm = GovernanceStateMachine(DeterministicClock("merkle_test"))
+    acc = MerkleAccumulator()
+    sm.listeners.append(acc)
+    run_lifecycle(sm, 3, actor="merkle_test", payload={})
+
+    proof, _ = generate_verifiable_negative_authority_proof(tick=3, authority_claims=[])
+    bundle = export_minimal_proof_bundle(
+        governance_spec={"version": 1},
+        governance_events=sm.events,
+        authority_claims=[],
+        negative_authority_proof=proof,
+        event_slice_size=2,
+        merkle_accumulator=acc,
+    ).to_dict()
+
+    assert bundle["event_chain_merkle"]["root"] == acc.root()
+    assert verify_bundle_event_slice(bundle)
+
+    tampered = copy.deepcopy(bundle)
+    tampered["event_chain_slice"][0]["event_hash"] = "00" * 32
+    assert not verify_bundle_event_slice(tampered)
+
+    # A forged body keeping the original event_hash is caught by re-derivation.
+    forged = copy.deepcopy(bundle)
+    forged["event_chain_slice"][1]["actor"] = "mallory"
+    assert not verify_bundle_event_slice(forged)
+
+    # A self-consistent root for another chain does not match the bundle hash.
+    other = MerkleAccumulator()
+    for event_hash in [sm.events[0].event_hash, "11" * 32] + [e.event_hash for e in sm.events[1:]]:
+        other.append(event_hash)
+    rerooted = copy.deepcopy(bundle)
+    rerooted["event_chain_merkle"] = {
+        "tree_size": 4,
+        "root": other.root(4),
+        "slice_inclusion_proofs": [other.inclusion_proof(i, 4).to_dict() for i in (2, 3)],
+    }
+    assert not verify_bundle_event_slice(rerooted)
+
+
+def test_bundle_without_accumulator_keeps_original_shape():
+    proof, _ = generate_verifiable_negative_authority_proof(tick=1, authority_claims=[])
+    bundle = export_minimal_proof_bundle(
+        governance_spec={"version": 1},
+        governance_events=[],
+        authority_claims=[],
+        negative_authority_proof=proof,
+    ).to_dict()
+    assert "event_chain_merkle" not in bundle
+    assert not verify_bundle_event_slice(bundle)
@@ -0,0 +1,136 @@
+from omega_core.evidence.capsule_store import (
+    PackedCapsuleStore,
+    hash_capsule_artifact,
+    write_packed_capsule,
+)
+from omega_core.evidence.enums import EvidenceKind
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.evidence.negative_authority import (
+    generate_verifiable_negative_authority_proof
+)
+from omega_core.evidence.verification_cache import VerificationCache
+from omega_core.evidence.verifier import (
+    EvidenceVerificationSpec,
+    ProofVerifier,
+    evidence_verification_spec,
+    register_evidence_verification,
+)
+
+
+class _CountingVerifier(ProofVerifier):
+    def __init__(self, capsule):
+        super().__init__(capsule)
+        self.hashed = []
+
+    def _hash_artifact(self, evidence, spec):
+        self.hashed.append((evidence.evidence_ref, spec.domain_separator))
+        return super()._hash_artifact(evidence, spec)
+
+
+def _evidence(tick):
+    proof, capsule = generate_verifiable_negative_authority_proof(
+        tick=tick,
+        authority_claims=[],
+    )
+    return [VerifiableEvidence.from_dict(a["evidence"]) for a in proof.asserted_absences], capsule
+
+
+def test_verify_many_preserves_order_and_dedupes():
+    capsule = {}
+    items = []
+    shared, _ = _evidence(5)
+    for tick in range(1, 6):
+        evidence, tick_capsule = _evidence(tick)
+        capsule.update(tick_capsule)
+        items.extend([evidence[0], shared[1]])
+
+    missing = VerifiableEvidence.from_dict(
+        dict(items[0].to_dict(), evidence_ref="missing_ref")
+    )
+    items.insert(3, missing)
+
+    verifier = _CountingVerifier(capsule)
+    results = verifier.verify_many(items, workers=4)
+
+    assert len(results) == len(items)
+    for item, result in zip(items, results):
+        assert result.expected_hash == item.evidence_hash
+        assert result.valid == (item is not missing)
+
+    # Session-scoped artifacts are shared across ticks and hashed once.
+    hashed = [key for key in verifier.hashed if key[0] != "missing_ref"]
+    assert len(hashed) == len(set(hashed)) == len(capsule)
+    assert results == [verifier.verify_evidence(e) for e in items]
+
+
+def test_registered_kind_uses_spec_hasher():
+    evidence, capsule = _evidence(1)
+    calls = []
+
+    def hasher(capsule, ref, domain_separator):
+        calls.append(ref)
+        return hash_capsule_artifact(capsule, ref, domain_separator)
+
+    original = evidence_verification_spec(EvidenceKind.SCAN)
+    register_evidence_verification(
+        EvidenceKind.SCAN,
+        EvidenceVerificationSpec(
+            domain_separator=original.domain_separator,
+            generation_methods=original.generation_methods,
+            hasher=hasher,
+        ),
+    )
+    try:
+        assert ProofVerifier(capsule).verify_evidence(evidence[0]).valid
+        assert calls == [evidence[0].evidence_ref]
+    finally:
+        register_evidence_verification(EvidenceKind.SCAN, original)
+
+    wrong_method = VerifiableEvidence.from_dict(
+        dict(evidence[0].to_dict(), generation_method="manual")
+    )
+    result = ProofVerifier(capsule).verify_evidence(wrong_method)
+    assert not result.valid
+    assert result.failure_reason == "Unknown scan method"
+
+
+def test_verification_cache_hits_and_invalidation(tmp_path):
+    evidence, capsule = _evidence(1)
+    path = str(tmp_path / "capsule.pack")
+    write_packed_capsule(path, capsule)
+    cache = VerificationCache(max_entries=8)
+
+    with PackedCapsuleStore(path) as store:
+        first = ProofVerifier(store, cache=cache).verify_many(evidence, workers=1)
+    with PackedCapsuleStore(path) as store:
+        second = ProofVerifier(store, cache=cache).verify_many(evidence, workers=1)
+        assert first == second and all(r.valid for r in second)
+        assert (cache.misses, cache.hits) == (2, 2)
+
+        # Inline evidence_data is not part of the key.
+        spoofed = VerifiableEvidence.from_dict(
+            dict(evidence[0].to_dict(), evidence_data={"forged": True})
+        )
+        assert ProofVerifier(store, cache=cache).verify_evidence(spoofed).valid
+
+    # A rewritten capsule is a new file identity, so the stale entry is never hit.
+    ref = evidence[0].evidence_ref
+    capsule[ref] = dict(capsule[ref], claims_found=1)
+    write_packed_capsule(path, capsule)
+    with PackedCapsuleStore(path) as store:
+        assert not ProofVerifier(store, cache=cache).verify_evidence(evidence[0]).valid
+    assert cache.invalidate(ref) == 2
+    assert len(cache) == 1
+
+    # In-memory capsules are never keyed, so they never touch the cache.
+    ProofVerifier(capsule, cache=cache).verify_many(evidence, workers=1)
+    assert len(cache) == 1 and cache.hits == 3
+
+
+def test_verification_cache_is_bounded():
+    cache = VerificationCache(max_entries=2)
+    for i in range(5):
+        cache.put((f"ref_{i}", "D", "00"), "h")
+    assert len(cache) == 2 and cache.evictions == 3
+    assert cache.get(("ref_0", "D", "00")) is None
+    assert cache.get(("ref_4", "D", "00")) == "h"
@@ -0,0 +1,87 @@
+from omega_core.core.hashing import deterministic_hash
+from omega_core.evidence.enums import EvidenceKind, EvidenceScope
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.evidence.record_stream import (
+    RecordLog,
+    StreamingRecordHasher,
+    write_record_log,
+)
+from omega_core.evidence.verifier import ProofVerifier
+
+
+def _records(n):
+    return [
+        {"seq": i, "speed": i * 0.1, "msg": f"frame {i} é", "flags": [i % 2 == 0]}
+        for i in range(n)
+    ]
+
+
+def test_streaming_hash_matches_whole_object_hash():
+    headers = [
+        {},
+        {"asset": "veh_1", "window": [0, 10]},
+        {"asset": "veh_1", "session": "s", "zeta": 1.5},
+    ]
+    for header in headers:
+        for n in (0, 1, 7):
+            records = _records(n)
+            hasher = StreamingRecordHasher("LogEvidence", header=header)
+            for record in records:
+                hasher.update(record)
+            expected = deterministic_hash({**header, "records": records}, "LogEvidence")
+            assert hasher.hexdigest() == expected
+
+
+def test_header_may_not_shadow_records_key():
+    try:
+        StreamingRecordHasher("LogEvidence", header={"records": []})
+        assert False
+    except ValueError:
+        pass
+
+
+def test_record_log_evidence_verifies_by_streaming(tmp_path):
+    path = str(tmp_path / "drive.log.jsonl")
+    header = {"asset": "veh_1", "session": "s"}
+    evidence_hash = write_record_log(
+        path, iter(_records(50)), domain_separator="LogEvidence", header=header
+    )
+    log = RecordLog(path)
+    assert evidence_hash == deterministic_hash({**header, "records": _records(50)}, "LogEvidence")
+    assert evidence_hash == deterministic_hash(log.to_dict(), "LogEvidence")
+
+    evidence = VerifiableEvidence(
+        evidence_kind=EvidenceKind.LOG,
+        evidence_ref="drive_log",
+        evidence_hash=evidence_hash,
+        evidence_scope=EvidenceScope.SESSION,
+        generation_method="vehicle_log_export",
+    )
+    assert ProofVerifier({"drive_log": log}).verify_evidence(evidence).valid
+
+    with open(path, "ab") as f:
+        f.write(b'{"seq":50}\n')
+    assert not ProofVerifier({"drive_log": RecordLog(path)}).verify_evidence(evidence).valid
+
+
+def test_record_log_rejects_lines_that_are_not_one_canonical_record(tmp_path):
+    records = [{"a": 1}, {"b": 2}]
+    evidence_hash = deterministic_hash({"records": records}, "LogEvidence")
+    evidence = VerifiableEvidence(
+        evidence_kind=EvidenceKind.LOG,
+        evidence_ref="drive_log",
+        evidence_hash=evidence_hash,
+        evidence_scope=EvidenceScope.SESSION,
+        generation_method="vehicle_log_export",
+    )
+    path = str(tmp_path / "merged.log.jsonl")
+    write_record_log(path, iter(records), domain_separator="LogEvidence")
+    assert ProofVerifier({"drive_log": RecordLog(path)}).verify_evidence(evidence).valid
+
+    with open(path, "rb") as f:
+        header = f.readline()
+    for body in (b'{"a":1},{"b":2}\n', b'{"a":1}\n{"b": 2}\n'):
+        with open(path, "wb") as f:
+            f.write(header + body)
+        result = ProofVerifier({"drive_log": RecordLog(path)}).verify_evidence(evidence)
+        assert not result.valid and "Non-canonical record" in result.failure_reason
@@ -0,0 +1,58 @@
+import json
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.core.exceptions import GovernanceInvariantViolation
+from omega_core.governance.enums import GovernanceState
+from omega_core.governance.event_store import InMemoryEventStore
+from omega_core.governance.replay import ReplayEngine, replay_events
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.verifier.capsule_verifier import OmegaVerifier
+
+from .lifecycle import run_lifecycle
+
+
+def _session():
+    sm = GovernanceStateMachine(DeterministicClock("replay_test"))
+    return run_lifecycle(sm, actor="replay_test")
+
+
+def test_replay_rebuilds_state_from_jsonl(tmp_path):
+    sm = _session()
+    path = tmp_path / "chain.jsonl"
+    path.write_text("".join(json.dumps(e.to_dict()) + "\n" for e in sm.events))
+
+    engine = ReplayEngine(sink=InMemoryEventStore())
+    state = engine.replay(str(path))
+
+    assert state.event_count == 4
+    assert state.current_state == GovernanceState.CLOSED
+    assert state.last_event_hash == sm.last_event_hash
+
+    rebuilt = engine.to_state_machine(DeterministicClock("replay_test"))
+    assert [e.to_dict() for e in rebuilt.events] == [e.to_dict() for e in sm.events]
+
+
+def test_replay_resumes_from_intermediate_state():
+    records = [e.to_dict() for e in _session().events]
+    head = replay_events(iter(records[:2]))
+    tail = replay_events(iter(records[2:]), start=head)
+
+    assert tail == replay_events(records)
+
+
+def test_replay_rejects_tampered_event():
+    records = [e.to_dict() for e in _session().events]
+    records[1] = dict(records[1], actor="forger")
+
+    try:
+        replay_events(records)
+        assert False, "Tampered event must fail replay"
+    except GovernanceInvariantViolation:
+        assert True
+
+
+def test_verifier_replays_event_chain():
+    sm = _session()
+    verifier = OmegaVerifier({"events": [e.to_dict() for e in sm.events]})
+    verifier._verify_event_chain()
+    assert "4 events" in verifier.verification_log[-1]
@@ -0,0 +1,53 @@
+from omega_core.governance.enums import GovernanceState
+from omega_core.governance.event_store import FsyncPolicy
+from omega_core.governance.session_host import SessionHost
+
+from .lifecycle import LIFECYCLE
+
+
+def _step(host, session_id, n):
+    event_type, target = LIFECYCLE[n]
+    return host.transition(
+        session_id,
+        event_type=event_type,
+        tick=n + 1,
+        payload={"n": n},
+        actor="host_test",
+        target_state=target,
+    )
+
+
+def test_sessions_survive_eviction_and_reopen(tmp_path):
+    sessions = [f"veh_{i:03d}" for i in range(12)]
+    host = SessionHost(str(tmp_path), shards=2, max_resident=4, fsync_policy=FsyncPolicy.NEVER)
+    for n in range(2):
+        for session_id in sessions:
+            _step(host, session_id, n)
+
+    metrics = host.metrics()
+    assert metrics["resident_sessions"] <= 4
+    assert metrics["evictions"] > 0 and metrics["transitions"] == 24
+
+    host.session(sessions[0]).blocked_workflows.append("wf_hold")
+    host.evict(sessions[0])
+    assert host.session(sessions[0]).blocked_workflows == ["wf_hold"]
+    host.close()
+
+    reopened = SessionHost(str(tmp_path), shards=2, max_resident=4, fsync_policy=FsyncPolicy.NEVER)
+    for session_id in sessions:
+        event = _step(reopened, session_id, 2)
+        sm = reopened.session(session_id)
+        assert sm.current_state == GovernanceState.COMMITTED
+        assert len(sm.events) == 3 and sm.events[1].event_hash == event.prev_event_hash
+    reopened.close()
+
+
+def test_rejects_unsafe_session_ids(tmp_path):
+    host = SessionHost(str(tmp_path))
+    for session_id in ("../escape", ".", "..", "...", "a/b", "s1\n", ""):
+        try:
+            host.session(session_id)
+            assert False, f"Session id {session_id!r} should be rejected"
+        except ValueError:
+            assert True
+    assert host.session("s.1").current_state is not None
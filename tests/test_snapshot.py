@@ -0,0 +1,63 @@
+import dataclasses
+import os
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.event_store import FsyncPolicy, SegmentedFileEventStore
+from omega_core.governance.snapshot import (
+    SnapshotPolicy,
+    load_latest_snapshot,
+    restore_state_machine,
+    take_snapshot,
+    verify_snapshot,
+    write_snapshot,
+)
+from omega_core.governance.state_machine import GovernanceStateMachine
+
+from .lifecycle import run_lifecycle
+
+
+def test_restore_from_snapshot_replays_only_tail(tmp_path):
+    clock = DeterministicClock("snapshot_test")
+    events_dir = str(tmp_path / "events")
+    snapshot_dir = str(tmp_path / "snapshots")
+
+    store = SegmentedFileEventStore(events_dir, fsync_policy=FsyncPolicy.NEVER)
+    sm = GovernanceStateMachine(clock, event_store=store)
+    sm.blocked_workflows.append("wf_pending")
+    SnapshotPolicy(sm, snapshot_dir, every=2)
+
+    run_lifecycle(sm, 3, actor="snapshot_test", payload={})
+    store.close()
+
+    assert os.listdir(snapshot_dir) == ["snapshot_000000000002.json"]
+
+    reopened = SegmentedFileEventStore(events_dir, fsync_policy=FsyncPolicy.NEVER)
+    restored = restore_state_machine(
+        clock, event_store=reopened, snapshot_dir=snapshot_dir
+    )
+
+    assert restored.current_state == GovernanceState.COMMITTED
+    assert restored.last_event_hash == sm.last_event_hash
+    assert restored.blocked_workflows == ["wf_pending"]
+    reopened.close()
+
+
+def test_tampered_snapshot_is_rejected(tmp_path):
+    sm = GovernanceStateMachine(DeterministicClock("snapshot_test"))
+    sm.transition(
+        event_type=GovernanceEventType.OBSERVATION_RECORDED,
+        tick=1,
+        payload={},
+        actor="snapshot_test",
+        target_state=GovernanceState.ASSESSED,
+    )
+    sm.blocked_workflows.append("wf_pending")
+    snapshot = take_snapshot(sm)
+    assert verify_snapshot(snapshot, sm.events)
+
+    forged = dataclasses.replace(snapshot, blocked_workflows=())
+    assert not verify_snapshot(forged)
+
+    write_snapshot(str(tmp_path), forged)
+    assert load_latest_snapshot(str(tmp_path), sm.events) is None
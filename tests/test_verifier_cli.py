@@ -0,0 +1,57 @@
+import json
+
+from omega_core.evidence.capsule_store import write_capsule_directory, write_packed_capsule
+from omega_core.verifier.__main__ import main
+
+from .test_capsule_verifier import _capsule
+
+
+def test_cli_verifies_json_packed_and_directory_capsules(tmp_path, capsys):
+    capsules = tmp_path / "capsules"
+    capsules.mkdir()
+    (capsules / "a.json").write_text(json.dumps(_capsule()))
+    write_packed_capsule(str(capsules / "b.pack"), _capsule())
+    write_capsule_directory(str(capsules / "c"), _capsule())
+
+    tampered = _capsule()
+    tampered["authority_claim_ids"].reverse()
+    (capsules / "d.json").write_text(json.dumps(tampered))
+
+    assert main([str(capsules), "--workers", "2"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [r["path"].rsplit("/", 1)[-1] for r in records] == ["a.json", "b.pack", "c", "d.json"]
+    assert [r["valid"] for r in records] == [True, True, True, False]
+    assert all(r["bytes_on_disk"] > 0 and len(r["stages"]) == 4 for r in records)
+
+    assert main([str(capsules / "*.pack"), "--workers", "1"]) == 0
+
+
+def test_cli_rejects_non_positive_worker_counts(tmp_path):
+    for flag in ("--workers", "--stage-workers"):
+        for value in ("0", "-2", "many"):
+            try:
+                main([str(tmp_path), flag, value])
+                assert False, f"{flag} {value} should be rejected"
+            except SystemExit as e:
+                assert e.code == 2
+
+
+def test_cli_reports_unreadable_capsules_and_keeps_going(tmp_path, capsys):
+    capsules = tmp_path / "capsules"
+    capsules.mkdir()
+    write_packed_capsule(str(capsules / "a.pack"), _capsule())
+    data = (capsules / "a.pack").read_bytes()
+    (capsules / "b.pack").write_bytes(data[:len(data) // 2])
+    (capsules / "c.json").write_text("[1, 2]")
+    (capsules / "d.json").write_text("{")
+    (capsules / "e.json").write_text(json.dumps(_capsule()))
+
+    for workers in ("1", "2"):
+        assert main([str(capsules), "--workers", workers]) == 1
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["valid"] for r in records] == [True, False, False, False, True]
+        assert all(
+            r["message"].startswith("INVALID: unreadable capsule")
+            for r in records[1:4]
+        )
@@ -0,0 +1,157 @@
+from dataclasses import replace
+
+from omega_core.core.clock import DeterministicClock
+from omega_core.core.exceptions import GovernanceInvariantViolation
+from omega_core.core.hashing import deterministic_hash
+from omega_core.governance.binary import decode_events, encode_events
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.replay import replay_events
+from omega_core.governance.state_machine import GovernanceStateMachine
+from omega_core.threat.threat_model import ThreatModelMode
+from omega_core.workflows.engine import WorkflowEngine
+from omega_core.workflows.fleet_accountability import create_fleet_accountability_workflow
+from omega_core.workflows.timing_wheel import TimingWheel
+
+from .lifecycle import run_lifecycle
+
+
+def _committed_session():
+    sm = GovernanceStateMachine(DeterministicClock("wf_session"))
+    return run_lifecycle(sm, 3, actor="operator", payload={})
+
+
+def _close(sm, tick):
+    return sm.transition(
+        event_type=GovernanceEventType.CYCLE_CLOSED,
+        tick=tick,
+        payload={},
+        actor="operator",
+        target_state=GovernanceState.CLOSED,
+    )
+
+
+def test_timing_wheel_fires_in_deadline_order_across_levels():
+    wheel = TimingWheel(slot_bits=2, levels=2)
+    deadlines = {f"w{i:03d}": (i * 37) % 200 + 1 for i in range(100)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+    assert wheel.cancel("w000") and not wheel.cancel("w000")
+    del deadlines["w000"]
+
+    fired = wheel.advance(90) + wheel.advance(90) + wheel.advance(500)
+    assert fired == sorted(((k, d) for k, d in deadlines.items()), key=lambda kd: (kd[1], kd[0]))
+    assert len(wheel) == 0 and wheel.current_tick == 500
+
+
+def test_deadlines_expire_escalate_and_acknowledgment_unblocks_closure():
+    sm = _committed_session()
+    engine = WorkflowEngine(sm, start_tick=3)
+    anchor = sm.last_event_hash
+    late = engine.open(create_fleet_accountability_workflow(
+        tick=3, event_hash=anchor, ack_deadline_ticks=10,
+    ))
+    quiet = engine.open(create_fleet_accountability_workflow(
+        tick=3, event_hash=anchor, ack_deadline_ticks=5, escalation_rule="none",
+    ))
+    prompt = engine.open(create_fleet_accountability_workflow(
+        tick=4, event_hash=anchor, ack_deadline_ticks=10,
+    ))
+    assert set(sm.blocked_workflows) == {late, quiet, prompt}
+
+    assert engine.advance(8) == []
+    engine.acknowledge(prompt, tick=8, acknowledger="supervisor")
+
+    events = engine.advance(14)
+    assert [(e.event_type, e.tick) for e in events] == [
+        (GovernanceEventType.WORKFLOW_EXPIRED, 9),
+        (GovernanceEventType.WORKFLOW_EXPIRED, 14),
+        (GovernanceEventType.WORKFLOW_ESCALATED, 14),
+    ]
+    assert engine.workflows[quiet].status == "EXPIRED"
+    assert engine.workflows[late].status == "ESCALATED"
+    assert engine.workflows[prompt].status == "ACKNOWLEDGED"
+    assert engine.workflows[prompt].ack_timestamp is not None
+    assert engine.pending_count == 0
+
+    try:
+        _close(sm, 15)
+        assert False, "Closure should have been blocked"
+    except GovernanceInvariantViolation:
+        assert True
+
+    engine.acknowledge(late, tick=15, acknowledger="supervisor")
+    engine.acknowledge(quiet, tick=15, acknowledger="supervisor")
+    _close(sm, 16)
+    assert sm.current_state == GovernanceState.CLOSED
+
+    # Workflow events are state-preserving and replay like any other.
+    chain = [e.to_dict() for e in sm.events]
+    assert replay_events(chain).last_event_hash == sm.last_event_hash
+    assert [e.to_dict() for e in decode_events(encode_events(sm.events))] == chain
+
+
+def test_late_acknowledgment_expires_first_and_ticks_never_go_back():
+    sm = _committed_session()
+    engine = WorkflowEngine(sm, start_tick=3)
+    workflow_id = engine.open(create_fleet_accountability_workflow(
+        tick=3, event_hash=sm.last_event_hash, ack_deadline_ticks=3,
+    ))
+
+    ack = engine.acknowledge(workflow_id, tick=500, acknowledger="supervisor")
+    assert [e.event_type for e in list(sm.events)[-3:]] == [
+        GovernanceEventType.WORKFLOW_EXPIRED,
+        GovernanceEventType.WORKFLOW_ESCALATED,
+        GovernanceEventType.WORKFLOW_ACKNOWLEDGED,
+    ]
+    assert ack.tick == 500
+
+    try:
+        engine.acknowledge(workflow_id, tick=499, acknowledger="supervisor")
+        assert False, "Acknowledgment before the engine tick should be rejected"
+    except GovernanceInvariantViolation:
+        assert True
+
+    # Expiry processed after later events is stamped at the chain's tick.
+    other = engine.open(create_fleet_accountability_workflow(
+        tick=500, event_hash=sm.last_event_hash, ack_deadline_ticks=1,
+    ))
+    sm.transition(
+        event_type=GovernanceEventType.THREAT_DETECTED,
+        tick=700,
+        payload={},
+        actor="operator",
+        target_state=sm.current_state,
+    )
+    pending_hash = engine.workflows[other].workflow_hash
+    (event, _) = engine.advance(800)
+    assert event.tick == 700
+    assert event.payload_hash == deterministic_hash(
+        {"workflow_id": other, "workflow_hash": pending_hash, "deadline_tick": 501},
+        "EventPayload",
+    )
+    assert engine.workflows[other].status == "ESCALATED"
+
+
+def test_closed_session_drops_pending_deadlines():
+    sm = _committed_session()
+    engine = WorkflowEngine(sm, start_tick=3)
+    engine.open(replace(
+        create_fleet_accountability_workflow(
+            tick=3, event_hash=sm.last_event_hash, ack_deadline_ticks=2,
+        ),
+        blocks_closure=False,
+    ))
+    _close(sm, 4)
+
+    assert engine.advance(10) == []
+    assert engine.pending_count == 0
+    assert engine.advance(20) == [] and engine.current_tick == 20
+
+
+def test_threat_event_preserves_state_and_blocks_closure():
+    sm = _committed_session()
+    event = ThreatModelMode(enabled=True).emit_threat_event(
+        state_machine=sm, tick=4, threat_details={"threat": "event_reordering"},
+    )
+    assert event.state_before == event.state_after == GovernanceState.COMMITTED
+    assert sm.blocked_workflows == ["threat_4_event_reordering"]
@@ -81,7 +81,7 @@ class ThreatModelMode:
         }
 
         workflow_id = f"threat_{tick}_{payload['threat_type']}"
-        state_machine.blocked_workflows.append(workflow_id)
+        state_machine.block_workflow(workflow_id)
 
         return state_machine.transition(
             event_type=GovernanceEventType.THREAT_DETECTED,
@@ -6,3 +6,4 @@ Refuses to certify partial truth.
 """
 
 from .capsule_verifier import *
+from .merkle_verifier import *
@@ -0,0 +1,174 @@
+"""
+Batch capsule verification.
+
+    python -m omega_core.verifier [--workers N] PATH_OR_GLOB ...
+
+Inputs may be JSON capsules, packed capsules (write_packed_capsule),
+capsule directories (write_capsule_directory), directories of those, or
+globs. Capsules are verified in parallel worker processes; one JSON line
+is written per capsule with the verdict, per-stage durations and
+bytes_on_disk (the capsule file, or every file in a capsule directory).
+A capsule that cannot be opened or verified gets an INVALID record; the
+batch continues. Exits 0 only if every capsule is VALID.
+"""
+
+import argparse
+import glob
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from omega_core.evidence.capsule_store import (
+    PACKED_MAGIC,
+    REFS_FILE,
+    DirectoryCapsuleStore,
+    PackedCapsuleStore,
+)
+from omega_core.core.exceptions import EvidenceVerificationError
+
+from .capsule_verifier import OmegaVerifier
+
+
+CAPSULE_SUFFIXES = (".json", ".pack")
+
+
+def _is_capsule_directory(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, REFS_FILE))
+
+
+def iter_capsule_paths(specs: List[str]) -> Iterator[str]:
+    """Expand files, globs and directories into capsule paths, in sorted order."""
+    for spec in specs:
+        matches = sorted(glob.glob(spec)) if glob.has_magic(spec) else [spec]
+        for path in matches:
+            if os.path.isdir(path) and not _is_capsule_directory(path):
+                for name in sorted(os.listdir(path)):
+                    child = os.path.join(path, name)
+                    if _is_capsule_directory(child) or name.endswith(CAPSULE_SUFFIXES):
+                        yield child
+            else:
+                yield path
+
+
+def _size_on_disk(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def _open_capsule(path: str) -> Any:
+    if os.path.isdir(path):
+        return DirectoryCapsuleStore(path)
+    with open(path, "rb") as f:
+        magic = f.read(len(PACKED_MAGIC))
+        if magic == PACKED_MAGIC:
+            return PackedCapsuleStore(path)
+        f.seek(0)
+        capsule = json.load(f)
+    if not isinstance(capsule, dict):
+        raise ValueError("capsule JSON is not an object")
+    return capsule
+
+
+def verify_capsule_path(path: str, stage_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Verify one capsule file or directory; returns its result record.
+    Never raises for a bad capsule, so one file cannot abort a batch.
+    """
+    start = time.perf_counter()
+    record: Dict[str, Any] = {"path": path}
+    try:
+        record["bytes_on_disk"] = _size_on_disk(path)
+        capsule = _open_capsule(path)
+    except (
+        OSError,
+        ValueError,
+        KeyError,
+        TypeError,
+        struct.error,
+        EvidenceVerificationError,
+    ) as e:
+        record.update(
+            valid=False,
+            message=f"INVALID: unreadable capsule: {e}",
+            stages=[],
+            duration_s=time.perf_counter() - start,
+        )
+        return record
+
+    verifier = OmegaVerifier(capsule)
+    try:
+        valid, message = verifier.verify_capsule(workers=stage_workers)
+    except Exception as e:
+        valid, message = False, f"INVALID: verification_exception: {e}"
+    finally:
+        close = getattr(capsule, "close", None)
+        if close is not None:
+            close()
+
+    record.update(
+        valid=valid,
+        message=message,
+        stages=verifier.timing_report(),
+        duration_s=time.perf_counter() - start,
+    )
+    return record
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m omega_core.verifier",
+        description="Verify Omega capsules and emit JSON-lines results.",
+    )
+    parser.add_argument("paths", nargs="+", help="capsule files, directories or globs")
+    parser.add_argument("--workers", type=_positive_int, default=None,
+                        help="worker processes (default: CPU count; 1 = in-process)")
+    parser.add_argument("--stage-workers", type=_positive_int, default=None,
+                        help="concurrent stages per capsule (1 = serial)")
+    parser.add_argument("--output", default="-", help="JSON-lines output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    paths = list(iter_capsule_paths(args.paths))
+    pool = None
+    if args.workers != 1 and len(paths) > 1:
+        pool = ProcessPoolExecutor(max_workers=args.workers)
+        results = pool.map(verify_capsule_path, paths, [args.stage_workers] * len(paths))
+    else:
+        results = (verify_capsule_path(p, args.stage_workers) for p in paths)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    all_valid = bool(paths)
+    try:
+        for record in results:
+            all_valid = all_valid and record["valid"]
+            out.write(json.dumps(record, sort_keys=True) + "\n")
+            out.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if out is not sys.stdout:
+            out.close()
+
+    return 0 if all_valid else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
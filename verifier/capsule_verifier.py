@@ -1,8 +1,51 @@
-from typing import Dict, Any, Tuple, List
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from omega_core.core.hashing import deterministic_hash
-from omega_core.core.exceptions import VerificationIncompleteError
+from omega_core.core.exceptions import (
+    GovernanceInvariantViolation,
+    VerificationIncompleteError,
+)
+from omega_core.evidence.models import VerifiableEvidence
+from omega_core.evidence.verifier import ProofVerifier
 from omega_core.governance.events import GovernanceEvent
+from omega_core.governance.invariants import (
+    PARALLEL_CHUNK_SIZE,
+    recompute_event_hashes,
+)
+from omega_core.governance.replay import ReplayEngine
+from omega_core.proof.bundle import content_authority_claim_id
+
+
+# Events replayed between cancellation checks in the event-chain stage.
+_CANCEL_CHECK_EVERY = 1024
+
+
+class _StageCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """
+    One verification stage's outcome.
+    status: "passed", "failed" or "cancelled".
+    """
+    stage: str
+    status: str
+    duration_s: float
+    detail: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "status": self.status,
+            "duration_s": self.duration_s,
+            "detail": self.detail,
+        }
 
 
 class OmegaVerifier:
@@ -12,25 +55,126 @@ class OmegaVerifier:
     INVARIANT:
     Evidence verification must re-derive all hashes or fail.
     Partial verification is treated as INVALID.
+
+    Capsule layout:
+    - "governance": {"spec", "spec_hash"}
+    - "authority_claims", "authority_claim_ids"
+    - "negative_authority_proof": NegativeAuthorityProof.to_dict()
+    - "events": serialized governance event chain
+    - evidence artifacts at top level under their evidence_ref
+
+    Stages are independent and run concurrently on threads; the first
+    failure cancels the rest. Threads overlap the stages but share the
+    GIL, so the CPU-bound hashing is not parallel; hash_workers moves the
+    event-chain hashing of long chains into worker processes.
+    stage_report holds per-stage timings in plan order.
     """
 
-    def __init__(self, capsule: Dict[str, Any]):
+    STAGES = (
+        "governance_spec",
+        "authority_claim_ids",
+        "negative_authority_proof",
+        "event_chain",
+    )
+
+    def __init__(self, capsule: Mapping[str, Any]):
         self.capsule = capsule
         self.verification_log: List[str] = []
+        self.stage_report: List[StageTiming] = []
+        self._cancel = threading.Event()
+        self._hash_workers: Optional[int] = None
 
-    def verify_capsule(self) -> Tuple[bool, str]:
-        try:
-            self._verify_governance_spec()
-            self._verify_authority_claim_ids()
-            self._verify_negative_authority_proof()
-            self._verify_event_chain()
+    def verify_capsule(
+        self,
+        *,
+        workers: Optional[int] = None,
+        hash_workers: Optional[int] = None,
+    ) -> Tuple[bool, str]:
+        """
+        workers=1 runs the stages serially in plan order. hash_workers > 1
+        re-derives event hashes in that many processes for chains longer
+        than PARALLEL_CHUNK_SIZE.
+        """
+        self.verification_log = []
+        self._hash_workers = hash_workers
+        self._cancel.clear()
 
+        stages: Dict[str, Callable[[], None]] = {
+            "governance_spec": self._verify_governance_spec,
+            "authority_claim_ids": self._verify_authority_claim_ids,
+            "negative_authority_proof": self._verify_negative_authority_proof,
+            "event_chain": self._verify_event_chain,
+        }
+        timings: Dict[str, StageTiming] = {}
+
+        if workers == 1:
+            failure = None
+            for name in self.STAGES:
+                if failure is not None:
+                    timings[name] = StageTiming(name, "cancelled", 0.0)
+                    continue
+                timings[name], failure = self._run_stage(name, stages[name])
+        else:
+            failure = self._run_concurrently(stages, timings, workers)
+
+        self.stage_report = [timings[name] for name in self.STAGES]
+        if failure is None:
             return True, "VALID"
+        if isinstance(failure, VerificationIncompleteError):
+            return False, f"INVALID: verification_incomplete: {failure}"
+        return False, f"INVALID: verification_exception: {failure}"
+
+    def timing_report(self) -> List[Dict[str, Any]]:
+        return [t.to_dict() for t in self.stage_report]
+
+    # ---- scheduling ----
 
-        except VerificationIncompleteError as e:
-            return False, f"INVALID: verification_incomplete: {e}"
+    def _run_stage(
+        self,
+        name: str,
+        stage: Callable[[], None],
+    ) -> Tuple[StageTiming, Optional[Exception]]:
+        start = time.perf_counter()
+        try:
+            stage()
+        except _StageCancelled:
+            return StageTiming(name, "cancelled", time.perf_counter() - start), None
         except Exception as e:
-            return False, f"INVALID: verification_exception: {e}"
+            self._cancel.set()
+            return StageTiming(name, "failed", time.perf_counter() - start, str(e)), e
+        return StageTiming(name, "passed", time.perf_counter() - start), None
+
+    def _run_concurrently(
+        self,
+        stages: Dict[str, Callable[[], None]],
+        timings: Dict[str, StageTiming],
+        workers: Optional[int],
+    ) -> Optional[Exception]:
+        failure: Optional[Exception] = None
+        pool = ThreadPoolExecutor(max_workers=workers or len(stages))
+        try:
+            pending = {
+                pool.submit(self._run_stage, name, stage): name
+                for name, stage in stages.items()
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    timings[name], error = future.result()
+                    if error is not None and failure is None:
+                        failure = error
+                        for other, other_name in pending.items():
+                            if other.cancel():
+                                timings[other_name] = StageTiming(other_name, "cancelled", 0.0)
+                pending = {f: n for f, n in pending.items() if not f.cancelled()}
+        finally:
+            pool.shutdown(wait=True)
+        return failure
+
+    def _check_cancelled(self) -> None:
+        if self._cancel.is_set():
+            raise _StageCancelled()
 
     # ---- individual verification steps ----
 
@@ -52,22 +196,97 @@ class OmegaVerifier:
         self.verification_log.append("Governance spec hash verified")
 
     def _verify_authority_claim_ids(self) -> None:
-        # Explicit refusal until implemented
-        raise VerificationIncompleteError(
-            "Authority claim ID verification not implemented"
+        claims = self.capsule.get("authority_claims")
+        claim_ids = self.capsule.get("authority_claim_ids")
+        if claims is None or claim_ids is None:
+            raise VerificationIncompleteError("Missing authority claims or claim IDs")
+        if len(claims) != len(claim_ids):
+            raise VerificationIncompleteError("Authority claim ID count mismatch")
+
+        for index, (claim, claim_id) in enumerate(zip(claims, claim_ids)):
+            self._check_cancelled()
+            # Only content-derived IDs can be checked; an explicit claim_id
+            # is self-asserted, so it is refused rather than trusted.
+            if not str(claim_id).startswith("claim_"):
+                raise VerificationIncompleteError(
+                    f"Authority claim ID at index {index} is not content-derived"
+                )
+            if content_authority_claim_id(claim) != claim_id:
+                raise VerificationIncompleteError(
+                    f"Authority claim ID mismatch at index {index}"
+                )
+
+        self.verification_log.append(
+            f"Authority claim IDs re-derived ({len(claims)} claims)"
         )
 
     def _verify_negative_authority_proof(self) -> None:
-        raise VerificationIncompleteError(
-            "Negative authority proof verification not implemented"
+        proof = self.capsule.get("negative_authority_proof")
+        if not proof:
+            raise VerificationIncompleteError("No negative authority proof present")
+
+        try:
+            body = {"tick": proof["tick"], "asserted_absences": proof["asserted_absences"]}
+            expected_hash = proof["proof_hash"]
+            evidence = [
+                VerifiableEvidence.from_dict(a["evidence"])
+                for a in proof["asserted_absences"]
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            raise VerificationIncompleteError(f"Malformed negative authority proof: {e}")
+
+        if deterministic_hash(body, "NegativeAuthorityProof") != expected_hash:
+            raise VerificationIncompleteError("Negative authority proof hash mismatch")
+        if not evidence:
+            raise VerificationIncompleteError("Negative authority proof asserts no absences")
+
+        self._check_cancelled()
+        results = ProofVerifier(self.capsule).verify_many(evidence)
+        for item, result in zip(evidence, results):
+            if not result.valid:
+                raise VerificationIncompleteError(
+                    f"Absence evidence {item.evidence_ref} failed: {result.failure_reason}"
+                )
+
+        self.verification_log.append(
+            f"Negative authority proof verified ({len(evidence)} evidence items)"
         )
 
     def _verify_event_chain(self) -> None:
         events = self.capsule.get("events")
         if not events:
             raise VerificationIncompleteError("No governance events present")
+        # Only the chain stored in the capsule counts. iter_event_records
+        # would also open a str/PathLike as a local file or directory.
+        if not isinstance(events, list):
+            raise VerificationIncompleteError(
+                "Capsule events must be an inline list of event records"
+            )
+
+        engine = ReplayEngine()
+        try:
+            decoded = [
+                e if isinstance(e, GovernanceEvent) else GovernanceEvent.from_dict(e)
+                for e in events
+            ]
+            recomputed: List[Optional[str]] = [None] * len(decoded)
+            workers = self._hash_workers
+            if workers is not None and workers > 1 and len(decoded) > PARALLEL_CHUNK_SIZE:
+                # A process pool cannot be interrupted mid-chunk, so
+                # cancellation is only checked around it.
+                self._check_cancelled()
+                recomputed = recompute_event_hashes(decoded, workers)
+                self._check_cancelled()
+            for event, recomputed_hash in zip(decoded, recomputed):
+                if engine.event_count % _CANCEL_CHECK_EVERY == 0:
+                    self._check_cancelled()
+                engine.apply(event, recomputed_hash)
+        except (GovernanceInvariantViolation, KeyError, ValueError) as e:
+            raise VerificationIncompleteError(
+                f"Event chain replay failed: {e}"
+            )
 
-        # Explicit refusal until full replay logic exists
-        raise VerificationIncompleteError(
-            "Event chain replay verification not implemented"
+        self.verification_log.append(
+            f"Event chain replayed ({engine.event_count} events, "
+            f"final state {engine.current_state.value})"
         )
@@ -0,0 +1,164 @@
+"""
+Standalone checks for Merkle inclusion and consistency proofs
+(RFC 9162 §2.1.3.2 and §2.1.4.2). No access to the event chain needed.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from omega_core.core.hashing import deterministic_hash
+from omega_core.governance.events import GovernanceEvent, governance_event_body
+from omega_core.proof.bundle import recompute_bundle_hash
+from omega_core.proof.merkle import merkle_leaf_hash, merkle_node_hash
+
+
+def verify_inclusion(
+    *,
+    event_hash: str,
+    leaf_index: int,
+    tree_size: int,
+    path: Sequence[str],
+    root: str,
+) -> bool:
+    if not 0 <= leaf_index < tree_size:
+        return False
+
+    try:
+        r = merkle_leaf_hash(event_hash)
+        nodes = [bytes.fromhex(h) for h in path]
+    except (TypeError, ValueError):
+        return False
+
+    fn, sn = leaf_index, tree_size - 1
+    for p in nodes:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = merkle_node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = merkle_node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and r.hex() == root
+
+
+def verify_consistency(
+    *,
+    first_size: int,
+    second_size: int,
+    path: Sequence[str],
+    first_root: str,
+    second_root: str,
+) -> bool:
+    if not 0 <= first_size <= second_size:
+        return False
+    if first_size == second_size:
+        return not path and first_root == second_root
+    if first_size == 0:
+        return not path
+    if not path:
+        return False
+
+    try:
+        nodes: List[bytes] = [bytes.fromhex(h) for h in path]
+        if first_size & (first_size - 1) == 0:
+            nodes.insert(0, bytes.fromhex(first_root))
+    except (TypeError, ValueError):
+        return False
+
+    fn, sn = first_size - 1, second_size - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+
+    fr = sr = nodes[0]
+    for c in nodes[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = merkle_node_hash(c, fr)
+            sr = merkle_node_hash(c, sr)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = merkle_node_hash(sr, c)
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and fr.hex() == first_root and sr.hex() == second_root
+
+
+def verify_inclusion_proof(proof: Dict[str, Any]) -> bool:
+    """verify_inclusion over an InclusionProof.to_dict()."""
+    return verify_inclusion(
+        event_hash=proof["event_hash"],
+        leaf_index=proof["leaf_index"],
+        tree_size=proof["tree_size"],
+        path=proof["path"],
+        root=proof["root"],
+    )
+
+
+def verify_consistency_proof(proof: Dict[str, Any]) -> bool:
+    """verify_consistency over a ConsistencyProof.to_dict()."""
+    return verify_consistency(
+        first_size=proof["first_size"],
+        second_size=proof["second_size"],
+        path=proof["path"],
+        first_root=proof["first_root"],
+        second_root=proof["second_root"],
+    )
+
+
+def verify_bundle_event_slice(bundle: Dict[str, Any]) -> bool:
+    """
+    Check that a MinimalProofBundle's event_chain_slice is the tail of the
+    chain committed to by its event_chain_merkle root.
+
+    Each slice event's hash is re-derived from its body and the slice must
+    be hash-linked; every inclusion proof must be against the recorded root
+    and tree size at the slice's positions; and the bundle_hash, which
+    covers that root and size, must re-derive from the bundle's content.
+    """
+    merkle = bundle.get("event_chain_merkle")
+    if not merkle:
+        return False
+
+    events = bundle.get("event_chain_slice") or []
+    proofs = merkle.get("slice_inclusion_proofs") or []
+    tree_size = merkle.get("tree_size")
+    if not events or len(events) != len(proofs) or not isinstance(tree_size, int):
+        return False
+
+    try:
+        if recompute_bundle_hash(bundle) != bundle.get("bundle_hash"):
+            return False
+        decoded = [GovernanceEvent.from_dict(event) for event in events]
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    first_index = tree_size - len(events)
+    prev_hash = None
+    for i, (event, proof) in enumerate(zip(decoded, proofs)):
+        recomputed = deterministic_hash(governance_event_body(event), "GovernanceEvent")
+        if recomputed != event.event_hash:
+            return False
+        if prev_hash is not None and event.prev_event_hash != prev_hash:
+            return False
+        prev_hash = event.event_hash
+
+        if proof.get("event_hash") != recomputed:
+            return False
+        if proof.get("leaf_index") != first_index + i:
+            return False
+        if proof.get("root") != merkle.get("root"):
+            return False
+        if proof.get("tree_size") != tree_size:
+            return False
+        if not verify_inclusion_proof(proof):
+            return False
+    return True
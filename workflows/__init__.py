@@ -6,3 +6,5 @@ until obligations are acknowledged or resolved.
 """
 
 from .fleet_accountability import *
+from .timing_wheel import *
+from .engine import *
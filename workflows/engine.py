@@ -0,0 +1,194 @@
+"""
+Accountability workflow engine.
+
+Tracks open FleetAccountabilityWorkflow contracts for one governance
+state machine. Opening a workflow blocks closure; deadlines live in a
+TimingWheel, so advancing a tick costs the same with ten or ten thousand
+open workflows. When a deadline passes the workflow becomes EXPIRED
+(WORKFLOW_EXPIRED event) and, unless its escalation_rule is "none",
+ESCALATED (WORKFLOW_ESCALATED event). Acknowledgment records a
+WORKFLOW_ACKNOWLEDGED event and lifts the closure block; expired and
+escalated workflows keep blocking closure until acknowledged.
+
+Workflow events are state-preserving. Which workflows are open is not
+recoverable from the event chain; snapshots carry the blocked set.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+from omega_core.core.constants import HASH_REFERENCE_LENGTH
+from omega_core.core.exceptions import GovernanceInvariantViolation
+from omega_core.governance.enums import GovernanceEventType, GovernanceState
+from omega_core.governance.events import GovernanceEvent
+from omega_core.governance.state_machine import GovernanceStateMachine, TransitionSpec
+
+from .fleet_accountability import FleetAccountabilityWorkflow, update_workflow_status
+from .timing_wheel import TimingWheel
+
+
+ESCALATION_NONE = "none"
+
+
+def workflow_deadline(workflow: FleetAccountabilityWorkflow) -> int:
+    """Last tick on which an acknowledgment is on time."""
+    if workflow.ack_deadline_policy != "N_ticks":
+        raise ValueError(f"Unknown ack deadline policy: {workflow.ack_deadline_policy}")
+    return workflow.tick + workflow.ack_deadline_value
+
+
+class WorkflowEngine:
+    """
+    Drives accountability workflows on tick boundaries.
+
+    Each operation holds sm.write_lock, so its events and closure-block
+    changes are applied together.
+    """
+
+    def __init__(
+        self,
+        sm: GovernanceStateMachine,
+        *,
+        actor: str = "workflow_engine",
+        start_tick: int = 0,
+    ):
+        self.sm = sm
+        self.actor = actor
+        self.workflows: Dict[str, FleetAccountabilityWorkflow] = {}
+        self._deadlines = TimingWheel(start_tick=start_tick)
+
+    @property
+    def current_tick(self) -> int:
+        return self._deadlines.current_tick
+
+    @property
+    def pending_count(self) -> int:
+        """Workflows still waiting on their deadline."""
+        return len(self._deadlines)
+
+    def open_workflows(self) -> Iterator[FleetAccountabilityWorkflow]:
+        return (w for w in self.workflows.values() if w.status != "ACKNOWLEDGED")
+
+    def open(
+        self,
+        workflow: FleetAccountabilityWorkflow,
+        *,
+        workflow_id: Optional[str] = None,
+    ) -> str:
+        """Track workflow and block closure on it; returns its workflow id."""
+        if workflow_id is None:
+            workflow_id = f"wf_{workflow.workflow_hash[:HASH_REFERENCE_LENGTH]}"
+        deadline = workflow_deadline(workflow)
+
+        with self.sm.write_lock:
+            if workflow_id in self.workflows:
+                raise GovernanceInvariantViolation(f"Workflow already open: {workflow_id}")
+            if self.sm.current_state == GovernanceState.CLOSED:
+                raise GovernanceInvariantViolation("Cannot open workflow on a CLOSED session")
+            self.workflows[workflow_id] = workflow
+            if workflow.blocks_closure:
+                self.sm.block_workflow(workflow_id)
+            # Fires on the first tick past the deadline.
+            self._deadlines.schedule(workflow_id, deadline + 1)
+        return workflow_id
+
+    def acknowledge(
+        self,
+        workflow_id: str,
+        *,
+        tick: int,
+        acknowledger: str,
+    ) -> GovernanceEvent:
+        """
+        Acknowledge an open workflow at tick, lifting its closure block.
+
+        Deadlines up to tick are processed first, so an acknowledgment
+        after the deadline is recorded against an EXPIRED/ESCALATED
+        workflow, never as on time.
+        """
+        with self.sm.write_lock:
+            if tick < self.current_tick:
+                raise GovernanceInvariantViolation(
+                    f"Acknowledgment tick {tick} precedes engine tick {self.current_tick}"
+                )
+            self.advance(tick)
+            workflow = self.workflows[workflow_id]
+            if workflow.status == "ACKNOWLEDGED":
+                raise GovernanceInvariantViolation(
+                    f"Workflow already acknowledged: {workflow_id}"
+                )
+
+            event = self.sm.transition(
+                event_type=GovernanceEventType.WORKFLOW_ACKNOWLEDGED,
+                tick=tick,
+                payload={
+                    "workflow_id": workflow_id,
+                    "workflow_hash": workflow.workflow_hash,
+                    "prior_status": workflow.status,
+                    "acknowledger": acknowledger,
+                },
+                actor=acknowledger,
+                target_state=self.sm.current_state,
+            )
+
+            self._deadlines.cancel(workflow_id)
+            self.workflows[workflow_id] = update_workflow_status(
+                workflow,
+                status="ACKNOWLEDGED",
+                acknowledger=acknowledger,
+                ack_timestamp=event.timestamp,
+            )
+            self.sm.unblock_workflow(workflow_id)
+            return event
+
+    def advance(self, tick: int) -> List[GovernanceEvent]:
+        """
+        Process every tick up to tick, expiring (and escalating) workflows
+        whose deadline passed. All resulting events commit as one batch.
+
+        Events never go back in time: each is stamped with its expiry tick
+        or the chain's last tick, whichever is later; the deadline stays in
+        the payload. On a CLOSED session pending deadlines are dropped,
+        since nothing more can be recorded.
+        """
+        with self.sm.write_lock:
+            if self.sm.current_state == GovernanceState.CLOSED:
+                for workflow_id in list(self.workflows):
+                    self._deadlines.cancel(workflow_id)
+                self._deadlines.advance(tick)
+                return []
+
+            fired = self._deadlines.advance(tick)
+            if not fired:
+                return []
+
+            last = self.sm.events.last()
+            floor_tick = last.tick if last is not None else fired[0][1]
+            state = self.sm.current_state
+            specs: List[TransitionSpec] = []
+            updated: Dict[str, FleetAccountabilityWorkflow] = {}
+            for workflow_id, expiry_tick in fired:
+                workflow = self.workflows[workflow_id]
+                event_tick = max(expiry_tick, floor_tick)
+                payload = {
+                    "workflow_id": workflow_id,
+                    "workflow_hash": workflow.workflow_hash,
+                    "deadline_tick": expiry_tick - 1,
+                }
+                specs.append(TransitionSpec(
+                    GovernanceEventType.WORKFLOW_EXPIRED, event_tick, payload, self.actor, state,
+                ))
+                status = "EXPIRED"
+                if workflow.escalation_rule != ESCALATION_NONE:
+                    specs.append(TransitionSpec(
+                        GovernanceEventType.WORKFLOW_ESCALATED,
+                        event_tick,
+                        dict(payload, escalation_rule=workflow.escalation_rule),
+                        self.actor,
+                        state,
+                    ))
+                    status = "ESCALATED"
+                updated[workflow_id] = update_workflow_status(workflow, status=status)
+
+            events = self.sm.transition_many(specs)
+            self.workflows.update(updated)
+            return events
@@ -1,9 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, Any, Optional, Literal
 
+from omega_core.core.canonical import register_canonical_fields
 from omega_core.core.hashing import deterministic_hash
 
 
+@register_canonical_fields
 @dataclass
 class FleetAccountabilityWorkflow:
     """
@@ -70,3 +72,35 @@ def create_fleet_accountability_workflow(
         workflow_hash=workflow_hash,
         blocks_closure=True,
     )
+
+
+def update_workflow_status(
+    workflow: FleetAccountabilityWorkflow,
+    *,
+    status: str,
+    acknowledger: Optional[str] = None,
+    ack_timestamp: Optional[str] = None,
+) -> FleetAccountabilityWorkflow:
+    """
+    New contract with the given status and a re-derived workflow_hash.
+    An ACKNOWLEDGED workflow no longer blocks closure.
+    """
+    blocks_closure = status != "ACKNOWLEDGED"
+    body = {
+        "tick": workflow.tick,
+        "event_hash": workflow.event_hash,
+        "ack_deadline_policy": workflow.ack_deadline_policy,
+        "ack_deadline_value": workflow.ack_deadline_value,
+        "escalation_rule": workflow.escalation_rule,
+        "status": status,
+        "blocks_closure": blocks_closure,
+    }
+
+    return replace(
+        workflow,
+        status=status,
+        acknowledger=acknowledger if acknowledger is not None else workflow.acknowledger,
+        ack_timestamp=ack_timestamp if ack_timestamp is not None else workflow.ack_timestamp,
+        workflow_hash=deterministic_hash(body, "FleetAccountabilityWorkflow"),
+        blocks_closure=blocks_closure,
+    )
@@ -0,0 +1,118 @@
+"""
+Hierarchical timing wheel for tick deadlines.
+
+Level 0 has one slot per tick; each higher level's slot spans a full
+rotation of the level below. Scheduling and cancelling are O(1);
+advancing one tick touches one level-0 slot, plus one higher-level slot
+every `slots` ticks whose entries cascade down. Per-tick cost therefore
+does not depend on how many deadlines are pending.
+
+Deadlines beyond the wheel's range park in the top level and re-cascade
+until they are in range.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class TimingWheel:
+    """
+    Deadlines keyed by a hashable, mutually orderable key (e.g. str);
+    each key has at most one deadline.
+
+    advance(tick) returns (key, deadline) for every deadline <= tick, in
+    deadline order and, within a tick, sorted by key, so expiry order is
+    independent of scheduling history.
+    """
+
+    def __init__(self, *, start_tick: int = 0, slot_bits: int = 6, levels: int = 4):
+        if slot_bits <= 0 or levels <= 0:
+            raise ValueError("slot_bits and levels must be positive")
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._range = 1 << (slot_bits * levels)
+        self._levels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+        # Next tick to process; every tick before it has fired.
+        self._next = start_tick + 1
+
+    @property
+    def current_tick(self) -> int:
+        return self._next - 1
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def deadline(self, key: Hashable) -> Optional[int]:
+        where = self._where.get(key)
+        return None if where is None else self._levels[where[0]][where[1]][key]
+
+    def schedule(self, key: Hashable, deadline: int) -> None:
+        """
+        Set key's deadline, replacing any earlier one.
+        Deadlines already passed fire on the next tick processed.
+        """
+        self.cancel(key)
+        self._place(key, deadline)
+
+    def cancel(self, key: Hashable) -> bool:
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        del self._levels[where[0]][where[1]][key]
+        return True
+
+    def _place(self, key: Hashable, deadline: int) -> None:
+        due = max(deadline, self._next)
+        delta = due - self._next
+        if delta >= self._range:
+            due = self._next + self._range - 1
+            delta = self._range - 1
+        level = 0
+        while delta >= 1 << (self._bits * (level + 1)):
+            level += 1
+        slot = (due >> (self._bits * level)) & self._mask
+        self._levels[level][slot][key] = deadline
+        self._where[key] = (level, slot)
+
+    def _cascade(self, level: int) -> int:
+        # Move the due slot of `level` down; returns its index.
+        index = (self._next >> (self._bits * level)) & self._mask
+        bucket = self._levels[level][index]
+        if bucket:
+            self._levels[level][index] = {}
+            for key, deadline in bucket.items():
+                del self._where[key]
+                self._place(key, deadline)
+        return index
+
+    def advance(self, tick: int) -> List[Tuple[Hashable, int]]:
+        """Process every tick up to and including tick."""
+        fired: List[Tuple[Hashable, int]] = []
+        while self._next <= tick:
+            if not self._where:
+                self._next = tick + 1
+                break
+            index = self._next & self._mask
+            level = 1
+            while index == 0 and level < len(self._levels):
+                index = self._cascade(level)
+                level += 1
+            bucket = self._levels[0][self._next & self._mask]
+            if bucket:
+                self._levels[0][self._next & self._mask] = {}
+                due = []
+                for key, deadline in bucket.items():
+                    del self._where[key]
+                    if deadline > self._next:
+                        # Parked out-of-range deadline on a single-level wheel.
+                        self._place(key, deadline)
+                    else:
+                        due.append((key, deadline))
+                fired.extend(sorted(due, key=lambda item: (item[1], item[0])))
+            self._next += 1
+        return fired